@@ -12,6 +12,9 @@ import datetime
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import math 
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -48,40 +51,17 @@ print('\nCompleted: Read land ice data!')
 ############################################################################
 ############################################################################
 ### Create plot
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = plt.subplot(121)  
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-
 plt.text(2002,-4850,r'\textbf{Antarctica}',color='deepskyblue',alpha=0.3,ha='left',
         fontsize=22,rotation=0,va='center',zorder=1)
         
 ax.tick_params('both',length=5.5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none') 
 ax.spines['left'].set_linewidth(2)
@@ -121,25 +101,8 @@ plt.text(2025,750,r'\textbf{LAND ICE}',fontsize=40,color='w',
 ax = plt.subplot(122)  
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-
-        
 ax.tick_params('both',length=5.5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none') 
 ax.spines['left'].set_linewidth(2)
@@ -11,8 +11,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import datetime
-import urllib.request
-import urllib as UL
+import read_Extent_JAXA as JX
+import calc_RecordStats as RS
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -22,23 +25,14 @@ currentdy = str(now.day-1)
 currentyr = str(now.year)
 currenttime = currentmn + '_' + currentdy + '_' + currentyr
 
-### Load url
-url = 'https://ads.nipr.ac.jp/vishop.ver1/data/graph/plot_extent_n_v2.csv'
-
-### Read file
-raw_data = urllib.request.urlopen(url)
-dataset = np.genfromtxt(raw_data, skip_header=0,delimiter=",",)
-
-### Set missing data to nan
-dataset[np.where(dataset==-9999)] = np.nan
+### Read JAXA extent store (missing days are filled at ingest)
+month,day,means,yearsq,extent = JX.readExtentJAXA()
 
 ### Variables
-month     = dataset[1:,0]        # 1-12, nan as month[0]
-day       = dataset[1:,1]        # 1-31, nan as day[0]
-mean1980  = dataset[1:,2]        # km^2, nan as mean1980[0]
-mean1990  = dataset[1:,3]        # km^2, nan as mean1990[0]
-mean2000  = dataset[1:,4]        # km^2, nan as mean2000[0]
-years     = dataset[1:,5:]
+mean1980  = means[0]             # km^2
+mean1990  = means[1]             # km^2
+mean2000  = means[2]             # km^2
+years     = extent.T             # km^2 [doy,year]
 
 doy       = np.arange(0,len(day),1)
 
@@ -46,14 +40,11 @@ doy       = np.arange(0,len(day),1)
 years = years/1e6
 
 ### Recent day of current year
-currentyear = years[:,-1] 
+currentyear = JX.fillLeapDay(years[:,-1],month,day) # leap year
 lastday = now.timetuple().tm_yday -1
 currentice = currentyear[lastday]
 currentanom = currentice - (mean1980[lastday]/1e6)
 
-# Leap year
-currentyear[59] = currentyear[58]
-
 ### Changes in the last day and week
 weekchange = currentice - currentyear[lastday-7]
 daychange = currentice - currentyear[lastday-1]
@@ -62,35 +53,12 @@ daychange = currentice - currentyear[lastday-1]
 ###############################################################################
 ###############################################################################
 ### Plot figure
-matplotlib.rc('savefig', facecolor='black')
-matplotlib.rc('axes', edgecolor='white')
-matplotlib.rc('xtick', color='white')
-matplotlib.rc('ytick', color='white')
-matplotlib.rc('axes', labelcolor='white')
-matplotlib.rc('axes', facecolor='black')
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']})
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = plt.subplot(111) 
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 0))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([])
-
 oldaverage = currentyear.copy()
 oldaverage[lastday:] = currentyear[lastday]
 
@@ -121,12 +89,8 @@ if (currentyear[lastday]*1e6) < np.nanmin(mean2000):
     print(True, '2000')
     
 ### Calculate record low SIE
-recordlow = np.empty((years.shape[0]))
-for i in range(years.shape[0]):
-    if years[i,-1] == np.nanmin(years[i,:]):
-        recordlow[i] = 1.
-    else: 
-        recordlow[i] = 0.
+record,previous,isrecord,margin,holder = RS.calcRecords(years.T,'min')
+recordlow = isrecord[-1].astype(float)
 
 ### Begin plot
 plt.plot(doy,years[:,:],color='w',linewidth=0.15,
@@ -194,7 +158,7 @@ plt.text(122,mean1980[lastday]/1e6-0.05,r'1980s',
              fontsize=10,rotation='horizontal',ha='left',
              color='darkmagenta')              
            
-adjust_spines(ax, ['left', 'bottom'])            
+DS.adjust_spines(ax, ['left', 'bottom'],outward=0)            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')
 ax.spines['bottom'].set_linewidth(2)
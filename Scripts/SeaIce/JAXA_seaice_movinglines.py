@@ -9,11 +9,13 @@ Date      : 4 August 2016
 ### Import modules
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import matplotlib
 import datetime
-import urllib.request
-import urllib as UL
+import read_Extent_JAXA as JX
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
+import plot_AnimationWriter as AW
 
 ### Directory and time
 directory = './Figures/'
@@ -24,23 +26,14 @@ currentdy = str(now.day-1)
 currentyr = str(now.year)
 currenttime = currentmn + '_' + currentdy + '_' + currentyr
 
-### Load url
-url = 'https://ads.nipr.ac.jp/vishop.ver1/data/graph/plot_extent_n_v2.csv'
-
-### Read file
-raw_data = UL.request.urlopen(url)
-dataset = np.genfromtxt(raw_data, skip_header=0,delimiter=",",)
-
-### Set missing data to nan
-dataset[np.where(dataset==-9999)] = np.nan
+### Read JAXA extent store (missing days are filled at ingest)
+month,day,means,yearsq,extent = JX.readExtentJAXA()
 
 ### Variables
-month     = dataset[1:,0]        # 1-12, nan as month[0]
-day       = dataset[1:,1]        # 1-31, nan as day[0]
-mean1980  = dataset[1:,2]        # km^2, nan as mean1980[0]
-mean1990  = dataset[1:,3]        # km^2, nan as mean1990[0]
-mean2000  = dataset[1:,4]        # km^2, nan as mean2000[0]
-years     = dataset[1:,5:]
+mean1980  = means[0]             # km^2
+mean1990  = means[1]             # km^2
+mean2000  = means[2]             # km^2
+years     = extent.T             # km^2 [doy,year]
 
 doy       = np.arange(0,len(day),1)
 
@@ -48,48 +41,22 @@ doy       = np.arange(0,len(day),1)
 years = years/1e6
 
 ### Recent day of current year
-currentyear = years[:,-1]
+currentyear = JX.fillLeapDay(years[:,-1],month,day) # leap year
 lastday = now.timetuple().tm_yday -1
 currentice = currentyear[lastday]
 currentanom = currentice - (mean1980[lastday]/1e6)
 
-### Leap year
-currentyear[59] = currentyear[58]
-
 ### Changes 
 weekchange = currentice - currentyear[lastday-7]
 daychange = currentice - currentyear[lastday-1]
 
 ### Make plot
-matplotlib.rc('savefig', facecolor='black')
-matplotlib.rc('axes', edgecolor='white')
-matplotlib.rc('xtick', color='white')
-matplotlib.rc('ytick', color='white')
-matplotlib.rc('axes', labelcolor='white')
-matplotlib.rc('axes', facecolor='black')
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']})
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = plt.subplot(111) 
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([])
-        
 plt.plot(doy,mean1980/1e6,linewidth=1,linestyle='--',
          color='darkmagenta',label=r'1980s Mean',zorder=1)
 plt.plot(doy,mean1990/1e6,linewidth=1,linestyle='--',
@@ -139,7 +106,7 @@ if lastday <= 365:
         % (format((daychange*1e6),",f")[:-7]),fontsize=10,
         rotation='horizontal',ha='right',color='w',alpha=0.6) 
            
-adjust_spines(ax, ['left', 'bottom'])            
+DS.adjust_spines(ax, ['left', 'bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')
 ax.spines['left'].set_linewidth(2)
@@ -175,10 +142,9 @@ def update(num,doy,currentyear,year2017,year2012,year2007,bar,bar2,bar4):
     bar4.axes.axis([0,360,3,16])
     return bar,
 
-ani = animation.FuncAnimation(fig,update,370,fargs=[doy,currentyear,year2017,year2012,year2007,bar,bar2,bar4],
-                              interval=.001,blit=True)
-
-ani.save(directory + 'moving_SIE_JAXA.gif',dpi=150)
+AW.saveAnimation(fig,update,370,directory + 'moving_SIE_JAXA.gif',
+                 [bar,bar2,bar3,bar4],fargs=[doy,currentyear,year2017,
+                 year2012,year2007,bar,bar2,bar4],dpi=150)
 
 print('\n')
 print('JAXA Sea Ice Loss Missing Days')
@@ -12,8 +12,11 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
 import datetime
-import urllib.request
-import urllib as UL
+import read_Extent_JAXA as JX
+import calc_RecordStats as RS
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -23,23 +26,14 @@ currentdy = str(now.day-1)
 currentyr = str(now.year)
 currenttime = currentmn + '_' + currentdy + '_' + currentyr
 
-### Load url
-url = 'https://ads.nipr.ac.jp/vishop.ver1/data/graph/plot_extent_n_v2.csv'
-
-### Read file
-raw_data = UL.request.urlopen(url)
-dataset = np.genfromtxt(raw_data, skip_header=0,delimiter=",",)
-
-### Set missing data to nan
-dataset[np.where(dataset==-9999)] = np.nan
+### Read JAXA extent store (missing days are filled at ingest)
+month,day,means,yearsq,extent = JX.readExtentJAXA()
 
 ### Variables
-month     = dataset[1:,0]        # 1-12, nan as month[0]
-day       = dataset[1:,1]        # 1-31, nan as day[0]
-mean1980  = dataset[1:,2]        # km^2, nan as mean1980[0]
-mean1990  = dataset[1:,3]        # km^2, nan as mean1990[0]
-mean2000  = dataset[1:,4]        # km^2, nan as mean2000[0]
-years     = dataset[1:,5:]
+mean1980  = means[0]             # km^2
+mean1990  = means[1]             # km^2
+mean2000  = means[2]             # km^2
+years     = extent.T             # km^2 [doy,year]
 
 doy       = np.arange(0,len(day),1)
 
@@ -47,15 +41,11 @@ doy       = np.arange(0,len(day),1)
 years = years/1e6
 
 ### Recent day of current year
-currentyear = years[:,-1]
+currentyear = JX.fillLeapDay(years[:,-1],month,day) # leap year
 lastday = now.timetuple().tm_yday -1
 currentice = currentyear[lastday]
 currentanom = currentice - (mean1980[lastday]/1e6)
 
-### Fill in random missing days (does not affect script!)
-currentyear[10] = currentyear[9]
-currentyear[59] = currentyear[58]
-
 ### Changes in last week/day
 weekchange = currentice - currentyear[lastday-7]
 daychange = currentice - currentyear[lastday-1]
@@ -64,35 +54,12 @@ daychange = currentice - currentyear[lastday-1]
 ###############################################################################
 ###############################################################################
 ### Plot figure
-matplotlib.rc('savefig', facecolor='black')
-matplotlib.rc('axes', edgecolor='white')
-matplotlib.rc('xtick', color='white')
-matplotlib.rc('ytick', color='white')
-matplotlib.rc('axes', labelcolor='white')
-matplotlib.rc('axes', facecolor='black')
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']})
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = plt.subplot(111) 
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([])
-
 oldaverage = currentyear.copy()
 oldaverage[lastday:] = currentyear[lastday]
 
@@ -113,13 +80,7 @@ average1980s[lastday:] = mean1980[lastday]
 average1980s = average1980s/1e6
 
 ### Find climatological mins
-minyr = np.empty((years.shape[1]))
-for i in range(years.shape[1]):
-    minyr[i] = np.nanmin(years[:,i])
-    
-minwhere = np.empty((years.shape[1]))
-for i in range(years.shape[1]):
-    minwhere[i] = np.where(years[:,i] == minyr[i])[0]
+minyr,minwhere = RS.calcAnnualExtremes(years.T,'min')
 
 plt.scatter(minwhere[:-1],minyr[:-1],c=minyr[:-1],s=50,
             cmap='plasma_r',zorder=10)
@@ -187,7 +148,7 @@ plt.text(212.9,3.15,r'\textbf{SOURCE:} https://ads.nipr.ac.jp/vishop/vishop-exte
 plt.text(212.9,3.05,r'\textbf{GRAPHIC:} Zachary Labe (@ZLabe)',
          fontsize=5,rotation='horizontal',ha='left',color='darkgrey')                
            
-adjust_spines(ax, ['left', 'bottom'])            
+DS.adjust_spines(ax, ['left', 'bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')
 ax.spines['bottom'].set_linewidth(2)
@@ -8,10 +8,14 @@ Date      : 5 September 2016
 
 ### Import modules
 import numpy as np
-import urllib.request
-import urllib as UL
+import read_RemoteData as RD
+import calc_Climatology_NSIDC as CL
+import calc_DailyIndex as DI
 import datetime
 import matplotlib.pyplot as plt
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -27,7 +31,7 @@ url = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/south/daily/data/' \
         'S_seaice_extent_daily_v3.0.csv'
 
 ### Read file
-raw_data = UL.request.urlopen(url)
+raw_data = RD.openURL(url)
 dataset = np.genfromtxt(raw_data, skip_header=2,delimiter=',',
                         usecols=[0,1,2,3,4])
                         
@@ -43,7 +47,10 @@ day = dataset[:,2]
 ice = dataset[:,3]
 missing = dataset[:,4]
 
-yr2018 = np.where(year == 2018)[0]
+### Index of each year and day of year (built once)
+sieyears,index = DI.dailyIndex(year,month=month,day=day,leap='ordinal')
+
+yr2018 = DI.yearRows(index,sieyears,2018)
 
 sie18 = ice[yr2018]
 
@@ -65,33 +72,19 @@ print('7-day change SIE = %s km^2 \n' % (iceval[-1]-iceval[-8]))
 ###########################################################################
 ###########################################################################
 ### Reads in 1981-2010 means
-### Load url
-url2 = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/south/daily/data/' \
-       'S_seaice_extent_climatology_1981-2010_v3.0.csv'
-
-### Read file
-raw_data2 = UL.request.urlopen(url2)
-dataset2 = np.genfromtxt(raw_data2, skip_header=2,delimiter=',',
-                        usecols=[0,1,2,3,4,5,6,7])
-                        
-### Create variables
-doy = dataset2[:,0]
-meanice = dataset2[:,1] * 1e6
-std = dataset2[:,2]
+### Climatology from the daily record (cached per baseline)
+doy,meanice,std,quartiles = CL.readClimatologyNSIDC('S',(1981,2010))
+meanice = meanice * 1e6
 
 ### Anomalies
 currentanom = iceval[-1]-meanice[currentdoy-2]
 
 ### Quartiles
-quartile10 = dataset2[:,3]
-quartile25 = dataset2[:,4]
-quartile50 = dataset2[:,5]
-quartile75 = dataset2[:,6]
-quartile90 = dataset2[:,7]
+quartile10,quartile25,quartile50,quartile75,quartile90 = quartiles
 
-yr2007 = np.where(year == 2007)[0]
-yr2012 = np.where(year == 2012)[0]
-yr2016 = np.where(year == 2016)[0]
+yr2007 = DI.yearRows(index,sieyears,2007)
+yr2012 = DI.yearRows(index,sieyears,2012)
+yr2016 = DI.yearRows(index,sieyears,2016)
 
 sie7 = ice[yr2007]
 sie12 = ice[yr2012]
@@ -104,14 +97,7 @@ print('Current anomaly = %s km^2 \n' % currentanom)
 ###########################################################################
 ###########################################################################
 ### Create plot
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = plt.subplot(111)
@@ -128,24 +114,8 @@ strmonth = xlabels[int(currentmn)-1]
 asof = strmonth + ' ' + currentdy + ', ' + currentyr
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-        
 ax.tick_params('both',length=5.5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none') 
 ax.spines['bottom'].set_linewidth(2)
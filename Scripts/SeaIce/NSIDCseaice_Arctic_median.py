@@ -9,10 +9,14 @@ Date      : 5 September 2016
 
 ### Import modules
 import numpy as np
-import urllib.request
-import urllib as UL
+import read_RemoteData as RD
+import calc_Climatology_NSIDC as CL
+import calc_DailyIndex as DI
 import datetime
 import matplotlib.pyplot as plt
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -28,7 +32,7 @@ url = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/north/daily/data/' \
     'N_seaice_extent_daily_v3.0.csv'
 
 ### Read file
-raw_data = UL.request.urlopen(url)
+raw_data = RD.openURL(url)
 dataset = np.genfromtxt(raw_data, skip_header=2,delimiter=',',
                         usecols=[0,1,2,3,4])
                         
@@ -44,8 +48,11 @@ day = dataset[:,2]
 ice = dataset[:,3]
 missing = dataset[:,4]
 
+### Index of each year and day of year (built once)
+sieyears,index = DI.dailyIndex(year,month=month,day=day,leap='ordinal')
+
 ### Find current year (2017)
-yr2018 = np.where(year == 2018)[0]
+yr2018 = DI.yearRows(index,sieyears,2018)
 sie18 = ice[yr2018]
 
 ### Ice Conversion
@@ -65,26 +72,12 @@ print('7-day change SIE = %s km^2 \n' % (iceval[-1]-iceval[-8]))
 ###########################################################################
 ###########################################################################
 ### Reads in 1981-2010 means
-### Load url
-url2 = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/north/daily/data/' \
-       'N_seaice_extent_climatology_1981-2010_v3.0.csv'
-
-### Read file
-raw_data2 = UL.request.urlopen(url2)
-dataset2 = np.genfromtxt(raw_data2, skip_header=2,delimiter=',',
-                        usecols=[0,1,2,3,4,5,6,7])
-                        
-### Create variables
-doy = dataset2[:,0]
-meanice = dataset2[:,1] * 1e6
-std = dataset2[:,2]
+### Climatology from the daily record (cached per baseline)
+doy,meanice,std,quartiles = CL.readClimatologyNSIDC('N',(1981,2010))
+meanice = meanice * 1e6
 
 ### Quartiles
-quartile10 = dataset2[:,3]
-quartile25 = dataset2[:,4]
-quartile50 = dataset2[:,5]
-quartile75 = dataset2[:,6]
-quartile90 = dataset2[:,7]
+quartile10,quartile25,quartile50,quartile75,quartile90 = quartiles
 
 ### Anomalies
 currentanom = iceval[-1]-meanice[currentdoy-2]
@@ -92,29 +85,9 @@ currentanom = iceval[-1]-meanice[currentdoy-2]
 ### Printing info
 print('Current anomaly = %s km^2 \n' % currentanom)   
 
-### Finding select years since 2012
-yr2012 = np.where(year == 2012)[0]
-yr2013 = np.where(year == 2013)[0]
-yr2014 = np.where(year == 2014)[0]
-yr2015 = np.where(year == 2015)[0]
-yr2016 = np.where(year == 2016)[0]
-
-### Calculate anomaly from their median
-sie12 = ice[yr2012] - quartile50
-sie13 = ice[yr2013] - quartile50[:-1]
-sie14 = ice[yr2014] - quartile50[:-1]
-sie15 = ice[yr2015] - quartile50[:-1]
-sie16 = ice[yr2016] - quartile50
-sie17 = ice[yr2017] - quartile50[:-1]
-sie18 = sie18 - quartile50[:len(sie18)]
-
-### Append years to extented list
-extend5 = np.append(sie12,sie13,axis=0)
-extend4 = np.append(extend5,sie14,axis=0)
-extend3 = np.append(extend4,sie15,axis=0)
-extend2 = np.append(extend3,sie16,axis=0)
-extend1 = np.append(extend2,sie17,axis=0)
-extend = np.append(extend1,sie18,axis=0)
+### Calculate anomaly from the median for every day since 2012
+anom = DI.dailyArray(ice,index) - quartile50
+extend = anom[(sieyears >= 2012)[:,np.newaxis] & (index >= 0)]
 
 ### Find median to plot
 median = np.tile(quartile50,6)
@@ -123,14 +96,7 @@ median = np.tile(quartile50,6)
 ###########################################################################
 ###########################################################################
 ### Create plot
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = plt.subplot(111)
@@ -143,24 +109,8 @@ plt.ylim([-5,5])
 plt.xlim([0,2555])
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-        
 ax.tick_params('both',length=7.5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')  
 ax.spines['bottom'].set_linewidth(2)
@@ -13,8 +13,11 @@ import matplotlib.pyplot as plt
 import matplotlib.colors as c
 import matplotlib
 import datetime
-import urllib.request
-import urllib as UL
+import read_Extent_JAXA as JX
+import calc_RecordStats as RS
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -25,23 +28,14 @@ currentdy = str(now.day)
 currentyr = str(now.year)
 currenttime = currentmn + '_' + currentdy + '_' + currentyr
 
-### Load url
-url = 'https://ads.nipr.ac.jp/vishop.ver1/data/graph/plot_extent_n_v2.csv'
-
-### Read file
-raw_data = UL.request.urlopen(url)
-dataset = np.genfromtxt(raw_data, skip_header=0,delimiter=",",)
-
-### Set missing data to nan
-dataset[np.where(dataset==-9999)] = np.nan
+### Read JAXA extent store (missing days are filled at ingest)
+month,day,means,yearsq,extent = JX.readExtentJAXA()
 
 ### Variables
-month     = dataset[1:,0]        # 1-12, nan as month[0]
-day       = dataset[1:,1]        # 1-31, nan as day[0]
-mean1980  = dataset[1:,2]        # km^2, nan as mean1980[0]
-mean1990  = dataset[1:,3]        # km^2, nan as mean1990[0]
-mean2000  = dataset[1:,4]        # km^2, nan as mean2000[0]
-years     = dataset[1:,5:]
+mean1980  = means[0]             # km^2
+mean1990  = means[1]             # km^2
+mean2000  = means[2]             # km^2
+years     = extent.T             # km^2 [doy,year]
 
 doy       = np.arange(0,len(day),1)
 
@@ -54,19 +48,13 @@ lastday = now.timetuple().tm_yday -1
 currentice = currentyear[lastday]
 currentanom = currentice - (mean1980[lastday]/1e6)
 
-currentyear[10] = currentyear[9]
-
 ### Changes 
 weekchange = currentice - currentyear[lastday-7]
 daychange = currentice - currentyear[lastday-1]
 
 ### Calculate record low SIE
-recordlow = np.empty((years.shape[0]))
-for i in range(years.shape[0]):
-    if years[i,-1] == np.nanmin(years[i,:]):
-        recordlow[i] = 1.
-    else: 
-        recordlow[i] = 0.
+record,previous,isrecord,margin,holder = RS.calcRecords(years.T,'min')
+recordlow = isrecord[-1].astype(float)
 
 numberlow = np.count_nonzero(recordlow == 1.)
 percentlow = float(numberlow)/(lastday) * 100.
@@ -81,38 +69,15 @@ means = np.nanmean(years[:lastday,:],axis=0)
 values = np.arange(len(recordlow))
 
 ### Call parameters
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='darkgrey')
-plt.rc('xtick',color='darkgrey')
-plt.rc('ytick',color='darkgrey')
-plt.rc('axes',labelcolor='darkgrey')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle('darkgrey')
 plt.rcParams['xtick.direction'] = 'out'
 
 fig = plt.figure()
 ax = plt.subplot(111)
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 0))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([])
-        
 ax.tick_params('both',length=5.5,width=2,which='major',color='darkgrey')             
-adjust_spines(ax, ['left', 'bottom'])            
+DS.adjust_spines(ax, ['left', 'bottom'],outward=0)            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')
 ax.spines['top'].set_color('none')
@@ -11,10 +11,13 @@ Date      : 23 March 2018
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.colors as c
-import urllib.request
-import urllib as UL
+import read_Extent_JAXA as JX
+import calc_RecordStats as RS
 import datetime
 import cmocean
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -25,23 +28,14 @@ currentdy = str(now.day)
 currentyr = str(now.year)
 currenttime = currentmn + '_' + currentdy + '_' + currentyr
 
-### Load url
-url = 'https://ads.nipr.ac.jp/vishop.ver1/data/graph/plot_extent_n_v2.csv'
-
-### Read file
-raw_data = UL.request.urlopen(url)
-dataset = np.genfromtxt(raw_data, skip_header=0,delimiter=",",)
-
-### Set missing data to nan
-dataset[np.where(dataset==-9999)] = np.nan
+### Read JAXA extent store (missing days are filled at ingest)
+month,day,means,yearsq,extent = JX.readExtentJAXA()
 
 ### Variables
-month     = dataset[1:,0]        # 1-12, nan as month[0]
-day       = dataset[1:,1]        # 1-31, nan as day[0]
-mean1980  = dataset[1:,2]        # km^2, nan as mean1980[0]
-mean1990  = dataset[1:,3]        # km^2, nan as mean1990[0]
-mean2000  = dataset[1:,4]        # km^2, nan as mean2000[0]
-years     = dataset[1:,5:]
+mean1980  = means[0]             # km^2
+mean1990  = means[1]             # km^2
+mean2000  = means[2]             # km^2
+years     = extent.T             # km^2 [doy,year]
 
 doy       = np.arange(0,len(day),1)
 
@@ -59,14 +53,10 @@ yearq = np.arange(2002,2018+1,1)
 yearqq = np.arange(2007,2018+1,1)
 
 ### Calculate record low SIE
+record,previous,isrecord,margin,holder = RS.calcRecords(years.T,'min')
 recordlow = np.empty((12,years.shape[0]))
 recordlow.fill(np.nan)
-for j in range(12):
-    for i in range(365):
-        if years[i,5+j] == np.nanmin(years[i,:6+j]):
-            recordlow[j,i] = 1.
-        else: 
-            recordlow[j,i] = 0.
+recordlow[:,:365] = isrecord[5:5+12,:365]
             
 recordlowq = np.cumsum(recordlow,axis=1)
 
@@ -74,32 +64,9 @@ recordlowq = np.cumsum(recordlow,axis=1)
 ###########################################################################
 ###########################################################################
 ### Create plot
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='darkgrey')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='darkgrey')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle(edgecolor='darkgrey',labelcolor='darkgrey')
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-        
 xlabels = [r'Jan',r'Feb',r'Mar',r'Apr',r'May',r'Jun',r'Jul',
           r'Aug',r'Sep',r'Oct',r'Nov',r'Dec',r'Jan']
 
@@ -107,7 +74,7 @@ fig = plt.figure()
 ax = plt.subplot(111)
 
 ax.tick_params('both',length=5.5,width=2,which='major',color='darkgrey')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none') 
 ax.spines['bottom'].set_linewidth(2)
@@ -0,0 +1,332 @@
+"""
+Functions calculate daily sea ice extent climatologies (mean, standard
+deviation and percentile bands) for any baseline from the NSIDC Sea Ice
+Index daily record. The daily csv is arranged once as a [year,doy] array
+and every statistic is computed in one vectorized pass over the baseline
+years. Results are cached per hemisphere and baseline in ./Data/cache/, so
+switching from 1981-2010 to 1991-2020 does not need a new NSIDC csv.
+
+Notes
+-----
+    Source : ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+Usage
+-----
+    [1] readDailyNSIDC(hemisphere,maxgap)
+    [2] calcDailyClimatology(data,years,baseline,percentiles)
+    [3] readClimatologyNSIDC(hemisphere,baseline,cachedir)
+    [4] calcExceedance(year,month,day,ice,threshold,below)
+"""
+
+### NSIDC daily data and default cache
+URL = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/'
+CACHEDIR = './Data/cache/'
+PERCENTILES = [10,25,50,75,90]
+
+### Longest run of missing days filled by linear interpolation (the record
+### is every other day before August 1987)
+MAXGAP = 3
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _urlNSIDC(hemisphere):
+    """
+    Returns url of the daily extent csv, hemisphere is N or S
+    """
+
+    if hemisphere == 'N':
+        return URL + 'north/daily/data/N_seaice_extent_daily_v3.0.csv'
+    elif hemisphere == 'S':
+        return URL + 'south/daily/data/S_seaice_extent_daily_v3.0.csv'
+    else:
+        raise ValueError('Wrong hemisphere - (N or S)!')
+
+def _dates(year,month,day):
+    """
+    Returns datetime64[D] dates from year, month and day arrays
+    """
+
+    ### Import modules
+    import numpy as np
+
+    year,month,day = [np.asarray(x).astype(int) for x in (year,month,day)]
+    dates = (year - 1970).astype('datetime64[Y]') + \
+            (month - 1).astype('timedelta64[M]')
+    return dates.astype('datetime64[D]') + (day - 1).astype('timedelta64[D]')
+
+def _fillGaps(series,maxgap):
+    """
+    Linearly interpolates interior runs of up to maxgap missing values
+    """
+
+    ### Import modules
+    import numpy as np
+
+    valid = np.isfinite(series)
+    if valid.sum() < 2:
+        return series
+    index = np.arange(series.size)
+    filled = np.interp(index,index[valid],series[valid])
+
+    ### Length of the gap around each missing value
+    before = np.maximum.accumulate(np.where(valid,index,-1))
+    after = np.minimum.accumulate(np.where(valid,index,
+                                           series.size)[::-1])[::-1]
+    fill = ~valid & (before >= 0) & (after < series.size) & \
+           (after - before - 1 <= maxgap)
+
+    return np.where(valid | fill,filled,np.nan)
+
+def readDailyNSIDC(hemisphere='N',maxgap=MAXGAP):
+    """
+    Function reads the NSIDC Sea Ice Index daily extent into [year,doy]
+
+    Parameters
+    ----------
+    hemisphere : string
+        N or S
+    maxgap : integer
+        longest run of missing days filled by linear interpolation
+
+    Returns
+    -------
+    years : 1d array
+        years of the record
+    extent : 2d array [year,doy]
+        sea ice extent (10^6 km^2), float32, doy 366 only for leap years
+
+    Usage
+    -----
+    years,extent = readDailyNSIDC(hemisphere,maxgap)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calc_DailyIndex as DI
+    import read_RemoteData as RD
+
+    filename = RD.fetchFile(_urlNSIDC(hemisphere))
+    dataset = np.genfromtxt(filename,skip_header=2,delimiter=',',
+                            usecols=[0,1,2,3])
+    dataset[np.where(dataset == -9999)] = np.nan
+    dataset = dataset[np.isfinite(dataset[:,:3]).all(axis=1)]
+
+    ### Dates of each row
+    dates = _dates(*dataset[:,:3].T)
+
+    ### Continuous daily series with short gaps filled
+    first = dates.min()
+    series = np.full((dates.max() - first).astype(int) + 1,np.nan)
+    series[(dates - first).astype(int)] = dataset[:,3]
+    series = _fillGaps(series,maxgap)
+
+    ### Arrange as [year,doy]
+    alldates = first + np.arange(series.size)
+    yearstart = alldates.astype('datetime64[Y]')
+    allyears = yearstart.astype(int) + 1970
+    doy = (alldates - yearstart.astype('datetime64[D]')).astype(int)
+    years,index = DI.dailyIndex(allyears,doy=doy+1,leap='ordinal')
+    extent = DI.dailyArray(series,index)
+
+    return years,extent
+
+def calcDailyClimatology(data,years,baseline=(1981,2010),
+                         percentiles=PERCENTILES):
+    """
+    Function calculates the daily climatology of a [year,doy] array
+
+    Parameters
+    ----------
+    data : 2d array [year,doy]
+        daily time series
+    years : 1d array
+        years of data
+    baseline : tuple
+        first and last year of the baseline (inclusive)
+    percentiles : list
+        percentiles to calculate
+
+    Returns
+    -------
+    mean : 1d array [doy]
+        mean over the baseline years
+    std : 1d array [doy]
+        standard deviation over the baseline years (ddof=1)
+    pcts : 2d array [percentile,doy]
+        percentiles over the baseline years
+
+    Usage
+    -----
+    mean,std,pcts = calcDailyClimatology(data,years,baseline,percentiles)
+    """
+
+    ### Import modules
+    import numpy as np
+    import warnings
+
+    years = np.asarray(years)
+    yearq = np.where((years >= baseline[0]) & (years <= baseline[1]))[0]
+    if yearq.size == 0:
+        raise ValueError('No years of data in baseline %s-%s!' \
+                         % tuple(baseline))
+    base = np.asarray(data,dtype='float64')[yearq]
+
+    ### Days without data in the baseline stay nan
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore',category=RuntimeWarning)
+        mean = np.nanmean(base,axis=0)
+        std = np.nanstd(base,axis=0,ddof=1)
+        pcts = np.nanpercentile(base,percentiles,axis=0)
+
+    return mean,std,pcts
+
+def readClimatologyNSIDC(hemisphere='N',baseline=(1981,2010),
+                         cachedir=CACHEDIR):
+    """
+    Function reads the daily NSIDC extent climatology for a baseline,
+    computing it from the daily record when the cache is out of date
+
+    Parameters
+    ----------
+    hemisphere : string
+        N or S
+    baseline : tuple
+        first and last year of the baseline (inclusive)
+    cachedir : string
+        directory of cached climatologies
+
+    Returns
+    -------
+    doy : 1d array
+        day of year (1-366)
+    mean : 1d array [doy]
+        mean extent (10^6 km^2)
+    std : 1d array [doy]
+        standard deviation (10^6 km^2)
+    pcts : 2d array [percentile,doy]
+        10th, 25th, 50th, 75th and 90th percentiles (10^6 km^2)
+
+    Usage
+    -----
+    doy,mean,std,pcts = readClimatologyNSIDC(hemisphere,baseline,cachedir)
+    """
+
+    print('\n>>> Using readClimatologyNSIDC function!')
+
+    ### Import modules
+    import numpy as np
+    import os
+    import read_RemoteData as RD
+
+    mtime = os.path.getmtime(RD.fetchFile(_urlNSIDC(hemisphere)))
+    cachefile = os.path.join(cachedir,'NSIDC_climatology_%s_%s-%s.npz' \
+                             % (hemisphere,baseline[0],baseline[1]))
+
+    ### Cached climatology of the same daily file
+    if os.path.exists(cachefile):
+        with np.load(cachefile) as cache:
+            if float(cache['mtime']) == mtime:
+                print('*Completed: Read %s-%s climatology from cache!' \
+                      % tuple(baseline))
+                return cache['doy'],cache['mean'],cache['std'],cache['pcts']
+
+    years,extent = readDailyNSIDC(hemisphere)
+    mean,std,pcts = calcDailyClimatology(extent,years,baseline)
+    doy = np.arange(1,extent.shape[1]+1)
+
+    ### Save cache
+    os.makedirs(cachedir,exist_ok=True)
+    tempfile = cachefile + '.%s.tmp.npz' % os.getpid()
+    np.savez(tempfile,doy=doy,mean=mean,std=std,pcts=pcts,
+             mtime=np.array(mtime))
+    os.replace(tempfile,cachefile)
+
+    print('*Completed: Calculated %s-%s climatology (%s)!' \
+          % (baseline[0],baseline[1],hemisphere))
+    return doy,mean,std,pcts
+
+def calcExceedance(year,month,day,ice,threshold,below=True):
+    """
+    Function counts the days of each year beyond a daily threshold (e.g.,
+    mean - 2 std. dev. or the 10th percentile) from the full daily record
+
+    Parameters
+    ----------
+    year,month,day : 1d arrays
+        date of each record (columns of the daily csv)
+    ice : 1d array
+        sea ice extent of each record (nan for missing)
+    threshold : 1d array [doy]
+        daily threshold (366 days, leap days use doy 366 after 28 February)
+    below : boolean
+        count days below (True) or above (False) the threshold
+
+    Returns
+    -------
+    years : 1d array
+        years of the record (the current year may be partial)
+    counts : 1d array [year]
+        number of records beyond the threshold
+    ndays : 1d array [year]
+        number of records with data
+    maxrun : 1d array [year]
+        longest run of consecutive records beyond the threshold
+    first : 1d array [year]
+        first date beyond the threshold (NaT for none)
+    last : 1d array [year]
+        last date beyond the threshold (NaT for none)
+
+    Usage
+    -----
+    years,counts,ndays,maxrun,first,last = calcExceedance(year,month,day,ice,
+                                                          threshold,below)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    ice = np.asarray(ice,dtype='float64')
+    threshold = np.asarray(threshold,dtype='float64')
+    valid = np.isfinite(ice) & np.isfinite(year) & np.isfinite(month) & \
+            np.isfinite(day)
+    dates = _dates(np.asarray(year)[valid],np.asarray(month)[valid],
+                   np.asarray(day)[valid])
+    ice = ice[valid]
+
+    ### Sort by date and group by year once
+    order = np.argsort(dates,kind='stable')
+    dates,ice = dates[order],ice[order]
+    yearstart = dates.astype('datetime64[Y]')
+    doy = (dates - yearstart.astype('datetime64[D]')).astype(int)
+    years,start = np.unique(yearstart.astype(int) + 1970,return_index=True)
+
+    ### Days beyond the threshold
+    with np.errstate(invalid='ignore'):
+        if below:
+            exceed = ice < threshold[doy]
+        else:
+            exceed = ice > threshold[doy]
+
+    counts = np.add.reduceat(exceed.astype(int),start)
+    ndays = np.diff(np.append(start,ice.size))
+
+    ### Runs restart at every day inside the threshold and every new year
+    index = np.arange(ice.size)
+    breaks = np.where(exceed,-1,index)
+    breaks[start] = np.where(exceed[start],start - 1,start)
+    runs = index - np.maximum.accumulate(breaks)
+    maxrun = np.maximum.reduceat(runs,start)
+
+    ### First and last dates beyond the threshold
+    firstq = np.minimum.reduceat(np.where(exceed,index,ice.size),start)
+    lastq = np.maximum.reduceat(np.where(exceed,index,-1),start)
+    first = np.full(years.size,np.datetime64('NaT'),dtype='datetime64[D]')
+    last = first.copy()
+    first[counts > 0] = dates[firstq[counts > 0]]
+    last[counts > 0] = dates[lastq[counts > 0]]
+
+    return years,counts,ndays,maxrun,first,last
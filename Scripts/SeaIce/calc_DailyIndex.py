@@ -0,0 +1,174 @@
+"""
+Functions arrange daily records (one row per day, e.g. NSIDC Sea Ice Index
+or PIOMAS daily volume) into dense [year,doy] arrays. The (year,doy) -> row
+index is built once from the date columns with an explicit leap-day policy,
+so years are selected by row instead of repeated np.where(year == ...)
+scans and 366-day years never shift the following years. Missing days are
+padded with nan.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    Leap-day policies (columns of the [year,doy] array)
+        'ordinal'  : 366 columns, column = day of year - 1 (31 December of a
+                     non-leap year is column 364, column 365 is nan)
+        'calendar' : 366 columns, 29 February is always column 59 (nan in
+                     non-leap years), so every column is the same date
+        'drop'     : 365 columns, 29 February is removed
+        'noleap'   : 365 columns, records already on a 365-day calendar
+                     (e.g. PIOMAS daily volume, day 1-365 every year)
+
+Usage
+-----
+    [1] dailyIndex(year,doy,month,day,leap)
+    [2] dailyArray(values,index,dtype)
+    [3] yearRows(index,years,year)
+"""
+
+### Leap-day policies : number of columns
+LEAPPOLICIES = {'ordinal' : 366,
+                'calendar' : 366,
+                'drop' : 365,
+                'noleap' : 365}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def dailyIndex(year,doy=None,month=None,day=None,leap='ordinal'):
+    """
+    Function builds the [year,doy] -> row index of a daily record
+
+    Parameters
+    ----------
+    year : 1d array
+        year of each row
+    doy : 1d array
+        day of year of each row (1-366), or None to use month and day
+    month : 1d array
+        month of each row (1-12), used if doy is None
+    day : 1d array
+        day of month of each row (1-31), used if doy is None
+    leap : string
+        leap-day policy - ordinal, calendar, drop or noleap
+
+    Returns
+    -------
+    years : 1d array
+        all years from the first to the last row (no gaps)
+    index : 2d array [year,doy]
+        row of each day, -1 for days without a row
+
+    Usage
+    -----
+    years,index = dailyIndex(year,doy,month,day,leap)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if leap not in LEAPPOLICIES:
+        raise ValueError('Wrong leap-day policy - (%s)!' \
+                         % ', '.join(LEAPPOLICIES))
+
+    year = np.asarray(year)
+    rows = np.where(np.isfinite(year))[0]
+    year = year[rows].astype(int)
+
+    ### Day of year (0-based) of each row
+    if doy is None:
+        month = np.asarray(month)[rows].astype(int)
+        day = np.asarray(day)[rows].astype(int)
+        dates = (year - 1970).astype('datetime64[Y]') + \
+                (month - 1).astype('timedelta64[M]')
+        dates = dates.astype('datetime64[D]') + \
+                (day - 1).astype('timedelta64[D]')
+        column = (dates - dates.astype('datetime64[Y]')).astype(int)
+    else:
+        column = np.asarray(doy)[rows].astype(int) - 1
+
+    ### Leap-day policy
+    isleap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    keep = (column >= 0) & (column < 366)
+    if leap == 'calendar':
+        column = np.where(~isleap & (column >= 59),column + 1,column)
+    elif leap == 'drop':
+        keep &= ~(isleap & (column == 59))
+        column = np.where(isleap & (column > 59),column - 1,column)
+    elif leap == 'noleap':
+        keep &= column < 365
+    keep &= column < LEAPPOLICIES[leap]
+
+    ### Dense index, later duplicate rows win
+    years = np.arange(year.min(),year.max()+1)
+    index = np.full((years.size,LEAPPOLICIES[leap]),-1,dtype='int64')
+    index[year[keep] - years[0],column[keep]] = rows[keep]
+
+    return years,index
+
+def dailyArray(values,index,dtype='float32'):
+    """
+    Function arranges a daily record into [year,doy] using dailyIndex
+
+    Parameters
+    ----------
+    values : 1d array
+        value of each row
+    index : 2d array [year,doy]
+        output of dailyIndex
+    dtype : string
+        data type of the array
+
+    Returns
+    -------
+    data : 2d array [year,doy]
+        values with nan for missing days, a view of values when the record
+        is complete and already in [year,doy] order
+
+    Usage
+    -----
+    data = dailyArray(values,index,dtype)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    values = np.asarray(values)
+
+    ### Complete record in order, reshape without copying
+    if values.dtype == np.dtype(dtype) and values.size >= index.size and \
+            np.array_equal(index.ravel(),np.arange(index.size)):
+        return values[:index.size].reshape(index.shape)
+
+    data = values.astype(dtype)[np.maximum(index,0)]
+    data[index < 0] = np.nan
+
+    return data
+
+def yearRows(index,years,year):
+    """
+    Function returns the rows of one year in date order
+
+    Parameters
+    ----------
+    index : 2d array [year,doy]
+        output of dailyIndex
+    years : 1d array
+        output of dailyIndex
+    year : integer
+        year to select
+
+    Returns
+    -------
+    rows : 1d array
+        rows of the daily record for that year (missing days skipped)
+
+    Usage
+    -----
+    rows = yearRows(index,years,year)
+    """
+
+    row = index[int(year) - int(years[0])]
+    return row[row >= 0]
@@ -0,0 +1,212 @@
+"""
+Functions calculate record statistics of daily time series arranged as
+[year,doy] arrays (e.g., JAXA/NSIDC extent or PIOMAS daily volume). Running
+record lows/highs, the previous record, the margin versus the previous
+record, the year holding each record, annual extremes and per-day ranks are
+computed for the whole array at once. When a new day arrives, only that day
+is updated.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    Missing data (nan) never sets or breaks a record. A value equal to the
+    previous record counts as a (tied) record.
+
+Usage
+-----
+    [1] calcAnnualExtremes(data,kind)
+    [2] calcRecords(data,kind)
+    [3] updateRecords(data,records,doy,kind)
+    [4] calcRanks(data,kind)
+"""
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _checkKind(kind):
+    """
+    Returns the nan-ignoring ufunc for record lows (min) or highs (max)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if kind == 'min':
+        return np.fmin
+    elif kind == 'max':
+        return np.fmax
+    else:
+        raise ValueError('Wrong kind of record - (min or max)!')
+
+def calcAnnualExtremes(data,kind='min'):
+    """
+    Function calculates the extreme value of each year and its day
+
+    Parameters
+    ----------
+    data : 2d array [year,doy]
+        daily time series
+    kind : string
+        min or max
+
+    Returns
+    -------
+    extreme : 1d array [year]
+        annual minimum or maximum (nan for years without data)
+    where : 1d array [year]
+        doy index of the first occurrence of the extreme (-1 without data)
+
+    Usage
+    -----
+    extreme,where = calcAnnualExtremes(data,kind)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    _checkKind(kind)
+    data = np.asarray(data)
+    valid = np.isfinite(data).any(axis=1)
+    fill = np.inf if kind == 'min' else -np.inf
+    filled = np.where(np.isfinite(data),data,fill)
+
+    if kind == 'min':
+        where = np.argmin(filled,axis=1)
+    else:
+        where = np.argmax(filled,axis=1)
+    extreme = np.take_along_axis(data,where[:,np.newaxis],axis=1)[:,0]
+
+    extreme = np.where(valid,extreme,np.nan)
+    where = np.where(valid,where,-1)
+
+    return extreme,where
+
+def calcRecords(data,kind='min'):
+    """
+    Function calculates running daily records over the years
+
+    Parameters
+    ----------
+    data : 2d array [year,doy]
+        daily time series
+    kind : string
+        min (record lows) or max (record highs)
+
+    Returns
+    -------
+    record : 2d array [year,doy]
+        record through each year (including that year)
+    previous : 2d array [year,doy]
+        record of all earlier years (nan for the first year with data)
+    isrecord : 2d boolean array [year,doy]
+        True where a year sets or ties the record
+    margin : 2d array [year,doy]
+        data minus the previous record (negative for new lows)
+    holder : 2d array [year,doy]
+        year index holding the record through each year (-1 without data)
+
+    Usage
+    -----
+    record,previous,isrecord,margin,holder = calcRecords(data,kind)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    func = _checkKind(kind)
+    data = np.asarray(data)
+
+    ### Running record ignoring missing data
+    record = func.accumulate(data,axis=0)
+    previous = np.empty_like(record)
+    previous[0] = np.nan
+    previous[1:] = record[:-1]
+
+    ### New (or tied) records and margins
+    finite = np.isfinite(data)
+    with np.errstate(invalid='ignore'):
+        isrecord = finite & (data == record)
+        margin = data - previous
+
+    ### Year holding the record (last year to set or tie it)
+    index = np.where(isrecord,np.arange(data.shape[0])[:,np.newaxis],-1)
+    holder = np.maximum.accumulate(index,axis=0)
+
+    return record,previous,isrecord,margin,holder
+
+def updateRecords(data,records,doy,kind='min'):
+    """
+    Function updates running records in place after new days arrive
+
+    Parameters
+    ----------
+    data : 2d array [year,doy]
+        daily time series including the new day(s)
+    records : tuple
+        output of calcRecords for the same array shape
+    doy : integer or list of integers
+        doy index of the new or changed day(s)
+    kind : string
+        min (record lows) or max (record highs)
+
+    Returns
+    -------
+    records : tuple
+        record,previous,isrecord,margin,holder (updated in place)
+
+    Usage
+    -----
+    records = updateRecords(data,records,doy,kind)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    days = np.atleast_1d(doy)
+    new = calcRecords(np.asarray(data)[:,days],kind)
+    for array,values in zip(records,new):
+        array[:,days] = values
+
+    return records
+
+def calcRanks(data,kind='min'):
+    """
+    Function ranks each year for every day of the year
+
+    Parameters
+    ----------
+    data : 2d array [year,doy]
+        daily time series
+    kind : string
+        min (1 = lowest) or max (1 = highest)
+
+    Returns
+    -------
+    ranks : 2d array [year,doy]
+        rank among all years with data (ties share the best rank, nan
+        for missing data)
+
+    Usage
+    -----
+    ranks = calcRanks(data,kind)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    _checkKind(kind)
+    data = np.asarray(data)
+
+    ### Count years beating each year on the same day
+    with np.errstate(invalid='ignore'):
+        if kind == 'min':
+            better = data[np.newaxis,:,:] < data[:,np.newaxis,:]
+        else:
+            better = data[np.newaxis,:,:] > data[:,np.newaxis,:]
+    ranks = better.sum(axis=1).astype('float32') + 1.
+    ranks[~np.isfinite(data)] = np.nan
+
+    return ranks
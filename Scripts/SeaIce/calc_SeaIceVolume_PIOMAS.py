@@ -0,0 +1,65 @@
+"""
+Script calculates area-weighted mean sea ice thickness and total sea ice
+volume from PIOMAS [year,month,lat,lon] arrays on the original GOCC grid.
+ 
+Notes
+-----
+    Source : http://psc.apl.washington.edu/zhang/IDAO/data_piomas.html
+    Author : Zachary Labe
+    Date   : 17 October 2026
+    
+Usage
+-----
+    sitave,siv = weightThick(var,area,dtype)
+"""
+
+def weightThick(var,area,dtype='float64'):
+    """
+    Function area weights sit array [...,lat,lon] (for example 4d 
+    [year,month,lat,lon]) into [...] using the original PIOMAS GOCC grid. 
+    Mean thickness and volume are calculated in the same pass.
+
+    Parameters
+    ----------
+    var : nd array or PiomasArray [...,lat,lon]
+        sea ice thickness (m)
+    area : 2d array [lat,lon]
+        area of grid cell (calc_PiomasArea.py)
+    dtype : string
+        accumulation precision (float64 or float32)
+
+    Returns
+    -------
+    sitave : (n-2)d array
+        area-weighted mean sea ice thickness (m)
+    siv : (n-2)d array
+        sea ice volume, sum of thickness*area (units of thickness*area)
+
+    Usage
+    -----
+    sitave,siv = weightThick(var,area,dtype)
+    """
+    
+    print('\n>>> Using weightThick function!')
+    
+    ### Import modules
+    import numpy as np
+    
+    ### Area weights once for the whole cube, zero where area is missing
+    area = np.asarray(area)
+    weights = np.where(np.isfinite(area),area,0.).astype(dtype).ravel()
+    
+    ### Flatten to [time,space] and sum with matrix-vector products
+    var = np.asarray(var,dtype=dtype)
+    varflat = np.reshape(var,(-1,weights.size))
+    finite = np.isfinite(varflat)
+    siv = np.dot(np.where(finite,varflat,0.).astype(dtype),weights)
+    areasum = np.dot(finite.astype(dtype),weights)
+    
+    with np.errstate(invalid='ignore',divide='ignore'):
+        sitave = siv/areasum
+    sitave = np.reshape(sitave,var.shape[:-2])
+    siv = np.reshape(siv,var.shape[:-2])
+     
+    print('Completed: Weighted SIT average and SIV!') 
+    return sitave,siv
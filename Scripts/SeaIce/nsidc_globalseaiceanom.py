@@ -9,10 +9,12 @@ Date      : 5 September 2016
 
 ### Import modules
 import numpy as np
-import urllib.request
-import urllib as UL
+import read_RemoteData as RD
 import datetime
 import matplotlib.pyplot as plt
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -28,7 +30,7 @@ url = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/north/daily/data/' \
     'N_seaice_extent_daily_v3.0.csv'
 
 ### Read Arctic file
-raw_data = UL.request.urlopen(url)
+raw_data = RD.openURL(url)
 dataset = np.genfromtxt(raw_data, skip_header=2,delimiter=',',
                         usecols=[0,1,2,3,4])
                         
@@ -60,7 +62,7 @@ url2 = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/north/daily/data/' \
        'N_seaice_extent_climatology_1981-2010_v3.0.csv'
 
 ### Read file
-raw_data2 = UL.request.urlopen(url2)
+raw_data2 = RD.openURL(url2)
 dataset2 = np.genfromtxt(raw_data2, skip_header=2,delimiter=',',
                         usecols=[0,1,2])
                         
@@ -82,7 +84,7 @@ url = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/south/daily/data/' \
         'S_seaice_extent_daily_v3.0.csv'
 
 ### Read file
-raw_data = UL.request.urlopen(url)
+raw_data = RD.openURL(url)
 dataset = np.genfromtxt(raw_data, skip_header=2,delimiter=',',
                         usecols=[0,1,2,3,4])
                         
@@ -114,7 +116,7 @@ url2 = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/south/daily/data/' \
        'S_seaice_extent_climatology_1981-2010_v3.0.csv'
 
 ### Read file
-raw_data2 = UL.request.urlopen(url2)
+raw_data2 = RD.openURL(url2)
 dataset2 = np.genfromtxt(raw_data2, skip_header=2,delimiter=',',
                         usecols=[0,1,2])
                         
@@ -139,14 +141,7 @@ print('Completed script!')
 ###########################################################################
 ###########################################################################
 ### Create plot
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = plt.subplot(111)
@@ -163,24 +158,8 @@ strmonth = xlabels[int(currentmn)-1]
 asof = strmonth + ' ' + currentdy + ', ' + currentyr
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-        
 ax.tick_params('both',length=5.5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')  
 ax.spines['bottom'].set_linewidth(2)
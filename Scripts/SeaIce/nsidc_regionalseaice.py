@@ -11,7 +11,10 @@ Date      : 21 October 2017
 import numpy as np
 import datetime
 import matplotlib.pyplot as plt
-import pandas as pd
+import read_RegionalExtent_NSIDC as RE
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -23,79 +26,17 @@ currenttime = currentmn + '_' + currentdy + '_' + currentyr
 currentdoy = now.timetuple().tm_yday
 doy = np.arange(0,365,1)
 lastday = now.timetuple().tm_yday -2
-years = np.arange(1979,2018+1,1)
 
-### Turn on to read in the data (slow!)
+### Turn on to read in the data (cached after the first run)
 datareader=True
 
-### Load url
-url = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/seaice_analysis/' \
-        'N_Sea_Ice_Index_Regional_Daily_Data_G02135_v3.0.xlsx'
-
-### Read files from NSIDC (not very efficient - lol)
+### Read all regional seas from NSIDC in one pass
 ### There are more regional seas that can easily be added!
 if datareader == True:       
-    df_barents = pd.read_excel(url,sheetname='Barents-Extent-km^2',header=1,
-                               parse_cols=range(3,43,1))
-    barents = df_barents.as_matrix()
-    ##################
-    ##################
-    ##################
-    df_beaufort = pd.read_excel(url,sheetname='Beaufort-Extent-km^2',header=1,
-                                parse_cols=range(3,43,1))
-    beaufort = df_beaufort.as_matrix()
-    ##################
-    ##################
-    ##################
-    df_bering = pd.read_excel(url,sheetname='Bering-Extent-km^2',header=1,
-                                parse_cols=range(3,43,1))
-    bering = df_bering.as_matrix()
-    ##################
-    ##################
-    ##################
-    df_can = pd.read_excel(url,sheetname='CanadianArchipelago-Extent-km^2',header=1,
-                                parse_cols=range(3,43,1))
-    can = df_can.as_matrix()
-    ##################
-    ##################
-    ##################
-    df_chukchi = pd.read_excel(url,sheetname='Chukchi-Extent-km^2',header=1,
-                                parse_cols=range(3,43,1))
-    chukchi = df_chukchi.as_matrix()
-    ##################
-    ##################
-    ##################
-    df_ess = pd.read_excel(url,sheetname='East-Siberian-Extent-km^2',header=1,
-                                parse_cols=range(3,43,1))
-    ess = df_ess.as_matrix()
-    ##################
-    ##################
-    ##################
-    df_green = pd.read_excel(url,sheetname='Greenland-Extent-km^2',header=1,
-                                parse_cols=range(3,43,1))
-    green = df_green.as_matrix()
-    ##################
-    ##################
-    ##################
-    df_hudson = pd.read_excel(url,sheetname='Hudson-Extent-km^2',header=1,
-                                parse_cols=range(3,43,1))
-    hudson = df_hudson.as_matrix()
-    ##################
-    ##################
-    ##################
-    df_kara = pd.read_excel(url,sheetname='Kara-Extent-km^2',header=1,
-                                parse_cols=range(3,43,1))
-    kara = df_kara.as_matrix()
-    ##################
-    ##################
-    ##################
-    df_lap = pd.read_excel(url,sheetname='Laptev-Extent-km^2',header=1,
-                                parse_cols=range(3,43,1))
-    lap = df_lap.as_matrix()
+    years,extent = RE.readRegionalExtent(RE.REGIONS)
     
-    ### Read data in list then array
-    sie = [barents,beaufort,bering,can,chukchi,ess,green,hudson,kara,lap]
-    sie = np.asarray(sie)/1e6
+    ### Reshape into [region,doy,year]
+    sie = np.transpose(extent,(0,2,1))/1e6
                             
     print('\nCompleted: Read sea ice data!')                        
 
@@ -118,32 +59,9 @@ mine = mean - (2.*std)
 ###########################################################################
 ###########################################################################
 ### Create plot
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='darkgrey')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='darkgrey')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle(edgecolor='darkgrey',labelcolor='darkgrey')
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-
 ### Labels for months and regional seas        
 xlabels = [r'Jan',r'Apr',r'Jul',r'Oct',r'Jan']
 sienames = [r'\textbf{BARENTS SEA}',r'\textbf{BEAUFORT SEA}',
@@ -161,7 +79,7 @@ for i in range(sie.shape[0]):
     ### if statement for adjusting plot axes between bottom and others
     if i >= 8:           
         ax.tick_params('both',length=3.5,width=2,which='major') 
-        adjust_spines(ax, ['left','bottom'])            
+        DS.adjust_spines(ax, ['left','bottom'])            
         ax.spines['top'].set_color('none')
         ax.spines['right'].set_color('none')  
         ax.spines['bottom'].set_linewidth(2)
@@ -169,7 +87,7 @@ for i in range(sie.shape[0]):
         ax.tick_params(color='darkgrey')
     else:          
         ax.tick_params('both',length=3.5,width=2,which='major') 
-        adjust_spines(ax, ['left','bottom'])            
+        DS.adjust_spines(ax, ['left','bottom'])            
         ax.spines['top'].set_color('none')
         ax.spines['right'].set_color('none') 
         ax.spines['bottom'].set_color('none')
@@ -0,0 +1,320 @@
+"""
+Functions render daily AMSR2 3.125 km (UHH-Processed) sea ice concentration
+maps over a range of dates. Files are prefetched concurrently with a thread
+pool, then frames are rendered in a process pool where each worker builds
+its figure, Basemap projection and projected grid once and only redraws
+the concentration contours for every day.
+
+Notes
+-----
+    Source : http://icdc.cen.uni-hamburg.de/daten/cryosphere.html
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+Usage
+-----
+    [1] prefetchAMSR2(hemisphere,dates,nthreads)
+    [2] renderAMSR2Frames(hemisphere,dates,region,nprocs,nthreads)
+
+    python plot_AMSR2_Frames.py Ant 2019-08-15 2019-08-31 [region]
+"""
+
+### Import modules
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+
+### Directory
+directoryfigure = './Figures/'
+
+### Regional maps [latmin,latmax,lonmin,lonmax]
+REGIONS = {'kara' : [67,87,20,90],
+           'beaufort' : [64,87,180,240],
+           'bering' : [56,75,166,210],
+           'greenland' : [55,89.5,280,395],
+           'pacific' : [69,89.99,160,250],
+           'svalbard' : [73,86,340,420],
+           'GreenlandSea' : [74,88,330,410]}
+
+### Worker figure, projection and grid (one per process)
+_frame = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _polarStere(lon_w,lon_e,lat_s,lat_n):
+    """
+    Returns a Basemap object (NPS/SPS) focused in a region
+    """
+
+    ### Import modules
+    import math
+    import calc_MapCache as MC
+
+    lon_0 = lon_w + (lon_e - lon_w) / 2.
+    ref = lat_s if abs(lat_s) > abs(lat_n) else lat_n
+    lat_0 = math.copysign(90.,ref)
+    proj = 'npstere' if lat_0 > 0 else 'spstere'
+    prj = MC.cachedBasemap(projection=proj,lon_0=lon_0,lat_0=lat_0,
+                           boundinglat=0,resolution='l')
+    lons = [lon_w,lon_e,lon_w,lon_e,lon_0,lon_0]
+    lats = [lat_s,lat_s,lat_n,lat_n,lat_s,lat_n]
+    x,y = prj(lons,lats)
+    ll_lon,ll_lat = prj(min(x),min(y),inverse=True)
+    ur_lon,ur_lat = prj(max(x),max(y),inverse=True)
+    return MC.cachedBasemap(projection='stere',lat_0=lat_0,lon_0=lon_0,
+                            llcrnrlon=ll_lon,llcrnrlat=ll_lat,
+                            urcrnrlon=ur_lon,urcrnrlat=ur_lat,round=True,
+                            resolution='l')
+
+def _initFrame(hemisphere,region):
+    """
+    Builds the figure, projection and static artists once per worker
+    """
+
+    ### Import modules
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import numpy as np
+    import cmocean
+    import calc_MapCache as MC
+    import plot_DarkStyle as DS
+
+    DS.setDarkStyle(None)
+
+    if region is None:
+        ### Antarctic (plot_AMSR2_SIC_Ant.py)
+        color = 'darkgrey'
+        alpha = 1
+        minice = 0.20
+        levels = np.arange(20,100.01,2)
+        title = 'ANTARCTIC SEA ICE' if hemisphere == 'Ant' else \
+                'ARCTIC SEA ICE'
+    else:
+        ### Arctic regions (plot_AMSR2_SIC_region.py)
+        color = 'white'
+        alpha = 0.6
+        minice = 0.15
+        levels = np.arange(20,100.01,1)
+        title = 'ARCTIC SEA ICE'
+    for key in ('axes.edgecolor','xtick.color','ytick.color',
+                'axes.labelcolor'):
+        plt.rcParams[key] = color
+
+    fig = plt.figure()
+    ax = fig.add_subplot(111)
+
+    if region is not None:
+        latmin,latmax,lonmin,lonmax = REGIONS[region]
+        m = _polarStere(lonmin,lonmax,latmin,latmax)
+        m.drawcoastlines(color='r',linewidth=1.4)
+    elif hemisphere == 'Ant':
+        m = MC.cachedBasemap(projection='spstere',boundinglat=-56,lon_0=180,
+                             resolution='l',round=True,area_thresh=10000)
+        m.drawcoastlines(color='r',linewidth=2.5)
+    else:
+        m = MC.cachedBasemap(projection='npstere',boundinglat=57,lon_0=270,
+                             resolution='l',round=True,area_thresh=10000)
+        m.drawcoastlines(color='r',linewidth=2.5)
+    m.drawmapboundary(color='k')
+    m.drawlsmask(land_color='k',ocean_color='k')
+    m.fillcontinents(color='k')
+
+    suptitle = fig.suptitle('',fontsize=22,color=color,alpha=alpha)
+    textcolor = 'darkgrey' if region is None else 'white'
+    textalpha = 1 if region is None else 0.7
+    for text,y in ((r'\textbf{DATA:} AMSR2 3.125 km (JAXA/Uni Hamburg-Processing)',100),
+                   (r'\textbf{SOURCE:} http://icdc.cen.uni-hamburg.de/daten/cryosphere.html',80),
+                   (r'\textbf{GRAPHIC:} Zachary Labe (@ZLabe)',60)):
+        plt.annotate(text,xy=(250,y),xycoords='figure pixels',
+                     color=textcolor,fontsize=6,alpha=textalpha,rotation=0)
+
+    _frame.clear()
+    _frame.update(hemisphere=hemisphere,region=region,fig=fig,ax=ax,m=m,
+                  levels=levels,minice=minice,cmap=cmocean.cm.ice,
+                  title=title,suptitle=suptitle,color=color,alpha=alpha,
+                  cbar=None)
+
+def _renderFrame(date):
+    """
+    Reads one day and redraws only the concentration contours,
+    returns (date,filename,error)
+    """
+
+    ### Import modules
+    import numpy as np
+    import matplotlib.pyplot as plt
+    import read_AMSR2 as AM
+    import calc_MapCache as MC
+
+    fr = _frame
+    try:
+        lat,lon,ice = AM.readAMSR2(fr['hemisphere'],date.year,date.month,
+                                   date.day)
+
+        ### Mask below threshold and above 100%
+        ice[np.where(ice <= fr['minice'])] = np.nan
+        ice[np.where((ice >= 0.999) & (ice <= 1))] = 0.999
+        ice[np.where(ice > 1)] = np.nan
+        ice = ice*100.
+
+        ### Projected grid is cached on disk and shared by all workers
+        x,y = MC.projectGrid(fr['m'],lon,lat)
+
+        plt.sca(fr['ax'])
+        cs = fr['m'].contourf(x,y,ice,fr['levels'],extend='min',
+                              cmap=fr['cmap'],zorder=0.5)
+
+        titletime = date.strftime('%m/%d/%Y')
+        fr['suptitle'].set_text(r'\textbf{%s -- %s}' % (fr['title'],
+                                                         titletime))
+
+        ### Colorbar and layout are fixed by levels, built from the first
+        ### frame (tight layout only for the hemisphere maps, as before)
+        if fr['cbar'] is None:
+            cbar = fr['m'].colorbar(cs,location='right',pad=0.2)
+            cbar.outline.set_edgecolor('k')
+            barlim = np.arange(20,101,10)
+            cbar.set_ticks(barlim)
+            cbar.set_ticklabels(list(map(str,barlim)))
+            cbar.set_label(r'\textbf{Concentration (\%)}',fontsize=13,
+                           alpha=fr['alpha'],color=fr['color'])
+            cbar.ax.tick_params(axis='y',size=.01)
+            if fr['region'] is None:
+                fr['fig'].tight_layout()
+            fr['fig'].subplots_adjust(top=0.89)
+            fr['cbar'] = cbar
+
+        if fr['region'] is None:
+            filename = 'seaiceconc_%s.png' % date.strftime('%m_%d_%Y')
+        else:
+            filename = 'seaiceconc_%s_%s.png' % (fr['region'],
+                                                 date.strftime('%m_%d_%Y'))
+        fr['fig'].savefig(directoryfigure + filename,dpi=300)
+
+        ### Remove only the data artist for the next frame
+        if hasattr(cs,'remove'):
+            cs.remove()
+        else:
+            for collection in cs.collections:
+                collection.remove()
+    except Exception as e:
+        return date,None,repr(e)
+
+    return date,filename,None
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def prefetchAMSR2(hemisphere,dates,nthreads=8):
+    """
+    Function downloads and decompresses AMSR2 files concurrently
+
+    Parameters
+    ----------
+    hemisphere : string
+        Arc or Ant
+    dates : list of datetime.date
+        days to prefetch
+    nthreads : integer
+        number of concurrent downloads
+
+    Returns
+    -------
+    failed : dictionary
+        date : error message
+
+    Usage
+    -----
+    failed = prefetchAMSR2(hemisphere,dates,nthreads)
+    """
+
+    print('\n>>> Using prefetchAMSR2 function!')
+
+    ### Import modules
+    from concurrent.futures import ThreadPoolExecutor
+    import read_AMSR2 as AM
+
+    failed = {}
+    with ThreadPoolExecutor(max_workers=nthreads) as pool:
+        futures = {date : pool.submit(AM.fileAMSR2,hemisphere,date.year,
+                                      date.month,date.day)
+                   for date in dates}
+        for date,future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                failed[date] = repr(e)
+                print('Could not prefetch %s (%s)' % (date,e))
+
+    print('*Completed: Prefetched %s files!' % (len(dates) - len(failed)))
+    return failed
+
+def renderAMSR2Frames(hemisphere,dates,region=None,nprocs=None,nthreads=8):
+    """
+    Function renders one sea ice concentration map per day in parallel
+
+    Parameters
+    ----------
+    hemisphere : string
+        Arc or Ant
+    dates : list of datetime.date
+        days to render
+    region : string or None
+        key of REGIONS for a regional Arctic map, None for the full map
+    nprocs : integer
+        number of worker processes (default: number of cpus)
+    nthreads : integer
+        number of concurrent downloads
+
+    Returns
+    -------
+    results : list of tuples
+        (date,filename,error) for each day, error is None on success
+
+    Usage
+    -----
+    results = renderAMSR2Frames(hemisphere,dates,region,nprocs,nthreads)
+    """
+
+    print('\n>>> Using renderAMSR2Frames function!')
+
+    ### Import modules
+    from concurrent.futures import ProcessPoolExecutor
+
+    if region is not None and region not in REGIONS:
+        raise ValueError('Wrong region listed!')
+
+    failed = prefetchAMSR2(hemisphere,dates,nthreads)
+    dates = [date for date in dates if date not in failed]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=nprocs,initializer=_initFrame,
+                             initargs=(hemisphere,region)) as pool:
+        for date,filename,error in pool.map(_renderFrame,dates):
+            if error is None:
+                print('Completed: Figure plotted ---> %s' % filename)
+            else:
+                print('Could not plot %s (%s)' % (date,error))
+            results.append((date,filename,error))
+
+    print('*Completed: Rendered %s frames!' \
+            % sum(error is None for _,_,error in results))
+    return results
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+    import datetime
+
+    hemisphere = sys.argv[1]
+    start = datetime.datetime.strptime(sys.argv[2],'%Y-%m-%d').date()
+    end = datetime.datetime.strptime(sys.argv[3],'%Y-%m-%d').date()
+    region = sys.argv[4] if len(sys.argv) > 4 else None
+    dates = [start + datetime.timedelta(days=i)
+             for i in range((end - start).days + 1)]
+    renderAMSR2Frames(hemisphere,dates,region)
@@ -6,15 +6,16 @@ Author : Zachary Labe
 Date : 27 February 2017
 """
 
-from netCDF4 import Dataset
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
-import urllib.request as UL
+import read_AMSR2 as AM
 import numpy as np
 import datetime
 import calendar as cal
-import gzip
 import cmocean
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import calc_MapCache as MC
+import plot_DarkStyle as DS
 
 ### Directory and time
 directory = './Data/'
@@ -45,23 +46,7 @@ icedataset = 'AMSR2'
     
 if icedataset == 'AMSR2':
     
-    url = 'ftp://ftp-projects.cen.uni-hamburg.de/seaice/AMSR2/3.125km/'
-    filename = 'Arc_%s%s%s_res3.125_pyres.nc.gz' % (currentyr,currentmn,currentdy)
-    filenameout = 'Arc_AMSR2_SIC.nc'
-    UL.urlretrieve(url+filename, directory + filename)
-    inF = gzip.open(directory + filename, 'rb')
-    outF = open(directory + filenameout, 'wb')
-    outF.write( inF.read() )
-    inF.close()
-    outF.close()
-    
-    data = Dataset(directory + filenameout,'r')
-    ice = data.variables['sea_ice_concentration'][:]
-    lat = data.variables['latitude'][:]    
-    lon = data.variables['longitude'][:]
-    data.close()
-    
-    ice = np.asarray(np.squeeze(ice/100.))
+    lat,lon,ice = AM.readAMSR2('Arc',currentyr,currentmn,currentdy)
     
     print('Completed: Data read!')
     
@@ -71,28 +56,17 @@ ice[np.where(ice > 1)] = np.nan
 
 print('Completed: Ice masked!')
 
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='darkgrey')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
-
-def setcolor(x, color):
-     for m in x:
-         for t in x[m][1]:
-             t.set_color(color)
+DS.setDarkStyle(edgecolor='darkgrey')
 
 fig = plt.figure()
 ax = fig.add_subplot(111)
-m = Basemap(projection='npstere',boundinglat=57,lon_0=270,resolution='l',
-            round =True,area_thresh=10000)
+m = MC.cachedBasemap(projection='npstere',boundinglat=57,lon_0=270,
+                     resolution='l',round =True,area_thresh=10000)
 m.drawcoastlines(color = 'tomato',linewidth=0.4)
 m.drawmapboundary(color='k')
 
-cs = m.contourf(lon,lat,ice[:,:]*100.,np.arange(20,101,2),extend='min',latlon=True)
+x,y = MC.projectGrid(m,lon,lat)
+cs = m.contourf(x,y,ice[:,:]*100.,np.arange(20,101,2),extend='min')
     
 cmap = cmocean.cm.ice     
 cs.set_cmap(cmap)
@@ -9,10 +9,13 @@ Date : 30 May 2016
 from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap
-import urllib.request as UL
+import read_RemoteData as RD
 import numpy as np
 import datetime
 import calendar as cal
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directory = '/home/zlabe/Documents/Projects/SeaIceConc/'
@@ -44,9 +47,7 @@ icedataset = 'SSMIS'
 if icedataset == 'oisstv2':
     
     url = 'ftp://ftp.cdc.noaa.gov/Datasets/noaa.oisst.v2.highres/icec.day.mean.2016.v2.nc'
-    UL.urlretrieve(url, 'icec.day.mean.2016.v2.nc')
-    
-    data = Dataset(directory + 'icec.day.mean.2016.v2.nc')
+    data = Dataset(RD.fetchFile(url))
     ice = data.variables['icec'][:]
     lat = data.variables['lat'][:]
     lon = data.variables['lon'][:]
@@ -58,9 +59,7 @@ elif icedataset == 'SSMIS':
     
     url = 'ftp://osisaf.met.no/prod/ice/conc/'
     filename = 'ice_conc_nh_polstere-100_multi_%s1200.nc' % (currentyr+currentmn+currentdy)
-    UL.urlretrieve(url+filename, filename)
-    
-    data = Dataset(directory + filename)
+    data = Dataset(RD.fetchFile(url + filename))
     ice = data.variables['ice_conc'][:]
     lat = data.variables['lat'][:]    
     lon = data.variables['lon'][:]
@@ -81,19 +80,7 @@ print('Completed: Ice masked!')
 ###############################################################################
 ### Plot figure
 
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
-
-def setcolor(x, color):
-     for m in x:
-         for t in x[m][1]:
-             t.set_color(color)
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = fig.add_subplot(111)
@@ -106,7 +93,7 @@ parallels = np.arange(50,86,5)
 meridians = np.arange(-180,180,30)
 m.drawparallels(parallels,labels=[False,False,False,False],linewidth=0.5,color='w')
 par=m.drawmeridians(meridians,labels=[True,True,False,False],linewidth=0.5,fontsize=6,color='w')
-setcolor(par,'white')
+DS.setcolor(par,'white')
 m.shadedrelief()
 
 cs = m.contourf(lon,lat,ice[:,:],np.arange(0.15,1.04,.05),extend='min',latlon=True)
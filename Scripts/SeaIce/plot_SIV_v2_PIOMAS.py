@@ -12,15 +12,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.colors as c
 import datetime
+import calc_DailyIndex as DI
+import read_PIOMAS as RP
 import cmocean
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directorydata = './Data/'
 directoryfigure = './Figures/'
 
-year,day,volume = np.loadtxt(directorydata +
-                             'PIOMAS.vol.daily.1979.2018.Current.v2.1.dat.gz',
-                             skiprows=1,unpack=True)
+year,day,volume = RP.readPiomasDaily(directorydata)
 
 ### Current time
 day = list(map(int,day))
@@ -35,11 +38,11 @@ currentdoy = now.timetuple().tm_yday
 
 month = datetime.date(int(currentyr),int(currentmn)-1,int(currentdy)).strftime('%B')
 
-### Reshape sea ice volumes arrays
-currentyear = volume.copy()[-day[-1]:]
-volumen = volume[:-day[-1]]
-
-volumen = np.reshape(volumen,(volumen.shape[0]//365,365))
+### Arrange sea ice volumes as [year,doy] (PIOMAS uses 365 days every year)
+yearsiv,index = DI.dailyIndex(year,doy=day,leap='noleap')
+sivdaily = DI.dailyArray(volume,index,dtype=volume.dtype)
+currentyear = sivdaily[-1,:day[-1]]
+volumen = sivdaily[:-1]
 
 ### Calculate mean volume
 mean = np.nanmean(volumen,axis=0)
@@ -53,14 +56,7 @@ minyear = np.where(volumen[:,day[-1]-1] == minsiv)[0]
 timeyr = years[minyear][0]
 
 ### Make plot
-plt.rc('savefig', facecolor='black')
-plt.rc('axes', edgecolor='darkgrey')
-plt.rc('xtick', color='darkgrey')
-plt.rc('ytick', color='darkgrey')
-plt.rc('axes', labelcolor='darkgrey')
-plt.rc('axes', facecolor='black')
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
+DS.setDarkStyle('darkgrey')
 
 ### Return information
 print('\n' 'PIOMAS -- Sea Ice Volume --', now.strftime("%Y-%m-%d %H:%M"), '\n' '\n')
@@ -74,24 +70,8 @@ fig = plt.figure()
 ax = plt.subplot(111)
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([])
-
 ax.tick_params('both',length=5.5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')
 ax.spines['left'].set_linewidth(2)
@@ -11,6 +11,9 @@ Date      : 21 September 2016
 import numpy as np
 import matplotlib.pyplot as plt
 import datetime
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -35,38 +38,15 @@ clim = np.nanmean(aug[climyr])
 print('Completed: Read data!')
 
 ### Make plot
-plt.rc('savefig', facecolor='black')
-plt.rc('axes', edgecolor='white')
-plt.rc('xtick', color='white')
-plt.rc('ytick', color='white')
-plt.rc('axes', labelcolor='white')
-plt.rc('axes', facecolor='black')
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
+DS.setDarkStyle()
 
 ### Plot horizontal bar graph
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([])
-
 for i in range(aug.shape[0]):
     fig = plt.figure()
     ax = plt.subplot(111)
     
-    adjust_spines(ax, ['left', 'bottom'])
+    DS.adjust_spines(ax, ['left', 'bottom'])
     ax.spines['top'].set_color('none')
     ax.spines['right'].set_color('none')
     ax.spines['left'].set_color('none')
@@ -7,10 +7,12 @@ Date      : 9 August 2016
 
 ### Import modules
 import numpy as np
-import urllib.request
-import urllib as UL
+import read_Extent_JAXA as JX
 import datetime
 import matplotlib.pyplot as plt
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -20,37 +22,25 @@ currentdy = str(now.day-1)
 currentyr = str(now.year)
 currenttime = currentmn + '_' + currentdy + '_' + currentyr
 
-### Load url
-url = 'https://ads.nipr.ac.jp/vishop.ver1/data/graph/plot_extent_n_v2.csv'
-
-### Read file
-raw_data = UL.request.urlopen(url)
-dataset = np.genfromtxt(raw_data, skip_header=0,delimiter=",",)
-
-### Set missing data to nan
-dataset[np.where(dataset==-9999)] = np.nan
+### Read JAXA extent store (missing days are filled at ingest)
+month,day,means,yearsq,extent = JX.readExtentJAXA()
 
 ### Variables
-month     = dataset[1:,0]        # 1-12, nan as month[0]
-day       = dataset[1:,1]        # 1-31, nan as day[0]
-mean1980  = dataset[1:,2]        # km^2, nan as mean1980[0]
-mean1990  = dataset[1:,3]        # km^2, nan as mean1990[0]
-mean2000  = dataset[1:,4]        # km^2, nan as mean2000[0]
-years     = dataset[1:,6:]
+mean1980  = means[0]             # km^2
+mean1990  = means[1]             # km^2
+mean2000  = means[2]             # km^2
+years     = extent[np.where(yearsq >= 2003)[0]].T  # km^2 [doy,year]
 doy       = np.arange(0,len(day),1)
 
 ### Change units to million km^2
 years = years/1e6
 
 ### Recent day of current year
-currentyear = years[:,-1]
+currentyear = JX.fillLeapDay(years[:,-1],month,day) # leap year
 #lastday = np.where(np.isnan(currentyear[1:]))[0][0]
 lastday = now.timetuple().tm_yday - 1
 currentice = currentyear[lastday]
 
-currentyear[10] = currentyear[9]
-currentyear[59] = currentyear[58]
-
 ### Changes in sea ice
 weekchange = currentice - currentyear[lastday-7]
 daychange = currentice - currentyear[lastday-1]
@@ -69,14 +59,7 @@ mean1990line = [mean1990[lastday]/1e6] * years.shape[1]
 mean2000line = [mean2000[lastday]/1e6] * years.shape[1]
 
 ### Define parameters (dark)
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle()
 
 ### Plot sea ice extent
 fig = plt.figure()
@@ -87,22 +70,7 @@ ind = np.arange(N)
 width = 0.9
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', -7))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([])
-adjust_spines(ax, ['left', 'bottom'])
+DS.adjust_spines(ax, ['left', 'bottom'],outward=-7)
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')
 ax.spines['bottom'].set_color('none')
@@ -8,10 +8,13 @@ Date      : 15 June 2016
 
 from netCDF4 import Dataset
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 import datetime
 import cmocean
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import calc_MapCache as MC
+import plot_DarkStyle as DS
 
 ### Define constants
 directorydata = './Data/'
@@ -43,19 +46,7 @@ sicmo = sicmo/100.
 ### Plot figure
 
 ### Define parameters (dark)
-def setcolor(x, color):
-     for m in x:
-         for t in x[m][1]:
-             t.set_color(color)
-
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle()
 
 ### Select plot type
 style = 'polar'
@@ -65,10 +56,14 @@ lon2,lat2 = np.meshgrid(lons,lats)
 
 ### Define figure
 if style == 'ortho':
-    m = Basemap(projection='ortho',lon_0=-90,
-                lat_0=70,resolution='l',round=True)
+    m = MC.cachedBasemap(projection='ortho',lon_0=-90,
+                         lat_0=70,resolution='l',round=True)
 elif style == 'polar':
-    m = Basemap(projection='npstere',boundinglat=65,lon_0=270,resolution='l',round =True)
+    m = MC.cachedBasemap(projection='npstere',boundinglat=65,lon_0=270,
+                         resolution='l',round =True)
+
+### Project grid once for all years
+x,y = MC.projectGrid(m,lon2,lat2)
 
 for i in range(sicmo.shape[0]):
     fig = plt.figure()
@@ -85,9 +80,9 @@ for i in range(sicmo.shape[0]):
     ### Select limits for colorbar
     barlim = np.arange(0.1,1.1,1)
     
-    cs = m.contourf(lon2,lat2,var,
+    cs = m.contourf(x,y,var,
                     np.arange(0.1,1.1,0.05),extend='both',
-                    alpha=1,latlon=True)
+                    alpha=1)
     
     cmap = cmocean.cm.tempo_r   
     cs.set_cmap(cmap)
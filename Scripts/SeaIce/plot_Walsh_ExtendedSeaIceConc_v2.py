@@ -15,6 +15,10 @@ import datetime
 import calendar as cal
 from matplotlib.colors import ListedColormap, BoundaryNorm
 import cmocean
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import calc_MapCache as MC
+import plot_DarkStyle as DS
 
 ### Define constants
 directorydata = './Data/'
@@ -47,19 +51,7 @@ sicmo = sicmo/100.
 ### Plot figure
 
 ### Define parameters (dark)
-def setcolor(x, color):
-     for m in x:
-         for t in x[m][1]:
-             t.set_color(color)
-
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle()
 
 ## Plot global temperature anomalies
 style = 'polar'
@@ -69,11 +61,14 @@ lon2,lat2 = np.meshgrid(lons,lats)
 
 ### Define figure
 if style == 'ortho':
-    m = Basemap(projection='ortho',lon_0=-90,
-                lat_0=70,resolution='l',round=True)
+    m = MC.cachedBasemap(projection='ortho',lon_0=-90,
+                         lat_0=70,resolution='l',round=True)
 elif style == 'polar':
-    m = Basemap(projection='npstere',boundinglat=50,lon_0=270,
-                resolution='l',round =True,area_thresh=10000)
+    m = MC.cachedBasemap(projection='npstere',boundinglat=50,lon_0=270,
+                         resolution='l',round =True,area_thresh=10000)
+
+### Project grid once for all years
+x,y = MC.projectGrid(m,lon2,lat2)
 
 for i in range(sicmo.shape[0]): # 100 years
     fig = plt.figure()
@@ -94,9 +89,9 @@ for i in range(sicmo.shape[0]): # 100 years
     barlim = np.arange(0.1,1.1,1)
     
     ### Plot filled contours
-    cs = m.contourf(lon2,lat2,var,
+    cs = m.contourf(x,y,var,
                     np.arange(0.1,1.1,0.05),extend='both',
-                    alpha=1,latlon=True,zorder=2)
+                    alpha=1,zorder=2)
     
     ### Color map
     cmap = cmocean.cm.ice
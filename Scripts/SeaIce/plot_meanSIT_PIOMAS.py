@@ -15,6 +15,10 @@ import matplotlib
 import datetime
 import read_SeaIceThick_PIOMAS as CT
 import calc_PiomasArea as CA
+import calc_SeaIceVolume_PIOMAS as CV
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = './Figures/'
@@ -44,59 +48,19 @@ area = CA.readPiomasArea(directorydata)
 ###########################################################################
 ###########################################################################
 ### Calculating temporal sit
-def weightThick(var,area):
-    """
-    Area weights sit array 4d [year,month,lat,lon] into [year,month] using 
-    original PIOMAS GOCC grid, which area-weights
-    """
-    sityr = np.empty((var.shape[0],var.shape[1]))
-    for i in range(var.shape[0]):
-        for j in range(var.shape[1]):
-            varq = var[i,j,:,:]
-            mask = np.isfinite(varq) & np.isfinite(area)
-            varmask = varq[mask]
-            areamask = area[mask]
-            sityr[i,j] = np.nansum(varmask*areamask)/np.sum(areamask)
-     
-    print('\nCompleted: Yearly weighted SIT average!') 
-    return sityr
-     
-sitave = weightThick(sit,area)
+sitave,siv = CV.weightThick(sit,area)
 
 ###############################################################################
 ###############################################################################
 ###############################################################################
 ### Plot figure
-matplotlib.rc('savefig', facecolor='black')
-matplotlib.rc('axes', edgecolor='white')
-matplotlib.rc('xtick', color='white')
-matplotlib.rc('ytick', color='white')
-matplotlib.rc('axes', labelcolor='white')
-matplotlib.rc('axes', facecolor='black')
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']})
+DS.setDarkStyle()
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([])
-
 fig = plt.figure()
 ax = plt.subplot(111) 
 
-adjust_spines(ax, ['left', 'bottom'])            
+DS.adjust_spines(ax, ['left', 'bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')
 ax.spines['bottom'].set_linewidth(2)
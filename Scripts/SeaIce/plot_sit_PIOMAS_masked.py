@@ -10,7 +10,11 @@ import numpy as np
 import datetime
 import calendar as cal
 import matplotlib.colors as c
+import read_PIOMAS as RP
 import cmocean
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 #### Define constants
 ### Directory and time
@@ -21,60 +25,8 @@ month = now.month
 years = np.arange(1979,2019,1)
 months = np.arange(1,13,1)
 
-def readPiomas(directory,vari,years,thresh):
-    """
-    Reads binary PIOMAS data
-    """
-    
-    ### Retrieve Grid
-    grid = np.genfromtxt(directory + 'grid.txt')
-    grid = np.reshape(grid,(grid.size))  
-    
-    ### Define Lat/Lon
-    lon = grid[:grid.size//2]   
-    lons = np.reshape(lon,(120,360))
-    lat = grid[grid.size//2:]
-    lats = np.reshape(lat,(120,360))
-    
-    ### Call variables from PIOMAS
-    if vari == 'thick':
-        files = 'heff'
-        directory = directory + 'Thickness/'
-    elif vari == 'sic':
-        files = 'area'
-        directory = directory + 'SeaIceConcentration/'
-    elif vari == 'snow':
-        files = 'snow'
-        directory = directory + 'SnowCover/'   
-    elif vari == 'oflux':
-        files = 'oflux'
-        directory = directory + 'OceanFlux/'
-    
-    ### Read data from binary into numpy arrays
-    var = np.empty((len(years),12,120,360))
-    for i in range(len(years)):
-        data = np.fromfile(directory + files + '_%s.H' % (years[i]),
-                           dtype = 'float32')
-
-    ### Reshape into [year,month,lat,lon]
-        months = int(data.shape[0]/(120*360))
-        if months != 12:
-            lastyearq = np.reshape(data,(months,120,360))
-            emptymo = np.empty((12-months,120,360))
-            emptymo[:,:,:] = np.nan
-            lastyear = np.append(lastyearq,emptymo,axis=0)
-            var[i,:,:,:] = lastyear
-        else:
-            dataq = np.reshape(data,(12,120,360))        
-            var[i,:,:,:] = dataq
-    
-    ### Mask out threshold values
-    var[np.where(var <= thresh)] = np.nan
-
-    print('Completed: Read "%s" data!' % (vari))   
-    
-    return lats,lons,var
-lats,lons,sit = readPiomas(directorydata,'thick',years,0.1)
+lats,lons,sit = RP.readPiomasVar(directorydata,'thick',years,0.1,
+                                  inclusive=True)
 
 def colormapSIT():
     cmap1 = plt.get_cmap('BuPu')
@@ -91,14 +43,7 @@ sit = sit[:,1,:,:]
 
 sit[np.where(sit < 1.5)] = np.nan
 
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle()
 #plt.rcParams['axes.linewidth'] = 0.5
 
 ## Plot global temperature anomalies
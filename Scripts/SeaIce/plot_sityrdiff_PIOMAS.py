@@ -15,6 +15,9 @@ import datetime
 import calc_SeaIceThick_PIOMAS as CP
 import iris as ir
 import iris.quickplot as qplt
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Define directories
 ### Directory and time
@@ -107,20 +110,8 @@ diffsit = diffThick(sit,plotyr1,plotyr2,years,plotmonth)
 
 print 'Completed: Beginning plotting!'
 ### Create colormaps for sit
-def setcolor(x, color):
-     for m in x:
-         for t in x[m][1]:
-             t.set_color(color)
-
 ### Call parameters
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle()
 plt.rcParams['axes.linewidth'] = 0.55
 
 ### Define figure
@@ -143,7 +134,7 @@ m.drawparallels(parallels,labels=[False,False,False,False],
 mer = m.drawmeridians(meridians,labels=[True,True,False,False],
                 linewidth=0.5,color='k',fontsize=4)
 m.drawlsmask(land_color='darkgrey',ocean_color='w')
-setcolor(mer,'white')
+DS.setcolor(mer,'white')
 
 ### Adjust maximum limits
 values = np.arange(-2,2.1,.2)  
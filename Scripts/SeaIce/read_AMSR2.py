@@ -0,0 +1,157 @@
+"""
+Functions read AMSR2 3.125 km (UHH-processed) daily sea ice concentration.
+Compressed files are downloaded through read_RemoteData.py and decompressed
+in chunks, either into an uncompressed netCDF cache keyed by date or
+straight into an in-memory netCDF dataset. Every day has its own file, so
+several days can be read in parallel.
+
+Notes
+-----
+    Source : ftp://ftp-projects.cen.uni-hamburg.de/seaice/AMSR2/3.125km/
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+Usage
+-----
+    [1] readAMSR2(hemisphere,year,month,day,inmemory)
+    [2] fileAMSR2(hemisphere,year,month,day)
+"""
+
+### AMSR2 archive and uncompressed cache
+URL = 'ftp://ftp-projects.cen.uni-hamburg.de/seaice/AMSR2/3.125km/'
+CACHEDIR = './Data/cache/AMSR2/'
+CHUNKSIZE = 4*1024**2
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _filenameAMSR2(hemisphere,year,month,day):
+    """
+    Returns archive file name, hemisphere is Arc or Ant
+    """
+
+    if hemisphere not in ('Arc','Ant'):
+        raise ValueError('Wrong hemisphere - (Arc or Ant)!')
+    return '%s_%04d%02d%02d_res3.125_pyres.nc.gz' % (hemisphere,int(year),
+                                                     int(month),int(day))
+
+def _gunzipSize(filegz):
+    """
+    Uncompressed size from the gzip trailer (modulo 2**32)
+    """
+
+    ### Import modules
+    import struct
+
+    with open(filegz,'rb') as f:
+        f.seek(-4,2)
+        return struct.unpack('<I',f.read(4))[0]
+
+def fileAMSR2(hemisphere,year,month,day):
+    """
+    Function returns an uncompressed netCDF file for one day, decompressing
+    the downloaded archive in chunks on first use
+
+    Parameters
+    ----------
+    hemisphere : string
+        Arc or Ant
+    year,month,day : integers
+        date of the file
+
+    Returns
+    -------
+    filename : string
+        path to uncompressed netCDF file
+
+    Usage
+    -----
+    filename = fileAMSR2(hemisphere,year,month,day)
+    """
+
+    ### Import modules
+    import gzip
+    import os
+    import shutil
+    import read_RemoteData as RD
+
+    filename = _filenameAMSR2(hemisphere,year,month,day)
+    filegz = RD.fetchFile(URL + filename)
+    filenc = os.path.join(CACHEDIR,filename[:-3])
+
+    if not os.path.exists(filenc) or \
+            os.path.getmtime(filenc) < os.path.getmtime(filegz):
+        os.makedirs(CACHEDIR,exist_ok=True)
+        tempfile = filenc + '.%s.tmp' % os.getpid()
+        with gzip.open(filegz,'rb') as inF, open(tempfile,'wb') as outF:
+            shutil.copyfileobj(inF,outF,CHUNKSIZE)
+        os.replace(tempfile,filenc)
+
+    return filenc
+
+def readAMSR2(hemisphere,year,month,day,inmemory=False):
+    """
+    Function reads AMSR2 sea ice concentration for one day
+
+    Parameters
+    ----------
+    hemisphere : string
+        Arc or Ant
+    year,month,day : integers
+        date of the file
+    inmemory : boolean
+        decompress into memory instead of the uncompressed file cache
+
+    Returns
+    -------
+    lat : 2d array
+        latitudes
+    lon : 2d array
+        longitudes
+    ice : 2d array
+        sea ice concentration (fraction, 0-1)
+
+    Usage
+    -----
+    lat,lon,ice = readAMSR2(hemisphere,year,month,day,inmemory)
+    """
+
+    ### Import modules
+    import gzip
+    import numpy as np
+    from netCDF4 import Dataset
+    import read_RemoteData as RD
+
+    if inmemory:
+        ### Decompress in chunks into one preallocated buffer
+        filename = _filenameAMSR2(hemisphere,year,month,day)
+        filegz = RD.fetchFile(URL + filename)
+        buffer = bytearray(_gunzipSize(filegz))
+        view = memoryview(buffer)
+        size = 0
+        with gzip.open(filegz,'rb') as inF:
+            while True:
+                if size == len(buffer):
+                    if not inF.read(1):
+                        break
+                    raise ValueError('AMSR2 file is larger than 4 GB - %s!' \
+                                     % filename)
+                nbytes = inF.readinto(view[size:size+CHUNKSIZE])
+                if not nbytes:
+                    break
+                size += nbytes
+        data = Dataset(filename[:-3],'r',memory=buffer)
+    else:
+        data = Dataset(fileAMSR2(hemisphere,year,month,day),'r')
+
+    ice = data.variables['sea_ice_concentration'][:]
+    lat = data.variables['latitude'][:]
+    lon = data.variables['longitude'][:]
+    data.close()
+
+    ice = np.asarray(np.squeeze(ice/100.))
+
+    print('Completed: Read AMSR2 %s %04d-%02d-%02d!' % (hemisphere,int(year),
+                                                       int(month),int(day)))
+    return lat,lon,ice
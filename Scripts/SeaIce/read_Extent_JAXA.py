@@ -0,0 +1,262 @@
+"""
+Functions read JAXA (ADS/NIPR) daily Arctic sea ice extent. The csv is
+downloaded through read_RemoteData.py and stored locally as a compact
+float32 array [year,doy]. Later runs only parse the columns of the most
+recent stored year onwards and merge the days newer than the last stored
+day. Short runs of missing days are filled once here, so figure scripts
+no longer patch days by hand. The 29 February row of non-leap years is not
+a calendar day and stays nan in the store; fillLeapDay copies 28 February
+into it for plotting a continuous line.
+
+Notes
+-----
+    Source : https://ads.nipr.ac.jp/vishop/vishop-extent.html
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+Usage
+-----
+    [1] readExtentJAXA(cachefile,url,maxgap)
+    [2] fillLeapDay(series,month,day)
+"""
+
+### JAXA csv and default cache
+URL = 'https://ads.nipr.ac.jp/vishop.ver1/data/graph/plot_extent_n_v2.csv'
+CACHEFILE = './Data/cache/JAXA_extent.npz'
+
+### Longest run of missing days filled by linear interpolation
+MAXGAP = 7
+
+### Layout of the store, older stores are parsed again
+STOREVERSION = 2
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _readHeader(filename):
+    """
+    Returns column names of the csv
+    """
+
+    with open(filename,'r',encoding='utf-8-sig') as f:
+        header = f.readline()
+    return [name.strip().strip('"') for name in header.split(',')]
+
+def _columnYear(name):
+    """
+    Returns year of a csv column header, None for other columns
+    """
+
+    try:
+        year = int(float(name))
+    except ValueError:
+        return None
+    if 1900 <= year <= 2200:
+        return year
+    return None
+
+def _readColumns(filename,columns):
+    """
+    Reads the given csv columns as float32 [column,doy], missing as nan
+    """
+
+    ### Import modules
+    import numpy as np
+
+    data = np.genfromtxt(filename,skip_header=1,delimiter=',',
+                         usecols=columns,dtype='float64')
+    data = data.reshape(-1,len(columns)).T
+    data[np.where(data == -9999)] = np.nan
+    return data.astype('float32')
+
+def _fillGaps(extent,years,month,day,maxgap=MAXGAP):
+    """
+    Linearly interpolates interior runs of up to maxgap missing days for
+    each year [year,doy], in place. Leading/trailing missing days are kept
+    and 29 February of non-leap years is skipped (left nan).
+    """
+
+    ### Import modules
+    import calendar
+    import numpy as np
+
+    alldays = np.arange(extent.shape[1])
+    nonleap = alldays[~((month == 2) & (day == 29))]
+    for year,series in zip(years,extent):
+        days = alldays if calendar.isleap(int(year)) else nonleap
+        values = series[days]
+        valid = np.where(np.isfinite(values))[0]
+        if valid.size < 2:
+            continue
+        gaps = np.where(np.diff(valid) > 1)[0]
+        for gap in gaps:
+            start,end = valid[gap],valid[gap+1]
+            if end - start - 1 <= maxgap:
+                values[start+1:end] = np.interp(np.arange(start+1,end),
+                                                [start,end],
+                                                values[[start,end]])
+        series[days] = values
+    return extent
+
+def _lastDay(years,extent):
+    """
+    Returns (year,doy index) of the last day with data
+    """
+
+    ### Import modules
+    import numpy as np
+
+    for i in range(len(years)-1,-1,-1):
+        valid = np.where(np.isfinite(extent[i]))[0]
+        if valid.size > 0:
+            return int(years[i]),int(valid[-1])
+    return None,None
+
+def readExtentJAXA(cachefile=CACHEFILE,url=URL,maxgap=MAXGAP):
+    """
+    Function reads JAXA daily Arctic sea ice extent from the local store,
+    merging new days from the csv when it has been updated
+
+    Parameters
+    ----------
+    cachefile : string
+        compact .npz store of the parsed csv
+    url : string
+        location of the JAXA csv
+    maxgap : integer
+        longest run of missing days filled at ingest
+
+    Returns
+    -------
+    month : 1d array [doy]
+        month of each row (1-12)
+    day : 1d array [doy]
+        day of month of each row (1-31)
+    means : 2d array [decade,doy]
+        decadal mean extent (km^2), e.g. 1980s, 1990s, 2000s
+    years : 1d array
+        years of the record
+    extent : 2d array [year,doy]
+        sea ice extent (km^2), float32, 366 days (29 February is nan in
+        non-leap years)
+
+    Usage
+    -----
+    month,day,means,years,extent = readExtentJAXA(cachefile,url,maxgap)
+    """
+
+    print('\n>>> Using readExtentJAXA function!')
+
+    ### Import modules
+    import numpy as np
+    import os
+    import read_RemoteData as RD
+
+    filename = RD.fetchFile(url)
+    mtime = os.path.getmtime(filename)
+
+    ### Load previous store
+    store = None
+    if os.path.exists(cachefile):
+        with np.load(cachefile) as cache:
+            store = {key : cache[key] for key in cache.files}
+        if int(store.get('version',1)) != STOREVERSION:
+            store = None
+        elif float(store['mtime']) == mtime:
+            print('*Completed: Read JAXA extent from store!')
+            return (store['month'],store['day'],store['means'],
+                    store['years'],store['extent'])
+
+    names = _readHeader(filename)
+    yearcols = [(i,_columnYear(name)) for i,name in enumerate(names)
+                if i > 1 and _columnYear(name) is not None]
+
+    if store is None:
+        ### First time, parse the full csv
+        print('Parsing JAXA csv ---> %s' % filename)
+        meancols = [i for i,name in enumerate(names)
+                    if i > 1 and _columnYear(name) is None]
+        monthday = _readColumns(filename,[0,1])
+        month = monthday[0].astype('int8')
+        day = monthday[1].astype('int8')
+        means = _readColumns(filename,meancols)
+        years = np.array([year for _,year in yearcols],dtype='int16')
+        extent = _fillGaps(_readColumns(filename,[i for i,_ in yearcols]),
+                           years,month,day,maxgap)
+    else:
+        ### Only parse years from the last stored day and merge newer days
+        month,day,means = store['month'],store['day'],store['means']
+        years,extent = store['years'],store['extent']
+        lastyear,lastdoy = int(store['lastyear']),int(store['lastdoy'])
+        print('Appending new days since %s (doy %s)' % (lastyear,lastdoy+1))
+
+        newcols = [(i,year) for i,year in yearcols if year >= lastyear]
+        newyears = np.array([year for _,year in newcols],dtype='int16')
+        newextent = _readColumns(filename,[i for i,_ in newcols])
+
+        allyears = np.union1d(years,newyears).astype('int16')
+        merged = np.full((allyears.size,extent.shape[1]),np.nan,
+                         dtype='float32')
+        merged[np.searchsorted(allyears,years)] = extent
+        for year,series in zip(newyears,newextent):
+            yr = np.searchsorted(allyears,year)
+            start = lastdoy + 1 if year == lastyear else 0
+            merged[yr,start:] = series[start:]
+
+        ### Fill gaps of the updated years only
+        newq = np.searchsorted(allyears,newyears)
+        merged[newq] = _fillGaps(merged[newq],allyears[newq],month,day,
+                                 maxgap)
+        years,extent = allyears,merged
+
+    lastyear,lastdoy = _lastDay(years,extent)
+
+    ### Save compact store
+    directory = os.path.dirname(cachefile)
+    if directory:
+        os.makedirs(directory,exist_ok=True)
+    tempfile = cachefile + '.%s.tmp.npz' % os.getpid()
+    np.savez(tempfile,month=month,day=day,means=means,years=years,
+             extent=extent,lastyear=np.array(lastyear),
+             lastdoy=np.array(lastdoy),mtime=np.array(mtime),
+             version=np.array(STOREVERSION))
+    os.replace(tempfile,cachefile)
+
+    print('*Completed: Read JAXA extent through %s (doy %s)!' % (lastyear,
+                                                                lastdoy+1))
+    return month,day,means,years,extent
+
+def fillLeapDay(series,month,day):
+    """
+    Function fills a missing 29 February (non-leap years) of a daily series
+    with 28 February, so plotted lines and day-to-day changes are not broken
+
+    Parameters
+    ----------
+    series : 1d array [doy]
+        extent of one year, e.g. extent[-1]
+    month : 1d array [doy]
+        month of each row (1-12)
+    day : 1d array [doy]
+        day of month of each row (1-31)
+
+    Returns
+    -------
+    series : 1d array [doy]
+        copy of the series with 29 February filled
+
+    Usage
+    -----
+    series = fillLeapDay(series,month,day)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    series = np.array(series,copy=True)
+    leapday = np.where((month == 2) & (day == 29))[0]
+    for doy in leapday:
+        if doy > 0 and np.isnan(series[doy]):
+            series[doy] = series[doy-1]
+    return series
@@ -0,0 +1,392 @@
+"""
+Functions read PIOMAS binary files (thickness, concentration, snow depth and
+ocean heat flux) and grid information. The text grid files are parsed once
+into binary .npy caches next to the originals and memory-mapped afterwards.
+Yearly binary files are memory-mapped into a lazy [year,month,lat,lon] array.
+The gzipped daily volume text file is converted once into a typed binary
+cache keyed by its checksum.
+
+Notes
+-----
+    Source : http://psc.apl.washington.edu/zhang/IDAO/data_piomas.html
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+Usage
+-----
+    [1] readPiomasGrid(directory)
+    [2] readPiomasGridData(directory)
+    [3] readPiomasArea(directory)
+    [4] readPiomasVar(directory,vari,years,threshold,inclusive)
+    [5] PiomasArray(filenames,threshold,inclusive)
+    [6] readPiomasDaily(directory,filename,cachedir)
+"""
+
+### PIOMAS GOCC grid
+NLAT = 120
+NLON = 360
+
+### Variable name : (file prefix, subdirectory)
+PIOMASVARS = {'thick' : ('heff','Thickness/'),
+              'sic' : ('area','SeaIceConcentration/'),
+              'snow' : ('snow','SnowCover/'),
+              'oflux' : ('oflux','OceanFlux/')}
+
+### Daily volume text file and binary cache
+DAILYFILE = 'PIOMAS.vol.daily.1979.2018.Current.v2.1.dat.gz'
+DAILYCACHEDIR = './Data/cache/'
+DAILYDTYPE = [('year','<i2'),('doy','<i2'),('volume','<f4')]
+
+### Parsed grids for this process
+_gridcache = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+class PiomasArray(object):
+    """
+    Lazy [year,month,lat,lon] view of PIOMAS binary files (float32). Each
+    yearly file is memory-mapped and months missing from a partial year
+    are filled with nan's only when they are indexed.
+
+    Parameters
+    ----------
+    filenames : list of strings
+        path to one binary file per year
+    threshold : float or None
+        mask amounts < to this value
+    inclusive : boolean
+        also mask amounts equal to threshold (<=)
+
+    Usage
+    -----
+    var = PiomasArray(filenames,threshold,inclusive)
+    varmo = var[:,8,:,:]
+    """
+
+    nmonths = 12
+    nlat = NLAT
+    nlon = NLON
+
+    def __init__(self,filenames,threshold=None,inclusive=False):
+        ### Import modules
+        import numpy as np
+        import os
+
+        self.threshold = threshold
+        self.inclusive = inclusive
+        self.maps = []
+        for filename in filenames:
+            months = os.path.getsize(filename)//(4*self.nlat*self.nlon)
+            if months < 1 or months > self.nmonths:
+                raise ValueError('Issue with reshaping PIOMAS array from '
+                                 'binary - %s!' % filename)
+            self.maps.append(np.memmap(filename,dtype='float32',mode='r',
+                                       shape=(months,self.nlat,self.nlon)))
+        self.monthsavail = np.array([data.shape[0] for data in self.maps])
+
+        self.shape = (len(self.maps),self.nmonths,self.nlat,self.nlon)
+        self.ndim = 4
+        self.dtype = np.dtype('float32')
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self,dtype=None):
+        var = self[:,:,:,:]
+        if dtype is not None:
+            var = var.astype(dtype)
+        return var
+
+    def __getitem__(self,key):
+        ### Import modules
+        import numpy as np
+
+        ### Expand key to [year,month,lat,lon]
+        if not isinstance(key,tuple):
+            key = (key,)
+        if any(k is Ellipsis for k in key):
+            i = [k is Ellipsis for k in key].index(True)
+            fill = (slice(None),)*(self.ndim - len(key) + 1)
+            key = key[:i] + fill + key[i+1:]
+        key = key + (slice(None),)*(self.ndim - len(key))
+        yearkey,monthkey,spacekey = key[0],key[1],key[2:]
+
+        ### Year and month indices to read
+        yearsq = np.arange(self.shape[0])[yearkey]
+        monthsq = np.arange(self.nmonths)[monthkey]
+        squeeze = tuple(ax for ax,q in enumerate((yearsq,monthsq))
+                        if np.ndim(q) == 0)
+        yearsq = np.atleast_1d(yearsq)
+        monthsq = np.atleast_1d(monthsq)
+
+        ### Page in selected months, nan's for future months
+        spatial = np.empty((self.nlat,self.nlon),
+                           dtype='float32')[spacekey].shape
+        var = np.full((yearsq.size,monthsq.size) + spatial,np.nan,
+                      dtype='float32')
+        for i,yr in enumerate(yearsq):
+            avail = np.where(monthsq < self.monthsavail[yr])[0]
+            if avail.size > 0:
+                data = self.maps[yr][monthsq[avail]]
+                var[i,avail] = data[(slice(None),) + spacekey]
+
+        ### Mask out threshold values
+        if self.threshold is not None and self.inclusive:
+            var[var <= self.threshold] = np.nan
+        elif self.threshold is not None:
+            var[var < self.threshold] = np.nan
+
+        return np.squeeze(var,axis=squeeze) if squeeze else var
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _readGridCache(directory,filename):
+    """
+    Parses text grid file once into [field,lat,lon] and caches it as .npy
+    next to the original. Cache is rebuilt when the text file is newer.
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+
+    textfile = directory + filename
+    cachefile = os.path.splitext(textfile)[0] + '.npy'
+
+    key = os.path.abspath(textfile)
+    if key in _gridcache:
+        return _gridcache[key]
+
+    if not os.path.exists(cachefile) or \
+            os.path.getmtime(cachefile) < os.path.getmtime(textfile):
+        print('Caching PIOMAS grid ---> %s' % cachefile)
+        grid = np.genfromtxt(textfile)
+        grid = np.reshape(grid,(-1,NLAT,NLON))
+        tempfile = cachefile + '.tmp.npy'
+        np.save(tempfile,grid)
+        os.replace(tempfile,cachefile)
+
+    grid = np.load(cachefile,mmap_mode='r')
+    _gridcache[key] = grid
+    return grid
+
+def readPiomasGrid(directory):
+    """
+    Function reads PIOMAS latitude and longitude from grid.txt
+
+    Parameters
+    ----------
+    directory : string
+        working directory for stored PIOMAS files
+
+    Returns
+    -------
+    lats : 2d array
+        latitudes
+    lons : 2d array
+        longitudes
+
+    Usage
+    -----
+    lats,lons = readPiomasGrid(directory)
+    """
+
+    grid = _readGridCache(directory,'grid.txt')
+
+    ### Define Lat/Lon
+    lons = grid[0]
+    lats = grid[1]
+
+    return lats,lons
+
+def readPiomasGridData(directory):
+    """
+    Function reads PIOMAS grid cell information from griddata.txt
+    (see PIOMAS grid documentation, fortran)
+
+    Parameters
+    ----------
+    directory : string
+        working directory for stored PIOMAS files
+
+    Returns
+    -------
+    griddata : 3d array [field,lat,lon]
+        lon,lat,htn,hte,hts,htw,ex
+
+    Usage
+    -----
+    griddata = readPiomasGridData(directory)
+    """
+
+    return _readGridCache(directory,'griddata.txt')
+
+def readPiomasArea(directory):
+    """
+    Function calculates area of PIOMAS grid cells
+
+    Parameters
+    ----------
+    directory : string
+        working directory for stored PIOMAS files
+
+    Returns
+    -------
+    area : 2d array [lat,lon]
+        area of grid cell
+
+    Usage
+    -----
+    area = readPiomasArea(directory)
+    """
+
+    ### Import modules
+    import os
+
+    key = os.path.abspath(directory + 'griddata.txt') + ':area'
+    if key not in _gridcache:
+        griddata = readPiomasGridData(directory)
+
+        ### Area from northern (htn) and eastern (hte) cell edges
+        _gridcache[key] = griddata[2]*griddata[3]
+
+    return _gridcache[key]
+
+def readPiomasVar(directory,vari,years,threshold,inclusive=False):
+    """
+    Function reads PIOMAS binary and returns a memory-mapped array.
+
+    Parameters
+    ----------
+    directory : string
+        working directory for stored PIOMAS files
+    vari : string
+        variable to read (thick, sic, snow or oflux)
+    years : integers
+        years for data files
+    threshold : float or None
+        mask amounts < to this value
+    inclusive : boolean
+        also mask amounts equal to threshold (<=)
+
+    Returns
+    -------
+    lats : 2d array
+        latitudes
+    lons : 2d array
+        longitudes
+    var : 4d PiomasArray [year,month,lat,lon]
+        PIOMAS variable, use np.asarray(var) for a full copy
+
+    Usage
+    -----
+    lats,lons,var = readPiomasVar(directory,vari,years,threshold,
+                                  inclusive)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calendar as cal
+
+    if vari not in PIOMASVARS:
+        raise ValueError('Wrong PIOMAS variable - %s!' % vari)
+
+    ### Retrieve Grid
+    lats,lons = readPiomasGrid(directory)
+
+    ### Memory-map binary files into [year,month,lat,lon]
+    files,subdirectory = PIOMASVARS[vari]
+    filenames = [directory + subdirectory + files + '_%s.H' % (yr)
+                 for yr in years]
+    var = PiomasArray(filenames,threshold,inclusive)
+
+    months = var.monthsavail[-1]
+    if months != 12:
+        print('"%s" data available through ---> "%s"' \
+                % (vari,cal.month_name[months]))
+        print('"%s" data available from ---> (%s - %s)' \
+                % (vari,np.nanmin(years),np.nanmax(years)))
+
+    print('Completed: Read "%s" data!' % (vari))
+
+    return lats,lons,var
+
+def _checksum(filename):
+    """
+    Returns sha1 of a file, read in 1 MB blocks
+    """
+
+    ### Import modules
+    import hashlib
+
+    digest = hashlib.sha1()
+    with open(filename,'rb') as f:
+        for block in iter(lambda: f.read(1 << 20),b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def readPiomasDaily(directory,filename=DAILYFILE,cachedir=DAILYCACHEDIR):
+    """
+    Function reads PIOMAS daily sea ice volume. The text file is parsed once
+    into a binary cache named after its checksum and memory-mapped afterwards
+
+    Parameters
+    ----------
+    directory : string
+        working directory for stored PIOMAS files
+    filename : string
+        daily volume text file (gzipped), columns Year #day Vol
+    cachedir : string
+        directory of the binary cache
+
+    Returns
+    -------
+    year : 1d array
+        year of each row (int16)
+    day : 1d array
+        day of year of each row (int16, 1-365)
+    volume : 1d array
+        sea ice volume (10^3 km^3, float32)
+
+    Usage
+    -----
+    year,day,volume = readPiomasDaily(directory,filename,cachedir)
+    """
+
+    ### Import modules
+    import glob
+    import numpy as np
+    import os
+
+    textfile = directory + filename
+    name = filename.split('.dat')[0]
+    cachefile = os.path.join(cachedir,'%s.%s.npy' % (name,
+                                                     _checksum(textfile)[:16]))
+
+    if not os.path.exists(cachefile):
+        print('Caching PIOMAS daily volume ---> %s' % cachefile)
+        year,day,volume = np.loadtxt(textfile,skiprows=1,unpack=True)
+        daily = np.empty(year.size,dtype=DAILYDTYPE)
+        daily['year'] = year
+        daily['doy'] = day
+        daily['volume'] = volume
+
+        ### Replace caches of older versions of the file
+        os.makedirs(cachedir,exist_ok=True)
+        tempfile = cachefile + '.%s.tmp.npy' % os.getpid()
+        np.save(tempfile,daily)
+        os.replace(tempfile,cachefile)
+        for oldfile in glob.glob(os.path.join(cachedir,'%s.*.npy' % name)):
+            if oldfile != cachefile and '.tmp.' not in oldfile:
+                os.remove(oldfile)
+
+    daily = np.load(cachefile,mmap_mode='r')
+
+    print('Completed: Read PIOMAS daily volume (%s - %s)!' \
+          % (daily['year'][0],daily['year'][-1]))
+
+    return daily['year'],daily['doy'],daily['volume']
@@ -0,0 +1,145 @@
+"""
+Functions read the NSIDC Sea Ice Index regional daily extent workbook. The
+workbook is downloaded once (read_RemoteData.py) and all regional sheets
+are parsed in one pass. Results are stored in a compact float32 cache
+[region,year,doy] and later runs only parse the newest years, so revisions
+of the latest stored year replace the cached values.
+
+Notes
+-----
+    Source : ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/seaice_analysis/
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+Usage
+-----
+    [1] readRegionalExtent(regions,cachefile,url)
+"""
+
+### Regional workbook and default cache
+URL = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/seaice_analysis/' \
+      'N_Sea_Ice_Index_Regional_Daily_Data_G02135_v3.0.xlsx'
+CACHEFILE = './Data/cache/NSIDC_regional_extent.npz'
+REGIONS = ['Barents','Beaufort','Bering','CanadianArchipelago','Chukchi',
+           'East-Siberian','Greenland','Hudson','Kara','Laptev']
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _columnYear(name):
+    """
+    Returns year of a workbook column header, None for other columns
+    """
+
+    try:
+        year = int(float(str(name).strip()))
+    except ValueError:
+        return None
+    if 1900 <= year <= 2200:
+        return year
+    return None
+
+def _parseSheets(filename,regions,firstyear):
+    """
+    Parses all regional sheets of the workbook in one pass. Only year
+    columns >= firstyear are read (all years if None).
+    """
+
+    ### Import modules
+    import numpy as np
+    import pandas as pd
+
+    def usecol(name):
+        year = _columnYear(name)
+        return year is not None and (firstyear is None or year >= firstyear)
+
+    sheets = ['%s-Extent-km^2' % region for region in regions]
+    frames = pd.read_excel(filename,sheet_name=sheets,header=1,
+                           usecols=usecol)
+
+    years = np.array([_columnYear(name) for name in frames[sheets[0]].columns],
+                     dtype='int16')
+    extent = np.stack([np.asarray(frames[sheet].values,dtype='float32').T
+                       for sheet in sheets])
+
+    return years,extent
+
+def readRegionalExtent(regions=REGIONS,cachefile=CACHEFILE,url=URL):
+    """
+    Function reads regional Arctic sea ice extent from the NSIDC workbook
+
+    Parameters
+    ----------
+    regions : list of strings
+        regional seas (sheet names without '-Extent-km^2')
+    cachefile : string
+        compact .npz cache of the parsed workbook
+    url : string
+        location of the regional workbook
+
+    Returns
+    -------
+    years : 1d array
+        years of the record
+    extent : 3d array [region,year,doy]
+        sea ice extent (km^2), float32
+
+    Usage
+    -----
+    years,extent = readRegionalExtent(regions,cachefile,url)
+    """
+
+    print('\n>>> Using readRegionalExtent function!')
+
+    ### Import modules
+    import numpy as np
+    import os
+    import read_RemoteData as RD
+
+    regions = list(regions)
+    filename = RD.fetchFile(url)
+    mtime = os.path.getmtime(filename)
+
+    ### Load previous cache if it holds the same regions
+    years,extent = None,None
+    if os.path.exists(cachefile):
+        with np.load(cachefile) as cache:
+            if list(cache['regions']) == regions:
+                years = cache['years']
+                extent = cache['extent']
+                if float(cache['mtime']) == mtime:
+                    print('*Completed: Read regional extent from cache!')
+                    return years,extent
+
+    if years is None:
+        ### First time, parse every sheet and year in one pass
+        print('Parsing all regional sheets ---> %s' % filename)
+        years,extent = _parseSheets(filename,regions,None)
+    else:
+        ### Only parse the most recent stored year onwards and append
+        print('Updating days since %s' % years[-1])
+        newyears,newextent = _parseSheets(filename,regions,years[-1])
+        allyears = np.union1d(years,newyears).astype('int16')
+        ndays = max(extent.shape[2],newextent.shape[2])
+        merged = np.full((len(regions),allyears.size,ndays),np.nan,
+                         dtype='float32')
+        merged[:,np.searchsorted(allyears,years),:extent.shape[2]] = extent
+        newq = np.searchsorted(allyears,newyears)
+        old = merged[:,newq,:newextent.shape[2]]
+        ### Revised values replace the stored ones, keep old where empty
+        merged[:,newq,:newextent.shape[2]] = np.where(np.isnan(newextent),
+                                                      old,newextent)
+        years,extent = allyears,merged
+
+    ### Save compact cache
+    directory = os.path.dirname(cachefile)
+    if directory:
+        os.makedirs(directory,exist_ok=True)
+    tempfile = cachefile + '.%s.tmp.npz' % os.getpid()
+    np.savez(tempfile,years=years,extent=extent,regions=np.array(regions),
+             mtime=np.array(mtime))
+    os.replace(tempfile,cachefile)
+
+    print('*Completed: Read regional extent for %s regions!' % len(regions))
+    return years,extent
@@ -0,0 +1,389 @@
+"""
+Functions download remote data sets (http, https, ftp, file) into a local
+on-disk cache keyed by url. Cached copies are reused for a time-to-live
+and then revalidated with ETag/Last-Modified (http) or MDTM (ftp) before
+downloading again. The cache is bounded in size by least recently used
+eviction.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    The cache directory defaults to ./Data/cache/ and can be changed with
+    the ICEVARFIGS_CACHE environment variable. ICEVARFIGS_CACHE_TTL (s) and
+    ICEVARFIGS_CACHE_MAXSIZE (bytes) change the defaults below.
+
+    Threads of one process that fetch the same url wait for each other,
+    and downloads go to unique temporary files before replacing the copy.
+
+Usage
+-----
+    [1] fetchFile(url,cachedir,ttl,maxsize)
+    [2] openURL(url,cachedir,ttl,maxsize)
+    [3] evictCache(cachedir,maxsize)
+"""
+
+### Default cache settings
+CACHEDIR = './Data/cache/'
+TTL = 3600.
+MAXSIZE = 2*1024**3
+
+### One lock per url for fetches in threads of a process
+_locks = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _cacheSettings(cachedir,ttl,maxsize):
+    """
+    Fills in cache settings from environment variables or defaults
+    """
+
+    ### Import modules
+    import os
+
+    if cachedir is None:
+        cachedir = os.environ.get('ICEVARFIGS_CACHE',CACHEDIR)
+    if ttl is None:
+        ttl = float(os.environ.get('ICEVARFIGS_CACHE_TTL',TTL))
+    if maxsize is None:
+        maxsize = int(os.environ.get('ICEVARFIGS_CACHE_MAXSIZE',MAXSIZE))
+    os.makedirs(cachedir,exist_ok=True)
+
+    return cachedir,ttl,maxsize
+
+def _cachePaths(cachedir,url):
+    """
+    Returns data and metadata file names for a url
+    """
+
+    ### Import modules
+    import hashlib
+    import os
+
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    name = os.path.basename(url.split('?')[0]) or 'index'
+    datafile = os.path.join(cachedir,key + '_' + name)
+    metafile = os.path.join(cachedir,key + '.json')
+
+    return datafile,metafile
+
+def _readMeta(metafile):
+    """
+    Reads cache metadata, empty dictionary if missing or corrupt
+    """
+
+    ### Import modules
+    import json
+
+    try:
+        with open(metafile,'r') as f:
+            return json.load(f)
+    except (OSError,ValueError):
+        return {}
+
+def _writeMeta(metafile,meta):
+    """
+    Writes cache metadata atomically
+    """
+
+    ### Import modules
+    import json
+    import os
+
+    fd,temp = _tempFile(metafile)
+    try:
+        with os.fdopen(fd,'w') as f:
+            json.dump(meta,f)
+        os.replace(temp,metafile)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+def _tempFile(filename):
+    """
+    Returns an open descriptor and name of a unique temporary file next to
+    filename (unique across processes and threads)
+    """
+
+    ### Import modules
+    import os
+    import tempfile
+
+    return tempfile.mkstemp(suffix='.tmp',
+                            prefix='.' + os.path.basename(filename) + '.',
+                            dir=os.path.dirname(filename) or '.')
+
+def _writeStream(stream,datafile,chunksize=1024*1024):
+    """
+    Copies a file-like stream to the data file in chunks (atomic replace)
+    """
+
+    ### Import modules
+    import os
+
+    fd,temp = _tempFile(datafile)
+    try:
+        with os.fdopen(fd,'wb') as f:
+            while True:
+                chunk = stream.read(chunksize)
+                if not chunk:
+                    break
+                f.write(chunk)
+        os.replace(temp,datafile)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+    return os.path.getsize(datafile)
+
+def _fetchURL(url,datafile,meta):
+    """
+    Conditional GET for http/https/file urls. Returns updated metadata and
+    whether the remote file changed.
+    """
+
+    ### Import modules
+    import urllib.request
+    import urllib.error
+
+    request = urllib.request.Request(url)
+    if meta.get('etag'):
+        request.add_header('If-None-Match',meta['etag'])
+    if meta.get('lastmodified'):
+        request.add_header('If-Modified-Since',meta['lastmodified'])
+
+    try:
+        response = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return meta,False
+        raise
+
+    with response:
+        headers = response.headers
+        etag = headers.get('ETag')
+        lastmodified = headers.get('Last-Modified')
+        length = headers.get('Content-Length')
+
+        ### Servers without conditional GET (file://) compare validators
+        if meta and ((etag and etag == meta.get('etag')) or \
+                (lastmodified and lastmodified == meta.get('lastmodified') \
+                 and length == meta.get('length'))):
+            return meta,False
+
+        size = _writeStream(response,datafile)
+
+    meta = dict(meta,etag=etag,lastmodified=lastmodified,length=length,
+                size=size)
+    return meta,True
+
+def _fetchFTP(url,datafile,meta):
+    """
+    MDTM revalidation and download for ftp urls. Returns updated metadata
+    and whether the remote file changed.
+    """
+
+    ### Import modules
+    import ftplib
+    import urllib.parse
+    import urllib.request
+
+    parts = urllib.parse.urlparse(url)
+    path = urllib.parse.unquote(parts.path)
+    try:
+        ftp = ftplib.FTP()
+        ftp.connect(parts.hostname,parts.port or 21,timeout=60)
+        ftp.login(parts.username or 'anonymous',parts.password or '')
+        try:
+            mdtm = ftp.sendcmd('MDTM ' + path).split()[-1]
+        except ftplib.error_perm:
+            mdtm = None
+        if mdtm is not None and meta and mdtm == meta.get('mdtm'):
+            ftp.quit()
+            return meta,False
+
+        ftp.voidcmd('TYPE I')
+        conn = ftp.transfercmd('RETR ' + path)
+        with conn.makefile('rb') as stream:
+            size = _writeStream(stream,datafile)
+        conn.close()
+        ftp.voidresp()
+        ftp.quit()
+    except ftplib.all_errors as e:
+        ### Fall back on urllib (e.g. proxies) without revalidation
+        print('FTP revalidation failed (%s), downloading directly' % e)
+        with urllib.request.urlopen(url) as stream:
+            size = _writeStream(stream,datafile)
+        mdtm = None
+
+    meta = dict(meta,mdtm=mdtm,size=size)
+    return meta,True
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def fetchFile(url,cachedir=None,ttl=None,maxsize=None):
+    """
+    Function returns the path of a locally cached copy of a remote file.
+    Copies younger than ttl are used directly, older copies are revalidated
+    and only downloaded again if the remote file changed.
+
+    Parameters
+    ----------
+    url : string
+        http, https, ftp or file url
+    cachedir : string
+        cache directory (default ./Data/cache/)
+    ttl : float
+        seconds before a cached copy is revalidated (default 3600)
+    maxsize : integer
+        maximum size of the cache in bytes (default 2 GB)
+
+    Returns
+    -------
+    datafile : string
+        path to cached file
+
+    Usage
+    -----
+    datafile = fetchFile(url,cachedir,ttl,maxsize)
+    """
+
+    ### Import modules
+    import threading
+
+    cachedir,ttl,maxsize = _cacheSettings(cachedir,ttl,maxsize)
+
+    ### Threads fetching the same url wait for the first download
+    with _locks.setdefault(url,threading.Lock()):
+        datafile = _fetchCached(url,cachedir,ttl)
+    evictCache(cachedir,maxsize)
+
+    return datafile
+
+def _fetchCached(url,cachedir,ttl):
+    """
+    Returns the cached copy of a url, downloaded or revalidated if needed
+    """
+
+    ### Import modules
+    import os
+    import time
+
+    datafile,metafile = _cachePaths(cachedir,url)
+    meta = _readMeta(metafile)
+    if not os.path.exists(datafile):
+        meta = {}
+
+    now = time.time()
+    if meta and now - meta.get('fetched',0.) < ttl:
+        print('Cache hit ---> %s' % url)
+    else:
+        try:
+            if url.startswith('ftp://'):
+                meta,changed = _fetchFTP(url,datafile,meta)
+            else:
+                meta,changed = _fetchURL(url,datafile,meta)
+        except OSError as e:
+            if not meta:
+                raise
+            print('Could not revalidate %s (%s), using cached copy' % (url,e))
+            changed = False
+        if changed:
+            print('Downloaded ---> %s' % url)
+        else:
+            print('Cache revalidated ---> %s' % url)
+        meta['url'] = url
+        meta['fetched'] = now
+
+    meta['accessed'] = now
+    _writeMeta(metafile,meta)
+
+    return datafile
+
+def openURL(url,cachedir=None,ttl=None,maxsize=None):
+    """
+    Function opens a cached copy of a remote file in binary mode. Drop-in
+    replacement for urllib.request.urlopen(url) when reading data sets.
+
+    Parameters
+    ----------
+    url : string
+        http, https, ftp or file url
+    cachedir : string
+        cache directory (default ./Data/cache/)
+    ttl : float
+        seconds before a cached copy is revalidated (default 3600)
+    maxsize : integer
+        maximum size of the cache in bytes (default 2 GB)
+
+    Returns
+    -------
+    f : file object
+        binary file opened for reading
+
+    Usage
+    -----
+    f = openURL(url,cachedir,ttl,maxsize)
+    """
+
+    return open(fetchFile(url,cachedir,ttl,maxsize),'rb')
+
+def evictCache(cachedir,maxsize):
+    """
+    Function removes least recently used files until the cache is smaller
+    than maxsize
+
+    Parameters
+    ----------
+    cachedir : string
+        cache directory
+    maxsize : integer
+        maximum size of the cache in bytes
+
+    Returns
+    -------
+    removed : list
+        urls removed from the cache
+
+    Usage
+    -----
+    removed = evictCache(cachedir,maxsize)
+    """
+
+    ### Import modules
+    import glob
+    import os
+
+    entries = []
+    total = 0
+    for metafile in glob.glob(os.path.join(cachedir,'*.json')):
+        meta = _readMeta(metafile)
+        if 'url' not in meta:
+            continue
+        datafile = _cachePaths(cachedir,meta['url'])[0]
+        if not os.path.exists(datafile):
+            continue
+        size = os.path.getsize(datafile)
+        total += size
+        entries.append((meta.get('accessed',0.),size,datafile,metafile,
+                        meta['url']))
+
+    removed = []
+    for accessed,size,datafile,metafile,url in sorted(entries):
+        if total <= maxsize or len(entries) - len(removed) <= 1:
+            break
+        for filename in (datafile,metafile):
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+        total -= size
+        removed.append(url)
+        print('Evicted from cache ---> %s' % url)
+
+    return removed
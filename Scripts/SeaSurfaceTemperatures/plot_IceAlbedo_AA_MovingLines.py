@@ -10,8 +10,11 @@ Date      : 20 August 2018
 import numpy as np
 import datetime
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import math 
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
+import plot_AnimationWriter as AW
 
 ### Time
 now = datetime.datetime.now()
@@ -52,14 +55,7 @@ print('\nCompleted: Read AA data!')
 ############################################################################
 ############################################################################
 ### Create animation
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='darkgrey')
-plt.rc('xtick',color='darkgrey')
-plt.rc('ytick',color='darkgrey')
-plt.rc('axes',labelcolor='darkgrey')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle('darkgrey')
 
 fig = plt.figure(figsize=(9,4))
 
@@ -67,27 +63,11 @@ fig = plt.figure(figsize=(9,4))
 ax = plt.subplot(132)  
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-
 plt.text(1979,10.03,r'\textbf{SEA-ICE EXTENT}',color='deepskyblue',alpha=0.5,ha='left',
         fontsize=11,rotation=0,va='center',zorder=1)
         
 ax.tick_params('both',length=5.5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none') 
 ax.spines['left'].set_linewidth(2)
@@ -126,24 +106,8 @@ plt.text(2001,13.1,r'\textbf{ARCTIC AMPLIFICATION}',fontsize=32,color='w',
 ax = plt.subplot(131)  
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-        
 ax.tick_params('both',length=5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none') 
 ax.spines['left'].set_linewidth(2)
@@ -182,24 +146,8 @@ plt.text(1974.2,3.35,r'\textbf{[$\bf{^\circ}$C]}',color='darkgrey',
 ax = plt.subplot(133)  
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-        
 ax.tick_params('both',length=5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none') 
 ax.spines['left'].set_linewidth(2)
@@ -245,12 +193,10 @@ def update(num,years,eq,tq,sq,ant,gre,sst,bar):
     sst.axes.axis([1979,2019,-0.5,0.75])
     return bar,
 
-ani = animation.FuncAnimation(fig,update,70,fargs=[years,
-                              eq,tq,sq,ant,gre,sst,sst],interval=0.01,blit=True)
-
 ### Save figure
 #plt.savefig(directoryfigure + 'IceAlbedo_AA_moving.png',dpi=220)
-ani.save(directoryfigure + 'IceAlbedo_AA_moving.gif',dpi=220,writer='imagemagick')
+AW.saveAnimation(fig,update,70,directoryfigure + 'IceAlbedo_AA_moving.gif',
+                 [ant,gre,sst],fargs=[years,eq,tq,sq,ant,gre,sst,sst],dpi=220)
 
 print('\nCompleted: Script done!')
                      
\ No newline at end of file
@@ -6,129 +6,92 @@ Author    : Zachary M. Labe
 Date      : 22 July 2017
 """
 
-from netCDF4 import Dataset
 import matplotlib.pyplot as plt
-from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
+from mpl_toolkits.basemap import addcyclic, shiftgrid
 import numpy as np
 import datetime
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import calc_MapCache as MC
 import nclcmaps as ncm
-
-### Read in data files from server
-directoryfigure = './Figures/'
-directorydata = './Data/'
-
-### Define constants
-now = datetime.datetime.now()
-month = now.month
-monthsq = [r'Jan',r'Feb',r'Mar',r'Apr',r'May',r'Jun',r'Jul',
-          r'Aug',r'Sep',r'Oct',r'Nov',r'Dec',r'Jan'] 
-
-### Input selected years and months!
-years = np.arange(1992,2016+1,1)
-months = np.arange(1,12+1,1)
-
-### Read in data 
-sst = np.empty((years.shape[0],months.shape[0],89,180))
-for i in range(years.shape[0]):
-    for j in range(months.shape[0]):
-        filename = directorydata + 'ersst.v5.%s%02d.nc' % (years[i],
-                                                           months[j])
-        
-        data = Dataset(filename)
-        lats = data.variables['lat'][:]
-        lons = data.variables['lon'][:]
-        sst[i,j,:,:] = data.variables['sst'][0,0,:,:]
-        data.close()
-    
-    print('Completed: Read %s year!' % years[i])
-
-### Locate missing data
-sst[np.where(sst == -999)] = np.nan
-
-### Reshape data
-sst = np.reshape(sst,(300,89,180))
-
-### Create list of years for plotting 
-yearsqq = np.repeat(years,12)
+import plot_DarkStyle as DS
+import plot_FrameSequence as FS
+import read_ERSST as RE
 
 ###############################################################################
 ###############################################################################
 ###############################################################################
 ### Plot figure
 
-### Define parameters (dark)
-def setcolor(x, color):
-     for m in x:
-         for t in x[m][1]:
-             t.set_color(color)
-
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='k')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
-
 ### Select map type
 style = 'global'
+    
+### Colorbar limits
+barlim = np.arange(0,31,5)
+levels = np.arange(-1.8,31.1,1)
+
+def cyclicGrid(var,lons):
+    """
+    Makes the grid continuous and centered on 0E
+    """
+
+    var,lons_cyclic = addcyclic(var,lons)
+    var,lons_cyclic = shiftgrid(180.,var,lons_cyclic,start=False)
+    return var,lons_cyclic
+
+def initFrame(sst,lats,lons,yearsqq):
+    """
+    Builds the map, colorbar and labels once per worker
+    """
+
+    ### Define parameters (dark)
+    DS.setDarkStyle(edgecolor='k')
+
+    if style == 'ortho':
+        m = MC.cachedBasemap(projection='ortho',lon_0=-90,
+                             lat_0=70,resolution='l',round=True)
+    elif style == 'polar':
+        m = MC.cachedBasemap(projection='npstere',boundinglat=67,lon_0=270,
+                             resolution='l',round=True)
+    elif style == 'global':
+        m = MC.cachedBasemap(projection='moll',lon_0=0,resolution='l',
+                             area_thresh=10000)
 
-if style == 'ortho':
-    m = Basemap(projection='ortho',lon_0=-90,
-                lat_0=70,resolution='l',round=True)
-elif style == 'polar':
-    m = Basemap(projection='npstere',boundinglat=67,lon_0=270,resolution='l',round =True)
-elif style == 'global':
-    m = Basemap(projection='moll',lon_0=0,resolution='l',area_thresh=10000)
-
-### Begin loop of years/months
-for i in range(sst.shape[0]):
     fig = plt.figure()
     ax = plt.subplot(111)
-    for txt in fig.texts:
-        txt.set_visible(False)
-    
-    var = sst[i,:,:]
 
     m.drawmapboundary(fill_color='k')
-    m.drawcoastlines(color='k',linewidth=0.4)
-    
-    ### Colorbar limits
-    barlim = np.arange(0,31,5)
-    
-    ### Make the plot continuous
-    var, lons_cyclic = addcyclic(var, lons)
-    var, lons_cyclic = shiftgrid(180., var, lons_cyclic, start=False)
-    lon2d, lat2d = np.meshgrid(lons_cyclic, lats)
-    x, y = m(lon2d, lat2d)
-    
-    cs = plt.contourf(x,y,var,np.arange(-1.8,31.1,1),
-                    extend='max')
-                    
-    cmap = ncm.cmap('MPL_gnuplot')            
-    cs.set_cmap(cmap)
-    t = plt.annotate(r'\textbf{%s}' % yearsqq[i],textcoords='axes fraction',
+    m.drawcoastlines(color='k',linewidth=0.4,zorder=1)
+
+    ### Projected grid of the continuous map
+    var,lons_cyclic = cyclicGrid(sst[0],lons)
+    x,y = MC.projectGrid(m,lons_cyclic,lats)
+
+    cmap = ncm.cmap('MPL_gnuplot')
+    cs = ax.contourf(x,y,var,levels,extend='max',cmap=cmap,zorder=2)
+
+    t = plt.annotate(r'\textbf{%s}' % yearsqq[0],textcoords='axes fraction',
             xy=(0,0), xytext=(0.34,1.03),
             fontsize=50,color='w',alpha=0.6)
             
-    t1 = plt.annotate(r'\textbf{GRAPHIC}: Zachary Labe (@ZLabe)',
+    plt.annotate(r'\textbf{GRAPHIC}: Zachary Labe (@ZLabe)',
                  textcoords='axes fraction',
             xy=(0,0), xytext=(0.02,-0.167),
         fontsize=4.5,color='w',alpha=0.6)
-    t2 = plt.annotate(r'\textbf{SOURCE}: https://www1.ncdc.noaa.gov/',
+    plt.annotate(r'\textbf{SOURCE}: https://www1.ncdc.noaa.gov/',
                  textcoords='axes fraction',
             xy=(0,0), xytext=(0.02,-0.197),
         fontsize=4.5,color='w',alpha=0.6)
-    t3 = plt.annotate(r'\textbf{DATA}: NOAA ERSSTv5, Huang et al. (2017)',
+    plt.annotate(r'\textbf{DATA}: NOAA ERSSTv5, Huang et al. (2017)',
              textcoords='axes fraction',
              xy=(0,0), xytext=(0.02,-0.227),
                 fontsize=4.5,color='w',alpha=0.6)
-    t4 = plt.annotate(r'\textbf{SEA SURFACE TEMPERATURES}',
+    plt.annotate(r'\textbf{SEA SURFACE TEMPERATURES}',
          textcoords='axes fraction',
          xy=(0,0), xytext=(0.24,-0.036),fontsize=13,color='w',alpha=0.6)
                 
-    m.fillcontinents(color='k')
+    ### Land above the SST contours
+    m.fillcontinents(color='k',zorder=3)
                 
     cbar = plt.colorbar(cs,drawedges=False,orientation='horizontal',
                         pad = 0.04,fraction=0.035)
@@ -140,21 +103,56 @@ for i in range(sst.shape[0]):
     cbar.ax.tick_params(labelsize=6) 
     
     plt.subplots_adjust(bottom=0.2)
-    
-    ### Save figure to create animation using ImageMagick
-    if i < 10:        
-        plt.savefig(directoryfigure + 'sstq_00%s.png' % (i),
-                    dpi=200)
-    elif i < 100:
-        plt.savefig(directoryfigure + 'sstq_0%s.png' % (i),
-            dpi=200)
+
+    state = {'ax' : ax,'x' : x,'y' : y,'cs' : cs,'cmap' : cmap,'t' : t,
+             'sst' : sst,'lons' : lons,'yearsqq' : yearsqq}
+    return fig,state
+
+def drawFrame(state,i):
+    """
+    Replaces the SST contours and year label for month i
+    """
+
+    ### Remove only the data artist of the previous frame
+    cs = state['cs']
+    if hasattr(cs,'remove'):
+        cs.remove()
     else:
-        plt.savefig(directoryfigure + 'sstq_%s.png' % (i),
-                    dpi=200)
-        
-    ### Remove text for each figure
-    t.remove()
-    t1.remove()
-    t2.remove()
-    t3.remove()
-    t4.remove()
\ No newline at end of file
+        for collection in cs.collections:
+            collection.remove()
+
+    var,_ = cyclicGrid(state['sst'][i],state['lons'])
+    state['cs'] = state['ax'].contourf(state['x'],state['y'],var,levels,
+                                       extend='max',cmap=state['cmap'],
+                                       zorder=2)
+    state['t'].set_text(r'\textbf{%s}' % state['yearsqq'][i])
+
+if __name__ == '__main__':
+    ### Read in data files from server
+    directoryfigure = './Figures/'
+    directorydata = './Data/'
+
+    ### Define constants
+    now = datetime.datetime.now()
+    month = now.month
+    monthsq = [r'Jan',r'Feb',r'Mar',r'Apr',r'May',r'Jun',r'Jul',
+              r'Aug',r'Sep',r'Oct',r'Nov',r'Dec',r'Jan'] 
+
+    ### Input selected years and months!
+    years = np.arange(1992,2016+1,1)
+    months = np.arange(1,12+1,1)
+
+    ### Read in data (monthly files are consolidated into one store)
+    lats,lons,sst = RE.readERSST(directorydata,years,months)
+
+    ### Reshape data
+    sst = np.reshape(sst,(-1,lats.shape[0],lons.shape[0]))
+
+    ### Create list of years for plotting 
+    yearsqq = np.repeat(years,12)
+
+    ### Render months in parallel to create animation using ImageMagick
+    ### (sstq_000.png, sstq_001.png, ...)
+    FS.renderFrames(initFrame,drawFrame,sst.shape[0],
+                    directoryfigure + 'sstq',
+                    initargs=(sst,lats,lons,yearsqq),dpi=200)
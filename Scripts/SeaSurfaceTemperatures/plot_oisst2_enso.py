@@ -6,75 +6,26 @@ Author : Zachary M. Labe
 
 """
 
-from mpl_toolkits.basemap import Basemap
 import numpy as np
 import matplotlib.pyplot as plt
 from netCDF4 import Dataset
 import datetime
 import cmocean
-
-### Directory and time
-directoryfigure = './Figures/'
-directorydata = './Data/'
-now = datetime.datetime.now()
-currentmn = str(now.month)
-currentdy = str(now.day)
-currentyr = str(now.year)
-currenttime = currentmn + '_' + currentdy + '_' + currentyr
-currentdoy = now.timetuple().tm_yday
-
-data = Dataset(directorydata + 'sst.day.anom.2015.v2.nc')
-sst15 = data.variables['anom'][180:]
-data.close()
-
-data = Dataset(directorydata + 'sst.day.anom.2016.nc')
-sst16 = data.variables['anom'][:]
-data.close()
-
-data = Dataset(directorydata + 'sst.day.anom.2017.nc')
-sst17 = data.variables['anom'][:]
-data.close()
-
-data = Dataset(directorydata + 'sst.day.anom.2018.nc')
-sst18 = data.variables['anom'][:]
-lat = data.variables['lat'][:]
-lon = data.variables['lon'][:]
-data.close()
-
-lon2,lat2 = np.meshgrid(lon,lat)
-
-sstnn = np.append(sst15,sst16,axis=0)
-sstn = np.append(sstnn,sst17,axis=0)
-sst = np.append(sstn,sst18,axis=0)
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import calc_MapCache as MC
+import plot_DarkStyle as DS
+import plot_FrameSequence as FS
 
 def groupedAvg(myArray, N):
     result = np.cumsum(myArray, 0)[N-1::N]/float(N)
     result[1:] = result[1:] - result[:-1]
     return result
-smooth = groupedAvg(sst,10) # 10-day mean
-
-year15 = np.repeat(np.array([2015]),18)
-year16 = np.repeat(np.array([2016]),36)
-year17 = np.repeat(np.array([2017]),36)
-year18 = np.repeat(np.array([2018]),9)
-
-year1 = np.append(year15,year16)
-year2 = np.append(year1,year17)
-years = np.append(year2,year18)
 
 ###########################################################################
 ###########################################################################
 ###########################################################################
 ### Create plot
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='dimgrey')
-plt.rc('xtick',color='dimgrey')
-plt.rc('ytick',color='dimgrey')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
-
 def plot_rec(bmap, lower_left, upper_left, lower_right, upper_right):
     xs = [lower_left[0], upper_left[0],
           upper_right[0],lower_right[0],
@@ -126,21 +77,33 @@ lower_right4= (urcrnrlon, llcrnrlat)
 upper_left4 = (llcrnrlon, urcrnrlat)
 upper_right4= (urcrnrlon, urcrnrlat)
 
-barlim=np.arange(-3,4,3)
-for i in range(smooth.shape[0]):
+barlim = np.arange(-3,4,3)
+levels = np.arange(-3,3.02,0.1)
+
+def initFrame(lon,lat,smooth,years):
+    """
+    Builds the map, colorbar, ENSO boxes and labels once per worker
+    """
+
+    DS.setDarkStyle('dimgrey',labelcolor='white')
 
     fig = plt.figure(figsize=(9,5))
     ax = plt.subplot(111)
     
-    m = Basemap(projection='merc',llcrnrlat=-17,urcrnrlat=17,\
-                llcrnrlon=180,urcrnrlon=290,resolution='l')
+    m = MC.cachedBasemap(projection='merc',llcrnrlat=-17,urcrnrlat=17,
+                         llcrnrlon=180,urcrnrlon=290,resolution='l')
     m.drawcoastlines()
     m.fillcontinents(color='k',lake_color='k')
     m.drawmapboundary(fill_color='k')
+
+    ### Shift the 0-360E grid to the map longitudes, as latlon=True did,
+    ### so the seam is not inside the map
+    lon2,lat2 = np.meshgrid(lon,lat)
+    lonshift,var = m.shiftdata(lon2,smooth[0])
+    x,y = MC.projectGrid(m,lonshift,lat2)
     
-    cs=m.contourf(lon2,lat2,smooth[i],np.arange(-3,3.02,0.1),latlon=True,
-                  extend='both')
-    cs.set_cmap(cmocean.cm.balance)
+    cs = m.contourf(x,y,var,levels,extend='both',
+                    cmap=cmocean.cm.balance,ax=ax)
     
     cbar = plt.colorbar(cs,drawedges=False,orientation='horizontal',
                         pad = 0.04,fraction=0.047,extend='both')
@@ -148,8 +111,6 @@ for i in range(smooth.shape[0]):
     cbar.set_ticklabels(list(map(str,barlim)))  
     cbar.ax.tick_params(axis='x', size=.001)
     cbar.ax.tick_params(labelsize=13) 
-    cbar.set_label(r'\textbf{%s}' % years[i],color='darkgrey',
-                   fontsize=30)
     
     ### Draw ENSO boxes
     plot_rec(m, lower_left1, upper_left1, lower_right1, upper_right1)
@@ -174,32 +135,76 @@ for i in range(smooth.shape[0]):
                  fontsize=20,color='darkgrey',ha='left',va='center')
     
     plt.subplots_adjust(bottom=0.2)
-    
-    if i < 10:        
-        plt.savefig(directoryfigure + 'sstq_00%s.png' % (i),
-                    dpi=170)
-    elif i < 100:
-        plt.savefig(directoryfigure + 'sstq_0%s.png' % (i),
-            dpi=170)
-    elif i==98:
-        plt.savefig(directoryfigure + 'sstq_991.png',
-            dpi=170)
-        plt.savefig(directoryfigure + 'sstq_992.png',
-            dpi=170)
-        plt.savefig(directoryfigure + 'sstq_993.png',
-            dpi=170)
-        plt.savefig(directoryfigure + 'sstq_994.png',
-            dpi=170)    
-        plt.savefig(directoryfigure + 'sstq_995.png',
-            dpi=170)  
-        plt.savefig(directoryfigure + 'sstq_996.png',
-            dpi=170)  
-        plt.savefig(directoryfigure + 'sstq_997.png',
-            dpi=170) 
-        plt.savefig(directoryfigure + 'sstq_998.png',
-            dpi=170) 
-        plt.savefig(directoryfigure + 'sstq_999.png',
-            dpi=170)                 
+
+    state = {'ax' : ax,'m' : m,'x' : x,'y' : y,'lon2' : lon2,'cs' : cs,
+             'cbar' : cbar,'smooth' : smooth,'years' : years}
+    return fig,state
+
+def drawFrame(state,i):
+    """
+    Replaces the SST contours and year label for frame i
+    """
+
+    ### Remove only the data artist of the previous frame
+    cs = state['cs']
+    if hasattr(cs,'remove'):
+        cs.remove()
     else:
-        plt.savefig(directoryfigure + 'sstq_%s.png' % (i),
+        for collection in cs.collections:
+            collection.remove()
+
+    _,var = state['m'].shiftdata(state['lon2'],state['smooth'][i])
+    state['cs'] = state['m'].contourf(state['x'],state['y'],var,levels,
+                                      extend='both',cmap=cmocean.cm.balance,
+                                      ax=state['ax'])
+    state['cbar'].set_label(r'\textbf{%s}' % state['years'][i],
+                            color='darkgrey',fontsize=30)
+
+if __name__ == '__main__':
+    ### Directory and time
+    directoryfigure = './Figures/'
+    directorydata = './Data/'
+    now = datetime.datetime.now()
+    currentmn = str(now.month)
+    currentdy = str(now.day)
+    currentyr = str(now.year)
+    currenttime = currentmn + '_' + currentdy + '_' + currentyr
+    currentdoy = now.timetuple().tm_yday
+
+    data = Dataset(directorydata + 'sst.day.anom.2015.v2.nc')
+    sst15 = data.variables['anom'][180:]
+    data.close()
+
+    data = Dataset(directorydata + 'sst.day.anom.2016.nc')
+    sst16 = data.variables['anom'][:]
+    data.close()
+
+    data = Dataset(directorydata + 'sst.day.anom.2017.nc')
+    sst17 = data.variables['anom'][:]
+    data.close()
+
+    data = Dataset(directorydata + 'sst.day.anom.2018.nc')
+    sst18 = data.variables['anom'][:]
+    lat = data.variables['lat'][:]
+    lon = data.variables['lon'][:]
+    data.close()
+
+    sstnn = np.append(sst15,sst16,axis=0)
+    sstn = np.append(sstnn,sst17,axis=0)
+    sst = np.append(sstn,sst18,axis=0)
+
+    smooth = groupedAvg(sst,10) # 10-day mean
+
+    year15 = np.repeat(np.array([2015]),18)
+    year16 = np.repeat(np.array([2016]),36)
+    year17 = np.repeat(np.array([2017]),36)
+    year18 = np.repeat(np.array([2018]),9)
+
+    year1 = np.append(year15,year16)
+    year2 = np.append(year1,year17)
+    years = np.append(year2,year18)
+
+    ### Render 10-day means in parallel (sstq_000.png, sstq_001.png, ...)
+    FS.renderFrames(initFrame,drawFrame,smooth.shape[0],
+                    directoryfigure + 'sstq',initargs=(lon,lat,smooth,years),
                     dpi=170)
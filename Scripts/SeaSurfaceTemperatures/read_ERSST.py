@@ -0,0 +1,295 @@
+"""
+Functions read monthly NOAA ERSSTv5 sea surface temperatures. The monthly
+ersst.v5.YYYYMM.nc files are consolidated once into a single chunked and
+compressed float32 netCDF4 store [time,lat,lon] (one chunk per 12 months),
+with the first build read in parallel. Later updates only append months
+that are newer than the store, so scripts open one file instead of
+hundreds.
+
+Notes
+-----
+    Source : https://www1.ncdc.noaa.gov/pub/data/cmb/ersst/v5/netcdf/
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    Missing values (-999) are stored as NaN. If an older month is added to
+    the directory later, the store is rebuilt.
+
+Usage
+-----
+    [1] ersstFiles(directory)
+    [2] updateERSST(directory,storefile,nprocs)
+    [3] readERSST(directory,years,months,storefile,update)
+"""
+
+### Monthly files and consolidated store
+FILEPATTERN = 'ersst.v5.[0-9][0-9][0-9][0-9][0-9][0-9].nc'
+STOREFILE = './Data/cache/ersst.v5.monthly.nc'
+MISSING = -999.
+
+### Compression of the store
+COMPLEVEL = 4
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def ersstFiles(directory):
+    """
+    Function lists the monthly ERSSTv5 files of a directory
+
+    Parameters
+    ----------
+    directory : string
+        working directory for stored ERSSTv5 files
+
+    Returns
+    -------
+    files : dictionary
+        date (yyyymm integer) : file name, sorted by date
+
+    Usage
+    -----
+    files = ersstFiles(directory)
+    """
+
+    ### Import modules
+    import glob
+    import os
+
+    files = {}
+    for filename in glob.glob(os.path.join(directory,FILEPATTERN)):
+        files[int(os.path.basename(filename)[9:15])] = filename
+
+    return dict(sorted(files.items()))
+
+def _readMonth(filename):
+    """
+    Returns latitude, longitude and float32 SST (NaN missing) of one file
+    """
+
+    ### Import modules
+    from netCDF4 import Dataset
+    import numpy as np
+
+    data = Dataset(filename)
+    data.set_auto_mask(False)
+    lats = data.variables['lat'][:]
+    lons = data.variables['lon'][:]
+    var = data.variables['sst']
+    sst = np.array(var[0,0,:,:],dtype=np.float32)
+    fill = getattr(var,'_FillValue',MISSING)
+    data.close()
+
+    sst[(sst == MISSING) | (sst == fill)] = np.nan
+
+    return lats,lons,sst
+
+def _readMonths(filenames,nprocs):
+    """
+    Yields (lats,lons,sst) of the files in order, in a process pool for
+    many files
+    """
+
+    if nprocs == 1 or len(filenames) < 24:
+        for filename in filenames:
+            yield _readMonth(filename)
+    else:
+        ### Import modules
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=nprocs) as pool:
+            for month in pool.map(_readMonth,filenames,chunksize=12):
+                yield month
+
+def _writeStore(storefile,dates,filenames,nprocs):
+    """
+    Writes a new store of the monthly files (atomic replace)
+    """
+
+    ### Import modules
+    from netCDF4 import Dataset
+    import os
+
+    os.makedirs(os.path.dirname(storefile) or '.',exist_ok=True)
+    tempfile = storefile + '.%s.tmp' % os.getpid()
+
+    data = Dataset(tempfile,'w',format='NETCDF4')
+    try:
+        for i,(lats,lons,sst) in enumerate(_readMonths(filenames,nprocs)):
+            if i == 0:
+                data.createDimension('time',None)
+                data.createDimension('lat',lats.shape[0])
+                data.createDimension('lon',lons.shape[0])
+                data.createVariable('lat','f4',('lat',))[:] = lats
+                data.createVariable('lon','f4',('lon',))[:] = lons
+                data.createVariable('date','i4',('time',))
+                data.createVariable('sst','f4',('time','lat','lon'),
+                                    zlib=True,complevel=COMPLEVEL,
+                                    shuffle=True,
+                                    chunksizes=(12,lats.shape[0],
+                                                lons.shape[0]))
+                data.variables['sst'].units = 'degC'
+                data.variables['date'].long_name = 'yyyymm'
+                data.source = 'NOAA ERSSTv5 monthly files'
+            data.variables['sst'][i] = sst
+            data.variables['date'][i] = dates[i]
+    finally:
+        data.close()
+
+    os.replace(tempfile,storefile)
+
+def _storeDates(storefile):
+    """
+    Returns the dates (yyyymm) in a store, empty without a store
+    """
+
+    ### Import modules
+    from netCDF4 import Dataset
+    import numpy as np
+    import os
+
+    if not os.path.exists(storefile):
+        return np.array([],dtype=int)
+
+    data = Dataset(storefile)
+    dates = np.asarray(data.variables['date'][:],dtype=int)
+    data.close()
+
+    return dates
+
+def updateERSST(directory,storefile=STOREFILE,nprocs=None):
+    """
+    Function builds the ERSSTv5 store or appends new monthly files
+
+    Parameters
+    ----------
+    directory : string
+        working directory for stored ERSSTv5 files
+    storefile : string
+        consolidated netCDF4 store
+    nprocs : integer
+        worker processes for a new store (default number of cpus)
+
+    Returns
+    -------
+    nnew : integer
+        number of months added
+
+    Usage
+    -----
+    nnew = updateERSST(directory,storefile,nprocs)
+    """
+
+    ### Import modules
+    from netCDF4 import Dataset
+    import os
+
+    if nprocs is None:
+        nprocs = os.cpu_count() or 1
+
+    files = ersstFiles(directory)
+    dates = _storeDates(storefile)
+    stored = set(dates.tolist())
+    new = [date for date in files if date not in stored]
+    if not new:
+        return 0
+
+    if dates.size == 0 or min(new) < dates.max():
+        ### First build (or a month earlier than the store)
+        dates = sorted(stored | set(new))
+        missing = [date for date in dates if date not in files]
+        if missing:
+            raise ValueError('Monthly files are missing for the store ' \
+                             '(e.g., %s)!' % missing[0])
+        print('Building ERSSTv5 store (%s months) ---> %s' \
+              % (len(dates),storefile))
+        _writeStore(storefile,dates,[files[date] for date in dates],nprocs)
+    else:
+        ### Append the newer months at the end
+        print('Appending %s months to ERSSTv5 store ---> %s' \
+              % (len(new),storefile))
+        data = Dataset(storefile,'a')
+        try:
+            ntime = len(data.dimensions['time'])
+            for i,date in enumerate(new):
+                _,_,sst = _readMonth(files[date])
+                data.variables['sst'][ntime+i] = sst
+                data.variables['date'][ntime+i] = date
+        finally:
+            data.close()
+
+    return len(new)
+
+def readERSST(directory,years,months,storefile=STOREFILE,update=True):
+    """
+    Function reads ERSSTv5 sea surface temperatures for any years and
+    months from the consolidated store
+
+    Parameters
+    ----------
+    directory : string
+        working directory for stored ERSSTv5 files
+    years : 1d array
+        years to read, e.g. np.arange(1992,2016+1,1)
+    months : 1d array
+        months to read (1-12)
+    storefile : string
+        consolidated netCDF4 store
+    update : boolean
+        add new monthly files of directory to the store first
+
+    Returns
+    -------
+    lats : 1d array
+        latitudes
+    lons : 1d array
+        longitudes
+    sst : 4d array
+        [year,month,lat,lon] float32, NaN for missing data (degC)
+
+    Usage
+    -----
+    lats,lons,sst = readERSST(directory,years,months,storefile,update)
+    """
+
+    print('\n>>> Using readERSST function!')
+
+    ### Import modules
+    from netCDF4 import Dataset
+    import numpy as np
+
+    if update:
+        updateERSST(directory,storefile)
+
+    data = Dataset(storefile)
+    data.set_auto_mask(False)
+    try:
+        index = {date : i for i,date
+                 in enumerate(np.asarray(data.variables['date'][:],int))}
+        dates = [int(year)*100 + int(month) for year in years
+                 for month in months]
+        missing = [date for date in dates if date not in index]
+        if missing:
+            raise ValueError('ERSSTv5 months are not available (e.g., %s)!' \
+                             % missing[0])
+
+        lats = data.variables['lat'][:]
+        lons = data.variables['lon'][:]
+
+        ### One slice for a continuous range, otherwise sorted indices
+        times = np.array([index[date] for date in dates],dtype=int)
+        if np.all(np.diff(times) == 1):
+            sst = data.variables['sst'][times[0]:times[-1]+1]
+        else:
+            unique,inverse = np.unique(times,return_inverse=True)
+            sst = data.variables['sst'][unique][inverse]
+    finally:
+        data.close()
+
+    sst = np.reshape(sst,(len(years),len(months),lats.shape[0],lons.shape[0]))
+
+    print('Completed: Read ERSSTv5 data (%s - %s)!' % (dates[0],dates[-1]))
+
+    print('*Completed: Finished readERSST function!')
+    return lats,lons,sst
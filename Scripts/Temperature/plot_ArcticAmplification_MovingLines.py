@@ -10,8 +10,11 @@ Date      : 20 August 2018
 import numpy as np
 import datetime
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import math 
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
+import plot_AnimationWriter as AW
 
 ### Time
 now = datetime.datetime.now()
@@ -44,14 +47,7 @@ print('\nCompleted: Read AA data!')
 ############################################################################
 ############################################################################
 ### Create animation
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='darkgrey')
-plt.rc('xtick',color='darkgrey')
-plt.rc('ytick',color='darkgrey')
-plt.rc('axes',labelcolor='darkgrey')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle('darkgrey')
 
 fig = plt.figure()
 
@@ -59,27 +55,11 @@ fig = plt.figure()
 ax = plt.subplot(122)  
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-
 plt.text(1979,10.03,r'\textbf{SEA-ICE EXTENT}',color='deepskyblue',alpha=0.5,ha='left',
         fontsize=15,rotation=0,va='center',zorder=1)
         
 ax.tick_params('both',length=5.5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none') 
 ax.spines['left'].set_linewidth(2)
@@ -118,24 +98,8 @@ plt.text(1970,13.1,r'\textbf{ARCTIC CLIMATE}',fontsize=32,color='w',
 ax = plt.subplot(121)  
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-        
 ax.tick_params('both',length=5,width=2,which='major')             
-adjust_spines(ax, ['left','bottom'])            
+DS.adjust_spines(ax, ['left','bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none') 
 ax.spines['left'].set_linewidth(2)
@@ -179,12 +143,10 @@ def update(num,years,eq,tq,ant,gre,bar):
     gre.axes.axis([1979,2019,-3,3])
     return bar,
 
-ani = animation.FuncAnimation(fig,update,60,fargs=[years,
-                              eq,tq,ant,gre,gre],interval=0.01,blit=True)
-
 ### Save figure
 #plt.savefig(directoryfigure + 'ArcticAmplification_moving.png',dpi=300)
-ani.save(directoryfigure + 'ArcticAmplification.gif',dpi=300,writer='imagemagick')
+AW.saveAnimation(fig,update,60,directoryfigure + 'ArcticAmplification.gif',
+                 [ant,gre],fargs=[years,eq,tq,ant,gre,gre],dpi=300)
 
 print('\nCompleted: Script done!')
                      
\ No newline at end of file
@@ -14,7 +14,10 @@ import matplotlib.pyplot as plt
 import matplotlib.colors as c
 import datetime
 import cmocean
-from mpl_toolkits.basemap import Basemap
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import calc_MapCache as MC
+import plot_DarkStyle as DS
 
 ### Define directories
 directorydata = './Data/'
@@ -51,36 +54,13 @@ datat[np.where(datat == -9999.000)] = np.nan
 ###############################################################################
 ###############################################################################               
 ### Plot Figure
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='darkgrey')
-plt.rc('xtick',color='darkgrey')
-plt.rc('ytick',color='darkgrey')
-plt.rc('axes',labelcolor='darkgrey')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle('darkgrey')
 
 ### Adjust axes in time series plots 
-def adjust_spines(ax, spines):
-    for loc, spine in ax.spines.items():
-        if loc in spines:
-            spine.set_position(('outward', 5))
-        else:
-            spine.set_color('none')  
-    if 'left' in spines:
-        ax.yaxis.set_ticks_position('left')
-    else:
-        ax.yaxis.set_ticks([])
-
-    if 'bottom' in spines:
-        ax.xaxis.set_ticks_position('bottom')
-    else:
-        ax.xaxis.set_ticks([]) 
-        
 fig = plt.figure()
 ax = plt.subplot(111)
 
-adjust_spines(ax, ['left', 'bottom'])            
+DS.adjust_spines(ax, ['left', 'bottom'])            
 ax.spines['top'].set_color('none')
 ax.spines['right'].set_color('none')
 ax.spines['bottom'].set_linewidth(2)
@@ -138,17 +118,12 @@ a = plt.axes([.65, .19, .29, .24])
 
 c=cmocean.cm.thermal(0.98)
 
-def setcolor(x, color):
-     for m in x:
-         for t in x[m][1]:
-             t.set_color(color)
-
 lat1 = np.arange(-90,90.1,0.5)
 lon1 = np.arange(-180,180.1,0.5)
 lon2,lat2 = np.meshgrid(lon1,lat1)
 
-m = Basemap(projection='npstere',boundinglat=55.3,lon_0=270,resolution='l',
-            round =True,area_thresh=10000)
+m = MC.cachedBasemap(projection='npstere',boundinglat=55.3,lon_0=270,
+                     resolution='l',round =True,area_thresh=10000)
 m.drawcoastlines(color = c,linewidth=0.3)
 m.drawmapboundary(color='k')
 m.drawlsmask(land_color='k',ocean_color='k')
@@ -159,9 +134,10 @@ meridians = np.arange(-180,180,30)
 #                linewidth=0.2,color='w')
 #par=m.drawmeridians(meridians,labels=[False,False,False,False],
 #                    linewidth=0.2,fontsize=6,color='w')
-#setcolor(par,'white')
+#DS.setcolor(par,'white')
 
-cs = m.contourf(lon2,lat2,lat2,np.arange(67,100,10),latlon=True,
+x,y = MC.projectGrid(m,lon2,lat2)
+cs = m.contourf(x,y,lat2,np.arange(67,100,10),
                 colors='darkgrey')
            
 ### Save figure
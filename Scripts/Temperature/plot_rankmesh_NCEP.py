@@ -12,6 +12,9 @@ import matplotlib.pyplot as plt
 import matplotlib.colors as c
 import scipy.stats as sts
 import cmocean
+import sys
+sys.path.append('./Scripts/Utilities/Scripts/')
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = ''
@@ -35,14 +38,7 @@ for i in range(temps.shape[0]):
     
     
 ### Call parameters
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='darkgrey')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
+DS.setDarkStyle(edgecolor='darkgrey')
 
 ### Plot first meshgrid
 fig = plt.figure()
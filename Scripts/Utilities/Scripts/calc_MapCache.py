@@ -0,0 +1,167 @@
+"""
+Functions cache Basemap objects (including coastlines and land polygons)
+and the projected x/y of data grids. Both are kept for the current process
+and pickled to disk, keyed by the projection parameters, so building a map
+and projecting a large grid (e.g. AMSR2 3.125 km) happens once.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    Cache directory defaults to ./Data/cache/maps/ and can be changed with
+    the ICEVARFIGS_MAPCACHE environment variable.
+
+Usage
+-----
+    [1] cachedBasemap(**kwargs)
+    [2] projectGrid(m,lons,lats)
+"""
+
+### Default cache directory
+CACHEDIR = './Data/cache/maps/'
+
+### Maps and grids for this process
+_maps = {}
+_grids = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _cacheDir():
+    """
+    Returns (and creates) the map cache directory
+    """
+
+    ### Import modules
+    import os
+
+    cachedir = os.environ.get('ICEVARFIGS_MAPCACHE',CACHEDIR)
+    os.makedirs(cachedir,exist_ok=True)
+    return cachedir
+
+def _mapKey(kwargs):
+    """
+    Key for a set of Basemap parameters (and Basemap version)
+    """
+
+    ### Import modules
+    import hashlib
+    import mpl_toolkits.basemap as basemap
+
+    params = repr(sorted(kwargs.items())) + getattr(basemap,'__version__','')
+    return hashlib.sha1(params.encode('utf-8')).hexdigest()
+
+def cachedBasemap(**kwargs):
+    """
+    Function returns a Basemap for the given parameters, built once and then
+    loaded from the pickled cache
+
+    Parameters
+    ----------
+    **kwargs : Basemap arguments
+        e.g. projection='npstere',boundinglat=55.3,lon_0=270,resolution='l'
+
+    Returns
+    -------
+    m : Basemap
+        map projection, m.cachekey identifies it for projectGrid
+
+    Usage
+    -----
+    m = cachedBasemap(projection='npstere',boundinglat=67,lon_0=270,
+                      resolution='l',round=True)
+    """
+
+    ### Import modules
+    import os
+    import pickle
+
+    key = _mapKey(kwargs)
+    if key in _maps:
+        return _maps[key]
+
+    cachefile = os.path.join(_cacheDir(),'basemap_%s.pickle' % key)
+    m = None
+    if os.path.exists(cachefile):
+        try:
+            with open(cachefile,'rb') as f:
+                m = pickle.load(f)
+        except Exception as e:
+            print('Could not load cached Basemap (%s), rebuilding' % e)
+            m = None
+
+    if m is None:
+        from mpl_toolkits.basemap import Basemap
+
+        print('Building Basemap ---> %s' % kwargs.get('projection'))
+        m = Basemap(**kwargs)
+        m.cachekey = key
+        tempfile = cachefile + '.%s.tmp' % os.getpid()
+        with open(tempfile,'wb') as f:
+            pickle.dump(m,f,protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tempfile,cachefile)
+
+    _maps[key] = m
+    return m
+
+def projectGrid(m,lons,lats):
+    """
+    Function returns the projected x/y of a lat/lon grid, computed once per
+    map and grid and then loaded from the cache
+
+    Parameters
+    ----------
+    m : Basemap
+        map projection (from cachedBasemap)
+    lons : 1d or 2d array
+        longitudes (1d arrays are combined with meshgrid)
+    lats : 1d or 2d array
+        latitudes
+
+    Returns
+    -------
+    x : 2d array
+        projected x, use as m.contourf(x,y,var) without latlon=True
+    y : 2d array
+        projected y
+
+    Usage
+    -----
+    x,y = projectGrid(m,lons,lats)
+    """
+
+    ### Import modules
+    import hashlib
+    import numpy as np
+    import os
+
+    lons = np.asarray(lons,dtype='float64')
+    lats = np.asarray(lats,dtype='float64')
+    if lons.ndim == 1 and lats.ndim == 1:
+        lons,lats = np.meshgrid(lons,lats)
+
+    ### Key from map and grid contents
+    mapkey = getattr(m,'cachekey',None) or \
+             repr((m.projection,m.llcrnrlon,m.llcrnrlat,m.urcrnrlon,
+                   m.urcrnrlat,m.projparams))
+    digest = hashlib.sha1(mapkey.encode('utf-8'))
+    digest.update(np.ascontiguousarray(lons).tobytes())
+    digest.update(np.ascontiguousarray(lats).tobytes())
+    key = digest.hexdigest()
+    if key in _grids:
+        return _grids[key]
+
+    cachefile = os.path.join(_cacheDir(),'grid_%s.npy' % key)
+    if os.path.exists(cachefile):
+        xy = np.load(cachefile,mmap_mode='r')
+    else:
+        print('Projecting grid ---> %s' % (lons.shape,))
+        xy = np.stack(m(lons,lats))
+        tempfile = cachefile + '.%s.tmp.npy' % os.getpid()
+        np.save(tempfile,xy)
+        os.replace(tempfile,cachefile)
+
+    _grids[key] = (xy[0],xy[1])
+    return _grids[key]
@@ -8,14 +8,133 @@ Notes
     
 Usage
 -----
-    [1] calcDecJan(varx,vary,lat,lon,level,levsq)
-    [2] calcDecJanFeb(varx,vary,lat,lon,level,levsq)
-    [3] calc_indttest(varx,vary)
-    [4] calc_weightedAve(var,lats)
-    [5] calc_spatialCorr(varx,vary,lats,lons,weight)
-    [6] calc_RMSE(varx,vary,lats,lons,weight)
+    [1] calcSeason(var,months)
+    [2] calcDecJan(varx,vary,lat,lon,level,levsq)
+    [3] calcDecJanFeb(varx,vary,lat,lon,level,levsq)
+    [4] calc_sufficientStats(var,enschunk)
+    [5] calc_ttestStats(statsx,statsy,equal_var)
+    [6] calc_fdrMask(pvalue,alpha)
+    [7] calc_indttestChunked(varx,vary,equal_var,alpha,chunksize,enschunk,
+                             nprocs)
+    [8] calc_indttest(varx,vary)
+    [9] calc_weightedAve(var,lats,out)
+    [10] calc_spatialCorrSeries(varx,vary,lats,lons,weight,latmin)
+    [11] calc_RMSESeries(varx,vary,lats,lons,weight,latmin)
+    [12] calc_spatialCorr(varx,vary,lats,lons,weight,latmin)
+    [13] calc_RMSE(varx,vary,lats,lons,weight,latmin)
 """
 
+### Month initials for season strings (e.g., DJF)
+MONTHLETTERS = 'JFMAMJJASOND'
+
+### Ensemble samples of the t-test workers
+_ttest = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _seasonOffsets(months):
+    """
+    Returns the months of a season as offsets from its first month
+    """
+
+    if isinstance(months,str):
+        season = months.upper()
+        start = (MONTHLETTERS*2).find(season)
+        if not season or len(season) > 12 or start < 0:
+            raise ValueError('Wrong season - (e.g., DJF, NDJ, JJA)!')
+        months = [(start + i) % 12 + 1 for i in range(len(season))]
+
+    months = [int(month) for month in months]
+    if not months or any(month < 1 or month > 12 for month in months):
+        raise ValueError('Wrong months - (1-12)!')
+
+    ### A month earlier than the previous one belongs to the next year
+    offsets = [0]
+    for previous,month in zip(months[:-1],months[1:]):
+        offsets.append(offsets[-1] + (month - previous) % 12)
+    if offsets[-1] >= 12 or len(set(offsets)) != len(offsets):
+        raise ValueError('Season months must be in order within 12 months!')
+
+    return months[0] - 1,offsets
+
+def calcSeason(var,months):
+    """
+    Function calculates seasonal averages for any set of months, including
+    seasons across the year boundary (e.g., NDJ, DJF, DJFM)
+
+    Parameters
+    ----------
+    var : nd array
+        [year,month,...] with 12 months, any trailing dimensions
+    months : string or list of integers
+        season initials in order (e.g., 'DJF') or months (e.g., [12,1,2])
+
+    Returns
+    -------
+    varseason : nd array
+        [year,...] nanmean over the season months. A season that ends in
+        the next year is assigned to the year of its first month, so there
+        is one year less (the last year is incomplete)
+
+    Usage
+    -----
+    varseason = calcSeason(var,months)
+    """
+    print('\n>>> Using calcSeason function!')
+
+    ### Import modules
+    import numpy as np
+
+    var = np.asarray(var)
+    if var.ndim < 2 or var.shape[1] != 12:
+        raise ValueError('Variable has the wrong dimensions - ' \
+                         '[year,month,...]!')
+    first,offsets = _seasonOffsets(months)
+
+    ### Number of complete seasons
+    nyears = var.shape[0] - (first + offsets[-1]) // 12
+    if nyears < 1:
+        raise ValueError('Not enough years for the season!')
+
+    ### Strided views var[shift:shift+nyears,month] of each season month
+    total = np.zeros((nyears,) + var.shape[2:])
+    count = np.zeros(total.shape,dtype=np.int16)
+    for offset in offsets:
+        shift,month = divmod(first + offset,12)
+        view = var[shift:shift+nyears,month]
+        finite = np.isfinite(view)
+        np.add(total,view,out=total,where=finite)
+        count += finite
+
+    ### Mean over finite months, NaN where all months are missing
+    with np.errstate(invalid='ignore',divide='ignore'):
+        varseason = total/count
+
+    print('Completed: Organized data by months (%s)!' \
+          % ''.join(MONTHLETTERS[(first + offset) % 12]
+                    for offset in offsets))
+
+    print('*Completed: Finished calcSeason function!')
+    return varseason
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _checkLevel(var,level,levsq):
+    """
+    Checks the dimensions of a surface or profile variable
+    """
+
+    ndim = {'surface' : 4,'profile' : 5}
+    if level not in ndim:
+        raise ValueError('Selected wrong height - (surface or profile!)!')
+    if var.ndim != ndim[level] or (level == 'profile' and \
+                                   var.shape[2] != levsq):
+        raise ValueError('Variable has the wrong dimensions for %s!' % level)
+
 def calcDecJan(varx,vary,lat,lon,level,levsq):
     """
     Function calculates average for December-January
@@ -34,7 +153,7 @@ def calcDecJan(varx,vary,lat,lon,level,levsq):
         Height of variable (surface or profile)
     levsq : integer
         number of levels
-        
+
     Returns
     -------
     varx_dj : 3d array or 4d array
@@ -47,64 +166,17 @@ def calcDecJan(varx,vary,lat,lon,level,levsq):
     varx_dj,vary_dj = calcDecJan(varx,vary,lat,lon,level,levsq)
     """
     print('\n>>> Using calcDecJan function!')
-    
+
     ### Import modules
     import numpy as np
-    
-    ### Reshape for 3d variables
-    if level == 'surface':    
-        varxravel = np.reshape(varx.copy(),
-                           (int(varx.shape[0]*12),
-                            int(lat.shape[0]),int(lon.shape[0])))
-        varyravel = np.reshape(vary.copy(),
-                               (int(vary.shape[0]*12),
-                                int(lat.shape[0]),int(lon.shape[0]))) 
-                               
-        varx_dj = np.empty((varx.shape[0]-1,lat.shape[0],lon.shape[0]))
-        vary_dj = np.empty((vary.shape[0]-1,lat.shape[0],lon.shape[0]) )                 
-        for i in range(0,varxravel.shape[0]-12,12):
-            counter = 0
-            if i >= 12:
-                counter = i//12
-            djappendh = np.append(varxravel[11+i,:,:],varxravel[12+i,:,:])
-            djappendf = np.append(varyravel[11+i,:,:],varyravel[12+i,:,:])    
-            varx_dj[counter,:,:] = np.nanmean(np.reshape(djappendh,
-                                    (2,int(lat.shape[0]),int(lon.shape[0]))),
-                                    axis=0)                   
-            vary_dj[counter,:,:] = np.nanmean(np.reshape(djappendf,
-                                    (2,int(lat.shape[0]),int(lon.shape[0]))),
-                                    axis=0)
-    ### Reshape for 4d variables
-    elif level == 'profile':
-        varxravel = np.reshape(varx.copy(),
-                           (int(varx.shape[0]*12.),levsq,
-                            int(lat.shape[0]),int(lon.shape[0])))
-        varyravel = np.reshape(vary.copy(),
-                               (int(vary.shape[0]*12.),levsq,
-                                int(lat.shape[0]),int(lon.shape[0]))) 
-                               
-        varx_dj = np.empty((int(varx.shape[0]-1),levsq,
-                            int(lat.shape[0]),int(lon.shape[0])))
-        vary_dj = np.empty((int(vary.shape[0]-1),levsq,
-                            int(lat.shape[0]),int(lon.shape[0])) )                 
-        for i in range(0,varxravel.shape[0]-12,12):
-            counter = 0
-            if i >= 12:
-                counter = i//12
-            djappendh = np.append(varxravel[11+i,:,:,:],
-                                  varxravel[12+i,:,:,:])
-            djappendf = np.append(varyravel[11+i,:,:,:],
-                                  varyravel[12+i,:,:,:])    
-            varx_dj[counter,:,:] = np.nanmean(np.reshape(djappendh,
-                                    (2,levsq,int(lat.shape[0]),
-                                     int(lon.shape[0]))),axis=0)                   
-            vary_dj[counter,:,:] = np.nanmean(np.reshape(djappendf,
-                                    (2,levsq,int(lat.shape[0]),
-                                     int(lon.shape[0]))),axis=0)                               
-    else:
-        print(ValueError('Selected wrong height - (surface or profile!)!'))    
-                                
-    print('Completed: Organized data by months (ON,DJ,FM)!')
+
+    varx = np.asarray(varx)
+    vary = np.asarray(vary)
+    _checkLevel(varx,level,levsq)
+    _checkLevel(vary,level,levsq)
+
+    varx_dj = calcSeason(varx,'DJ')
+    vary_dj = calcSeason(vary,'DJ')
 
     print('*Completed: Finished calcDecJan function!')
     return varx_dj,vary_dj
@@ -131,7 +203,7 @@ def calcDecJanFeb(varx,vary,lat,lon,level,levsq):
         Height of variable (surface or profile)
     levsq : integer
         number of levels
-        
+
     Returns
     -------
     varx_djf : 3d array or 4d array
@@ -143,71 +215,18 @@ def calcDecJanFeb(varx,vary,lat,lon,level,levsq):
     -----
     varx_djf,vary_djf = calcDecJanFeb(varx,vary,lat,lon,level,levsq)
     """
-    print('\n>>> Using calcDecJan function!')
-    
+    print('\n>>> Using calcDecJanFeb function!')
+
     ### Import modules
     import numpy as np
-    
-    ### Reshape for 3d variables
-    if level == 'surface':    
-        varxravel = np.reshape(varx.copy(),
-                           (int(varx.shape[0]*12),
-                            int(lat.shape[0]),int(lon.shape[0])))
-        varyravel = np.reshape(vary.copy(),
-                               (int(vary.shape[0]*12),
-                                int(lat.shape[0]),int(lon.shape[0]))) 
-                               
-        varx_djf = np.empty((varx.shape[0]-1,lat.shape[0],lon.shape[0]))
-        vary_djf = np.empty((vary.shape[0]-1,lat.shape[0],lon.shape[0]) )                 
-        for i in range(0,varxravel.shape[0]-12,12):
-            counter = 0
-            if i >= 12:
-                counter = i//12
-            djfappendh1 = np.append(varxravel[11+i,:,:],varxravel[12+i,:,:])
-            djfappendf1 = np.append(varyravel[11+i,:,:],varyravel[12+i,:,:])  
-            djfappendh = np.append(djfappendh1,varxravel[13+i,:,:])
-            djfappendf = np.append(djfappendf1,varyravel[13+i,:,:]) 
-            varx_djf[counter,:,:] = np.nanmean(np.reshape(djfappendh,
-                                    (3,int(lat.shape[0]),int(lon.shape[0]))),
-                                    axis=0)                   
-            vary_djf[counter,:,:] = np.nanmean(np.reshape(djfappendf,
-                                    (3,int(lat.shape[0]),int(lon.shape[0]))),
-                                    axis=0)
-    ### Reshape for 4d variables
-    elif level == 'profile':
-        varxravel = np.reshape(varx.copy(),
-                           (int(varx.shape[0]*12.),levsq,
-                            int(lat.shape[0]),int(lon.shape[0])))
-        varyravel = np.reshape(vary.copy(),
-                               (int(vary.shape[0]*12.),levsq,
-                                int(lat.shape[0]),int(lon.shape[0]))) 
-                               
-        varx_djf = np.empty((int(varx.shape[0]-1),levsq,
-                            int(lat.shape[0]),int(lon.shape[0])))
-        vary_djf = np.empty((int(vary.shape[0]-1),levsq,
-                            int(lat.shape[0]),int(lon.shape[0])) )                 
-        for i in range(0,varxravel.shape[0]-12,12):
-            counter = 0
-            if i >= 12:
-                counter = i//12
-            djfappendh1 = np.append(varxravel[11+i,:,:,:],
-                                  varxravel[12+i,:,:,:])
-            djfappendf1 = np.append(varyravel[11+i,:,:,:],
-                                  varyravel[12+i,:,:,:]) 
-            djfappendh = np.append(djfappendh1,
-                                  varxravel[13+i,:,:,:])
-            djfappendf = np.append(djfappendf1,
-                                  varyravel[13+i,:,:,:])  
-            varx_djf[counter,:,:] = np.nanmean(np.reshape(djfappendh,
-                                    (3,levsq,int(lat.shape[0]),
-                                     int(lon.shape[0]))),axis=0)                   
-            vary_djf[counter,:,:] = np.nanmean(np.reshape(djfappendf,
-                                    (3,levsq,int(lat.shape[0]),
-                                     int(lon.shape[0]))),axis=0)                               
-    else:
-        print(ValueError('Selected wrong height - (surface or profile!)!'))    
-                                
-    print('Completed: Organized data by months (DJF)!')
+
+    varx = np.asarray(varx)
+    vary = np.asarray(vary)
+    _checkLevel(varx,level,levsq)
+    _checkLevel(vary,level,levsq)
+
+    varx_djf = calcSeason(varx,'DJF')
+    vary_djf = calcSeason(vary,'DJF')
 
     print('*Completed: Finished calcDecJanFeb function!')
     return varx_djf,vary_djf
@@ -215,7 +234,232 @@ def calcDecJanFeb(varx,vary,lat,lon,level,levsq):
 ###############################################################################
 ###############################################################################
 ###############################################################################
-    
+
+def calc_sufficientStats(var,enschunk=50):
+    """
+    Function calculates count, mean and sum of squared anomalies (M2)
+    along the first axis, reading enschunk members at a time (works on
+    memory-mapped or netCDF variables)
+
+    Parameters
+    ----------
+    var : nd array [ens,...]
+    enschunk : number of members read at once
+
+    Returns
+    -------
+    count : (n-1)d array of finite members
+    mean : (n-1)d array of means
+    m2 : (n-1)d array of sums of squared anomalies
+
+    Usage
+    -----
+    count,mean,m2 = calc_sufficientStats(var,enschunk)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    count = mean = m2 = None
+    for start in range(0,var.shape[0],enschunk):
+        block = np.asarray(var[start:start+enschunk],dtype=float)
+        finite = np.isfinite(block)
+
+        ### Statistics of the block
+        nb = np.sum(finite,axis=0)
+        with np.errstate(invalid='ignore',divide='ignore'):
+            meanb = np.sum(np.where(finite,block,0.),axis=0)/nb
+        m2b = np.sum(np.where(finite,block - meanb,0.)**2,axis=0)
+
+        ### Merge with the previous blocks (Chan et al. 1979)
+        if count is None:
+            count,mean,m2 = nb,meanb,m2b
+        else:
+            total = count + nb
+            with np.errstate(invalid='ignore',divide='ignore'):
+                delta = meanb - mean
+                mean = np.where(nb > 0,np.where(count > 0,
+                                mean + delta*nb/total,meanb),mean)
+                m2 = np.where((count > 0) & (nb > 0),
+                              m2 + m2b + delta**2*count*nb/total,m2 + m2b)
+            count = total
+
+    return count,mean,m2
+
+def calc_ttestStats(statsx,statsy,equal_var=False):
+    """
+    Function calculates the 2 independent sample t-test from sufficient
+    statistics
+
+    Parameters
+    ----------
+    statsx : tuple (count,mean,m2) of the first sample
+    statsy : tuple (count,mean,m2) of the second sample
+    equal_var : False for Welch's t-test, True for Student's t-test
+
+    Returns
+    -------
+    stat : calculated t-statistic
+    pvalue : two-tailed p-value (NaN with fewer than 2 members)
+
+    Usage
+    -----
+    stat,pvalue = calc_ttestStats(statsx,statsy,equal_var)
+    """
+
+    ### Import modules
+    import numpy as np
+    import scipy.stats as sts
+
+    nx,meanx,m2x = statsx
+    ny,meany,m2y = statsy
+
+    with np.errstate(invalid='ignore',divide='ignore'):
+        if equal_var:
+            df = nx + ny - 2.
+            var = (m2x + m2y)/df
+            stat = (meanx - meany)/np.sqrt(var*(1./nx + 1./ny))
+        else:
+            vx = m2x/(nx - 1.)/nx
+            vy = m2y/(ny - 1.)/ny
+            stat = (meanx - meany)/np.sqrt(vx + vy)
+            df = (vx + vy)**2/(vx**2/(nx - 1.) + vy**2/(ny - 1.))
+        invalid = (nx < 2) | (ny < 2) | ~np.isfinite(stat)
+        pvalue = 2.*sts.t.sf(np.abs(np.where(invalid,0.,stat)),
+                             np.where(invalid,1.,df))
+
+    pvalue = np.where(invalid,np.nan,pvalue)
+    return stat,pvalue
+
+def calc_fdrMask(pvalue,alpha=0.05):
+    """
+    Function calculates field significance with the false discovery rate
+    (Benjamini and Hochberg 1995; Wilks 2016) over all grid points
+
+    Parameters
+    ----------
+    pvalue : nd array of p-values (NaN for missing points)
+    alpha : false discovery rate (Wilks 2016 suggests 2x the local level)
+
+    Returns
+    -------
+    mask : nd array, 1 where significant and NaN elsewhere
+
+    Usage
+    -----
+    mask = calc_fdrMask(pvalue,alpha)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    pvalue = np.asarray(pvalue,dtype=float)
+    finite = np.isfinite(pvalue)
+    psorted = np.sort(pvalue[finite])
+
+    ### Largest p-value below its rank threshold
+    passed = psorted <= alpha*np.arange(1,psorted.size+1)/max(psorted.size,1)
+    pcrit = psorted[passed].max() if np.any(passed) else -np.inf
+
+    mask = np.full(pvalue.shape,np.nan)
+    mask[finite & (pvalue <= pcrit)] = 1.
+    return mask
+
+def _initTtest(varx,vary,equal_var,enschunk):
+    """
+    Keeps the [ens,point] samples in each worker (copy-on-write with fork)
+    """
+
+    _ttest.clear()
+    _ttest.update(varx=varx,vary=vary,equal_var=equal_var,enschunk=enschunk)
+
+def _ttestChunk(points):
+    """
+    Returns the t-statistic and p-value of a slice of grid points
+    """
+
+    statsx = calc_sufficientStats(_ttest['varx'][:,points[0]:points[1]],
+                                  _ttest['enschunk'])
+    statsy = calc_sufficientStats(_ttest['vary'][:,points[0]:points[1]],
+                                  _ttest['enschunk'])
+    return calc_ttestStats(statsx,statsy,_ttest['equal_var'])
+
+def calc_indttestChunked(varx,vary,equal_var=False,alpha=0.05,
+                         chunksize=65536,enschunk=50,nprocs=1):
+    """
+    Function calculates grid point t-tests of two ensembles chunked over
+    space, with local and field (false discovery rate) significance. Only
+    chunksize x enschunk values of each ensemble are in memory at once
+
+    Parameters
+    ----------
+    varx : nd array [ens,...], e.g. [ens,lat,lon] or [ens,lev,lat,lon]
+    vary : nd array [ens,...]
+    equal_var : False for Welch's t-test, True for Student's t-test
+    alpha : significance level
+    chunksize : grid points per chunk
+    enschunk : members read at once
+    nprocs : number of worker processes (1 computes in this process)
+
+    Returns
+    -------
+    stat : (n-1)d array of t-statistics
+    pvalue : (n-1)d array of two-tailed p-values
+    local : (n-1)d array, 1 where pvalue < alpha and NaN elsewhere
+    field : (n-1)d array, 1 where significant with FDR (alpha) and NaN
+        elsewhere
+
+    Usage
+    -----
+    stat,pvalue,local,field = calc_indttestChunked(varx,vary,equal_var,
+                                                   alpha,chunksize,enschunk,
+                                                   nprocs)
+    """
+    print('\n>>> Using calc_indttestChunked function!')
+
+    ### Import modules
+    import numpy as np
+
+    if varx.shape[1:] != vary.shape[1:]:
+        raise ValueError('Ensembles have different grids!')
+    shape = varx.shape[1:]
+    npoints = int(np.prod(shape))
+
+    ### [ens,point] views (no copy for contiguous or memory-mapped arrays)
+    varx = np.reshape(varx,(varx.shape[0],npoints))
+    vary = np.reshape(vary,(vary.shape[0],npoints))
+    chunks = [(start,min(start + chunksize,npoints))
+              for start in range(0,npoints,chunksize)]
+
+    initial = (varx,vary,equal_var,enschunk)
+    if nprocs == 1 or len(chunks) == 1:
+        _initTtest(*initial)
+        results = list(map(_ttestChunk,chunks))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(nprocs,len(chunks)),
+                                 initializer=_initTtest,
+                                 initargs=initial) as pool:
+            results = list(pool.map(_ttestChunk,chunks))
+    _ttest.clear()
+
+    stat = np.reshape(np.concatenate([r[0] for r in results]),shape)
+    pvalue = np.reshape(np.concatenate([r[1] for r in results]),shape)
+    print('Completed: Computed %s t-tests in %s chunks (%s)!' \
+          % (npoints,len(chunks),'Student' if equal_var else 'Welch'))
+
+    ### Local and field significance
+    local = np.where(pvalue < alpha,1.,np.nan)
+    field = calc_fdrMask(pvalue,alpha)
+
+    print('*Completed: Finished calc_indttestChunked function!')
+    return stat,pvalue,local,field
+
+###############################################################################
+###############################################################################
+###############################################################################
+
 def calc_indttest(varx,vary):
     """
     Function calculates statistical difference for 2 independent
@@ -225,29 +469,22 @@ def calc_indttest(varx,vary):
     ----------
     varx : 3d array
     vary : 3d array
-    
+
     Returns
     -------
     stat = calculated t-statistic
-    pvalue = two-tailed p-value
+    pvalue = significance mask (1 at the 95% confidence level, else NaN)
 
     Usage
     -----
     stat,pvalue = calc_ttest(varx,vary)
     """
     print('\n>>> Using calc_ttest function!')
-    
-    ### Import modules
-    import numpy as np
-    import scipy.stats as sts
-    
-    ### 2-independent sample t-test
-    stat,pvalue = sts.ttest_ind(varx,vary,nan_policy='omit')
-    
-    ### Significant at 95% confidence level
-    pvalue[np.where(pvalue >= 0.05)] = np.nan
-    pvalue[np.where(pvalue < 0.05)] = 1.
-    
+
+    ### 2-independent sample t-test (Student), significant at 95%
+    stat,_,pvalue,_ = calc_indttestChunked(varx,vary,equal_var=True,
+                                           alpha=0.05)
+
     print('*Completed: Finished calc_ttest function!')
     return stat,pvalue
 
@@ -255,18 +492,20 @@ def calc_indttest(varx,vary):
 ###############################################################################
 ###############################################################################
 
-def calc_weightedAve(var,lats):
+def calc_weightedAve(var,lats,out=None):
     """
-    Area weights sit array 5d [ens,year,month,lat,lon] into [ens,year,month]
+    Area weights array of any dimension [...,lat,lon] into [...], for
+    example sit array 5d [ens,year,month,lat,lon] into [ens,year,month]
     
     Parameters
     ----------
-    var : 5d,4d,3d array of a gridded variable
-    lats : 2d array of latitudes
+    var : nd array of a gridded variable [...,lat,lon]
+    lats : 2d array of latitudes (or 1d array along lat)
+    out : optional array with shape var.shape[:-2] to store the result
     
     Returns
     -------
-    meanvar : weighted average for 3d,2d,1d array
+    meanvar : weighted average for (n-2)d array
 
     Usage
     -----
@@ -277,44 +516,32 @@ def calc_weightedAve(var,lats):
     ### Import modules
     import numpy as np
     
-    ### Calculate weighted average for various dimensional arrays
-    if var.ndim == 5:
-        meanvar = np.empty((var.shape[0],var.shape[1],var.shape[2]))
-        for ens in range(var.shape[0]):
-            for i in range(var.shape[1]):
-                for j in range(var.shape[2]):
-                    varq = var[ens,i,j,:,:]
-                    mask = np.isfinite(varq) & np.isfinite(lats)
-                    varmask = varq[mask]
-                    areamask = np.cos(np.deg2rad(lats[mask]))
-                    meanvar[ens,i,j] = np.nansum(varmask*areamask) \
-                                        /np.sum(areamask)  
-    elif var.ndim == 4:
-        meanvar = np.empty((var.shape[0],var.shape[1]))
-        for i in range(var.shape[0]):
-            for j in range(var.shape[1]):
-                varq = var[i,j,:,:]
-                mask = np.isfinite(varq) & np.isfinite(lats)
-                varmask = varq[mask]
-                areamask = np.cos(np.deg2rad(lats[mask]))
-                meanvar[i,j] = np.nansum(varmask*areamask)/np.sum(areamask)
-    elif var.ndim == 3:
-        meanvar = np.empty((var.shape[0]))
-        for i in range(var.shape[0]):
-            varq = var[i,:,:]
-            mask = np.isfinite(varq) & np.isfinite(lats)
-            varmask = varq[mask]
-            areamask = np.cos(np.deg2rad(lats[mask]))
-            meanvar[i] = np.nansum(varmask*areamask)/np.sum(areamask)
+    var = np.asarray(var)
+    if var.ndim < 2:
+        raise ValueError('Variable has the wrong dimensions!')
+    
+    ### Calculate cos(lat) weights once, zero where latitude is missing
+    lats = np.asarray(lats)
+    if lats.ndim == 1:
+        lats = lats[:,np.newaxis]
+    lats = np.broadcast_to(lats,var.shape[-2:])
+    gw = np.cos(np.deg2rad(np.where(np.isfinite(lats),lats,0.)))
+    gw[~np.isfinite(lats)] = 0.
+    gw = gw.ravel()
+    
+    ### Masked sums over the trailing (lat,lon) axes in one call
+    varflat = np.reshape(var,(-1,gw.size))
+    finite = np.isfinite(varflat)
+    numer = np.dot(np.where(finite,varflat,0.),gw)
+    denom = np.dot(finite,gw)
+    
+    with np.errstate(invalid='ignore',divide='ignore'):
+        meanvar = np.reshape(numer/denom,var.shape[:-2])
+    if out is not None:
+        out[...] = meanvar
+        meanvar = out
     elif var.ndim == 2:
-        meanvar = np.empty((var.shape[0]))
-        varq = var[:,:]
-        mask = np.isfinite(varq) & np.isfinite(lats)
-        varmask = varq[mask]
-        areamask = np.cos(np.deg2rad(lats[mask]))
-        meanvar = np.nansum(varmask*areamask)/np.sum(areamask)
-    else:
-        print(ValueError('Variable has the wrong dimensions!'))
+        meanvar = meanvar[()]
      
     print('Completed: Weighted variable average!')
     
@@ -325,77 +552,175 @@ def calc_weightedAve(var,lats):
 ###############################################################################
 ###############################################################################
     
-def calc_spatialCorr(varx,vary,lats,lons,weight):
+def _spatialPairs(varx,vary,lats,weight,latmin):
+    """
+    Returns [time,point] arrays of both variables, a mask of grid points
+    where both are finite and the cos(lat) or unit weights of the points
+    """
+
+    ### Import modules
+    import numpy as np
+
+    varx = np.asarray(varx)
+    vary = np.asarray(vary)
+    if varx.shape != vary.shape or varx.ndim < 2:
+        raise ValueError('Variables have the wrong dimensions!')
+    if weight not in ('yes','no'):
+        raise ValueError('Wrong weighted arguement in function!')
+
+    ### Latitudes of every grid point, built once for all times
+    lats = np.asarray(lats,dtype=float)
+    if lats.ndim == 1:
+        lats = lats[:,np.newaxis]
+    lats = np.broadcast_to(lats,varx.shape[-2:]).ravel()
+    finite = np.isfinite(lats)
+
+    if weight == 'yes':
+        gw = np.cos(np.deg2rad(np.where(finite,lats,0.)))
+    else:
+        gw = np.ones(lats.shape)
+    gw[~finite] = 0.
+    if latmin is not None:
+        gw[~(lats > latmin)] = 0.
+
+    ### Only keep points with weight
+    points = np.where(gw > 0.)[0]
+    x = np.reshape(varx,(-1,lats.size))[:,points]
+    y = np.reshape(vary,(-1,lats.size))[:,points]
+    valid = np.isfinite(x) & np.isfinite(y)
+
+    return x,y,valid,gw[points]
+
+def calc_spatialCorrSeries(varx,vary,lats,lons,weight='yes',latmin=None):
+    """
+    Calculates spatial correlations (pearson r) of every time step of two
+    stacked fields in one pass, missing values (NaN) are skipped
+
+    Parameters
+    ----------
+    varx : nd array [...,lat,lon], e.g. [time,lat,lon]
+    vary : nd array [...,lat,lon]
+    lats : 1d array of latitude (or 2d array [lat,lon])
+    lons : 1d array of longitude
+    weight : string (yes for cos(lat) weights or no)
+    latmin : only use latitudes north of latmin (None for all)
+
+    Returns
+    -------
+    corrcoef : (n-2)d array of correlation coefficients, e.g. [time]
+
+    Usage
+    -----
+    corrcoef = calc_spatialCorrSeries(varx,vary,lats,lons,weight,latmin)
+    """
+
+    print('\n>>> Using calc_spatialCorrSeries function!')
+    ### Import modules
+    import numpy as np
+
+    x,y,valid,gw = _spatialPairs(varx,vary,lats,weight,latmin)
+    shape = np.shape(varx)[:-2]
+
+    ### Weighted means over the valid points of each time step
+    w = np.where(valid,gw,0.)
+    sumw = np.sum(w,axis=1)
+    with np.errstate(invalid='ignore',divide='ignore'):
+        xmean = np.sum(np.where(valid,x,0.)*w,axis=1)/sumw
+        ymean = np.sum(np.where(valid,y,0.)*w,axis=1)/sumw
+
+        ### Weighted (co)variances of the anomalies
+        xanom = np.where(valid,x - xmean[:,np.newaxis],0.)
+        yanom = np.where(valid,y - ymean[:,np.newaxis],0.)
+        covxy = np.sum(w*xanom*yanom,axis=1)
+        covxx = np.sum(w*xanom**2,axis=1)
+        covyy = np.sum(w*yanom**2,axis=1)
+        corrcoef = np.reshape(covxy/np.sqrt(covxx*covyy),shape)
+
+    print('Completed: Computed %s correlations (weight = %s)!' \
+          % (corrcoef.size,weight))
+
+    print('*Completed: Finished calc_spatialCorrSeries function!')
+    return corrcoef
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def calc_RMSESeries(varx,vary,lats,lons,weight='yes',latmin=None):
+    """
+    Calculates root mean square errors of every time step of two stacked
+    fields in one pass, missing values (NaN) are skipped
+
+    Parameters
+    ----------
+    varx : nd array [...,lat,lon], e.g. [time,lat,lon]
+    vary : nd array [...,lat,lon]
+    lats : 1d array of latitude (or 2d array [lat,lon])
+    lons : 1d array of longitude
+    weight : string (yes for cos(lat) weights or no)
+    latmin : only use latitudes north of latmin (None for all)
+
+    Returns
+    -------
+    rmse : (n-2)d array of root mean square errors, e.g. [time]
+
+    Usage
+    -----
+    rmse = calc_RMSESeries(varx,vary,lats,lons,weight,latmin)
+    """
+
+    print('\n>>> Using calc_RMSESeries function!')
+    ### Import modules
+    import numpy as np
+
+    x,y,valid,gw = _spatialPairs(varx,vary,lats,weight,latmin)
+    shape = np.shape(varx)[:-2]
+
+    ### Weighted mean of the squared errors of each time step
+    w = np.where(valid,gw,0.)
+    sq_err = np.where(valid,x - y,0.)**2
+    with np.errstate(invalid='ignore',divide='ignore'):
+        rmse = np.reshape(np.sqrt(np.sum(sq_err*w,axis=1)/np.sum(w,axis=1)),
+                          shape)
+
+    print('Completed: Computed %s RMSE (weight = %s)!' % (rmse.size,weight))
+
+    print('*Completed: Finished calc_RMSESeries function!')
+    return rmse
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def calc_spatialCorr(varx,vary,lats,lons,weight,latmin=30):
     """
     Calculates spatial correlation from pearson correlation coefficient
-    
+
     Parameters
     ----------
     varx : 2d array
     vary : 2d array
-    lons : 1d array of latitude
+    lats : 1d array of latitude
+    lons : 1d array of longitude
     weight : string (yes or no)
-    
+    latmin : weighted correlation only north of latmin (None for all)
+
     Returns
     -------
-    corrcoef : 1d array of correlation coefficient (pearson r)
-    
+    corrcoef : correlation coefficient (pearson r)
+
     Usage
     -----
-    corrcoef = calc_spatialCorr(varx,vary,lats,lons)
+    corrcoef = calc_spatialCorr(varx,vary,lats,lons,weight,latmin)
     """
-    
+
     print('\n>>> Using calc_spatialCorr function!')
-    ### Import modules
-    import numpy as np
-    
-    if weight == 'yes': # Computed weighted correlation coefficient   
-        ### mask 
-        mask = 'yes'
-        if mask == 'yes':
-            latq = np.where(lats > 30)[0]
-            lats = lats[latq]
-            varx = varx[latq,:]
-            vary = vary[latq,:]
-            print('MASKING LATITUDES!')
-        
-        ### Create 2d meshgrid for weights 
-        lon2,lat2 = np.meshgrid(lons,lats)
-        
-        ### Create 2d array of weights based on latitude
-        gw = np.cos(np.deg2rad(lat2))
-        
-        def m(x, w):
-            """Weighted Mean"""
-    
-            wave = np.sum(x * w) / np.sum(w)
-            print('Completed: Computed weighted average!') 
-            return wave
-        
-        def cov(x, y, w):
-            """Weighted Covariance"""
-            
-            wcov = np.sum(w * (x - m(x, w)) * (y - m(y, w))) / np.sum(w)
-            print('Completed: Computed weighted covariance!')
-            return wcov
-        
-        def corr(x, y, w):
-            """Weighted Correlation"""
-            
-            wcor = cov(x, y, w) / np.sqrt(cov(x, x, w) * cov(y, y, w))
-            print('Completed: Computed weighted correlation!')
-            return wcor
-        
-        corrcoef = corr(varx,vary,gw)
-        
-    elif weight == 'no':   
-        ### Correlation coefficient from numpy function (not weighted)
-        corrcoef= np.corrcoef(varx.ravel(),vary.ravel())[0][1]
-        print('Completed: Computed NON-weighted correlation!')
-        
-    else:
-        ValueError('Wrong weighted arguement in function!')
-    
+
+    ### Latitudes are only masked for the weighted correlation
+    if weight != 'yes':
+        latmin = None
+    corrcoef = calc_spatialCorrSeries(varx,vary,lats,lons,weight,latmin)[()]
+
     print('*Completed: Finished calc_SpatialCorr function!')
     return corrcoef
 
@@ -403,58 +728,34 @@ def calc_spatialCorr(varx,vary,lats,lons,weight):
 ###############################################################################
 ###############################################################################
 
-def calc_RMSE(varx,vary,lats,lons,weight):
-        """
-        Calculates root mean square weighted average
-        
-        Parameters
-        ----------
-        varx : 2d array
-        vary : 2d array
-        lons : 1d array of latitude
-        weight : string (yes or no)
-        
-        Returns
-        -------
-        rmse : 1d array
-        
-        Usage
-        -----
-        rmse = calc_RMSE(varx,vary,lats,lons)
-        """
-        
-        print('\n>>> Using calc_RMSE function!')
-        ### Import modules
-        import numpy as np
-        from sklearn.metrics import mean_squared_error
-        
-        if weight == 'yes': # Computed weighted correlation coefficient   
-            ### mask
-            mask = 'yes'
-            if mask == 'yes':
-                latq = np.where(lats > 30)[0]
-                lats = lats[latq]
-                varx = varx[latq,:]
-                vary = vary[latq,:]
-                print('MASKING LATITUDES!')
-            
-            ### Create 2d meshgrid for weights 
-            lon2,lat2 = np.meshgrid(lons,lats)
-            
-            ### Create 2d array of weights based on latitude
-            gw = np.cos(np.deg2rad(lat2))
-            
-            ### Calculate rmse 
-            sq_err = (varx - vary)**2
-            rmse = np.sqrt((np.sum(sq_err*gw))/np.sum(gw))
-     
-        elif weight == 'no':   
-            ### Root mean square error from sklearn (not weighted)
-            rmse = np.sqrt(mean_squared_error(varx.ravel(),vary.ravel()))
-            print('Completed: Computed NON-weighted correlation!')
-            
-        else:
-            ValueError('Wrong weighted arguement in function!')
-        
-        print('*Completed: Finished calc_RMSE function!')
-        return rmse
\ No newline at end of file
+def calc_RMSE(varx,vary,lats,lons,weight,latmin=30):
+    """
+    Calculates root mean square weighted average
+
+    Parameters
+    ----------
+    varx : 2d array
+    vary : 2d array
+    lats : 1d array of latitude
+    lons : 1d array of longitude
+    weight : string (yes or no)
+    latmin : weighted rmse only north of latmin (None for all)
+
+    Returns
+    -------
+    rmse : root mean square error
+
+    Usage
+    -----
+    rmse = calc_RMSE(varx,vary,lats,lons,weight,latmin)
+    """
+
+    print('\n>>> Using calc_RMSE function!')
+
+    ### Latitudes are only masked for the weighted rmse
+    if weight != 'yes':
+        latmin = None
+    rmse = calc_RMSESeries(varx,vary,lats,lons,weight,latmin)[()]
+
+    print('*Completed: Finished calc_RMSE function!')
+    return rmse
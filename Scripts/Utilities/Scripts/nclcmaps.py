@@ -0,0 +1,166 @@
+"""
+Functions return NCL colormaps for matplotlib. The color tables are stored
+in nclcmaps.npz next to this module as one float32 array of RGB rows
+(already scaled to 0-1 per colormap), an offset index and the colormap
+names. Nothing is read until the first colormap is requested, and each
+ListedColormap is built only once per process.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    Colormaps were collected by Sam Hawkins at
+    http://computing.io/wp/2016/01/ncl-colormaps-in-python/ and
+    https://github.com/samwisehawkins/nclcmaps
+
+Usage
+-----
+    [1] names()
+    [2] colorTable(name)
+    [3] cmap(name)
+    [4] saveColormaps(colors,filename)
+"""
+
+### Binary color tables next to this module
+FILENAME = 'nclcmaps.npz'
+
+### Loaded tables and built colormaps
+_tables = {}
+_cmaps = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def _loadTables():
+    """
+    Reads the color tables and index on first use
+    """
+
+    if not _tables:
+        ### Import modules
+        import numpy as np
+        import os
+
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                FILENAME)
+        with np.load(filename) as data:
+            _tables['colors'] = data['colors']
+            _tables['offsets'] = data['offsets']
+            _tables['index'] = {str(name) : i for i,name
+                                in enumerate(data['names'])}
+
+    return _tables
+
+def names():
+    """
+    Function returns the names of the available colormaps
+
+    Returns
+    -------
+    cmapnames : list of strings
+        colormap names in file order
+
+    Usage
+    -----
+    cmapnames = names()
+    """
+
+    return list(_loadTables()['index'])
+
+def colorTable(name):
+    """
+    Function returns the RGB rows of a colormap scaled to 0-1
+
+    Parameters
+    ----------
+    name : string
+        colormap name, e.g. 'MPL_gnuplot'
+
+    Returns
+    -------
+    table : 2d array [colors,rgb]
+        float32 view of the stored table (do not modify)
+
+    Usage
+    -----
+    table = colorTable(name)
+    """
+
+    tables = _loadTables()
+    if name not in tables['index']:
+        raise ValueError('Wrong colormap name - (%s)!' % name)
+
+    i = tables['index'][name]
+    return tables['colors'][tables['offsets'][i]:tables['offsets'][i+1]]
+
+def cmap(name):
+    """
+    Function returns an NCL colormap
+
+    Parameters
+    ----------
+    name : string
+        colormap name, e.g. 'MPL_gnuplot'
+
+    Returns
+    -------
+    cmap : ListedColormap
+        shared colormap (use cmap.copy() before changing it)
+
+    Usage
+    -----
+    cmap = cmap(name)
+    """
+
+    if name not in _cmaps:
+        ### Import modules
+        from matplotlib.colors import ListedColormap
+
+        _cmaps[name] = ListedColormap(colorTable(name),name=name)
+
+    return _cmaps[name]
+
+def saveColormaps(colors,filename=None):
+    """
+    Function writes color tables to the binary file read by cmap, each
+    table is divided by its maximum (0-255 and 0-1 tables are both fine)
+
+    Parameters
+    ----------
+    colors : dictionary
+        name : list of [r,g,b] rows
+    filename : string
+        output .npz file (default nclcmaps.npz next to this module)
+
+    Usage
+    -----
+    saveColormaps(colors,filename)
+    """
+
+    print('\n>>> Using saveColormaps function!')
+
+    ### Import modules
+    import numpy as np
+    import os
+
+    if filename is None:
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                FILENAME)
+
+    tables = [np.asarray(colors[name],dtype=float) for name in colors]
+    table = np.concatenate([t/np.max(t) for t in tables]).astype(np.float32)
+    offsets = np.cumsum([0] + [len(t) for t in tables]).astype(np.int64)
+
+    ### Atomic write so readers never see a partial file
+    temp = '%s.%s.tmp.npz' % (filename[:-4],os.getpid())
+    np.savez_compressed(temp,colors=table,offsets=offsets,
+                        names=np.array(list(colors)))
+    os.replace(temp,filename)
+
+    ### Drop tables and colormaps of this process
+    _tables.clear()
+    _cmaps.clear()
+
+    print('*Completed: Saved %s colormaps ---> %s' % (len(tables),filename))
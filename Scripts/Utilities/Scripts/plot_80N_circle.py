@@ -10,6 +10,7 @@ from mpl_toolkits.basemap import Basemap
 import numpy as np
 import datetime
 import calendar as cal
+import plot_DarkStyle as DS
 
 ### Directory and time
 directoryfigure = '/home/zlabe/Documents/Projects/Tests/Utilities/Figures/'
@@ -41,19 +42,7 @@ lon2,lat2 = np.meshgrid(lon1,lat1)
 ###############################################################################
 ### Plot figure
 
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
-
-def setcolor(x, color):
-     for m in x:
-         for t in x[m][1]:
-             t.set_color(color)
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = fig.add_subplot(111)
@@ -69,7 +58,7 @@ m.drawparallels(parallels,labels=[False,False,False,False],
                 linewidth=0.2,color='w')
 par=m.drawmeridians(meridians,labels=[True,True,False,False],
                     linewidth=0.2,fontsize=6,color='w')
-setcolor(par,'white')
+DS.setcolor(par,'white')
 
 cs = m.contourf(lon2,lat2,lat2,np.arange(80,100,10),latlon=True,
                 colors='r')
@@ -0,0 +1,299 @@
+"""
+Functions save line animations (e.g., the moving-lines GIFs) frame by frame
+with bounded memory. The static figure (axes, labels, text and background
+lines) is rendered once; every frame only restores that background and
+redraws the moving artists (blitting). Frames are streamed to ffmpeg
+through a pipe, or appended to a GIF file one at a time with Pillow, so
+only a single frame is held in memory instead of the whole animation.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    Frames can be decimated (every n-th frame, the last frame is always
+    kept) with the step argument or the ICEVARFIGS_FRAMESTEP environment
+    variable, e.g. for quick previews.
+
+Usage
+-----
+    [1] saveAnimation(fig,update,frames,filename,artists,fargs,fps,dpi,
+                      step,writer,loop)
+    [2] saveFrames(images,filename,fps,hold,writer,loop)
+"""
+
+### Writers and default frame rate
+WRITERS = ('auto','ffmpeg','pillow')
+FPS = 25
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+class _FFmpegStream(object):
+    """
+    Pipes raw RGB frames to ffmpeg (GIF with a palette per frame or MP4)
+    """
+
+    def __init__(self,filename,width,height,fps,loop):
+        ### Import modules
+        import subprocess
+
+        command = ['ffmpeg','-y','-loglevel','error','-f','rawvideo',
+                   '-pix_fmt','rgb24','-s','%sx%s' % (width,height),
+                   '-framerate',str(fps),'-i','-']
+        if filename.lower().endswith('.gif'):
+            command += ['-vf','split[a][b];[a]palettegen=stats_mode=single'
+                        '[p];[b][p]paletteuse=new=1','-loop',str(loop)]
+        else:
+            command += ['-vf','pad=ceil(iw/2)*2:ceil(ih/2)*2',
+                        '-vcodec','libx264','-pix_fmt','yuv420p']
+        command.append(filename)
+        self.process = subprocess.Popen(command,stdin=subprocess.PIPE)
+
+    def write(self,rgb):
+        self.process.stdin.write(rgb.tobytes())
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise IOError('ffmpeg failed with exit code %s!' \
+                          % self.process.returncode)
+
+class _GifStream(object):
+    """
+    Appends frames to a GIF file one at a time. Each frame is quantized and
+    LZW-encoded by Pillow as a single-image GIF and copied into the
+    animation with its own color table.
+    """
+
+    def __init__(self,filename,width,height,fps,loop):
+        ### Import modules
+        import struct
+
+        self.file = open(filename,'wb')
+        self.delay = int(round(100./fps))
+
+        ### Header, screen without global color table, NETSCAPE loop
+        self.file.write(b'GIF89a' + struct.pack('<HHBBB',width,height,0,0,0))
+        self.file.write(b'\x21\xff\x0bNETSCAPE2.0\x03\x01' + \
+                        struct.pack('<H',loop) + b'\x00')
+
+    def write(self,rgb):
+        ### Import modules
+        import io
+        import struct
+        from PIL import Image
+
+        ### Single-image GIF of the frame (method 2 = fast octree)
+        image = Image.fromarray(rgb).quantize(colors=256,method=2)
+        buffer = io.BytesIO()
+        image.save(buffer,format='GIF')
+        data = buffer.getvalue()
+
+        ### Global color table of the single image
+        flags = data[10]
+        position = 13
+        table = b''
+        if flags & 0x80:
+            size = 3*2**((flags & 0x07) + 1)
+            table = data[position:position+size]
+            position += size
+
+        ### Skip extension blocks
+        while data[position] == 0x21:
+            position += 2
+            while data[position]:
+                position += data[position] + 1
+            position += 1
+
+        ### Image descriptor, use the global table as local table
+        descriptor = bytearray(data[position:position+10])
+        position += 10
+        if not descriptor[9] & 0x80:
+            descriptor[9] |= 0x80 | (flags & 0x07)
+        else:
+            table = b''
+
+        ### Graphic control extension (delay, keep previous frame)
+        self.file.write(b'\x21\xf9\x04\x04' + struct.pack('<H',self.delay) + \
+                        b'\x00\x00')
+        self.file.write(bytes(descriptor) + table + data[position:-1])
+
+    def close(self):
+        self.file.write(b'\x3b')
+        self.file.close()
+
+def _openStream(filename,width,height,fps,loop,writer):
+    """
+    Returns the frame writer for a file name and writer choice
+    """
+
+    ### Import modules
+    import shutil
+
+    if writer not in WRITERS:
+        raise ValueError('Wrong writer - (%s)!' % ', '.join(WRITERS))
+    if writer == 'auto':
+        writer = 'ffmpeg' if shutil.which('ffmpeg') else 'pillow'
+
+    if writer == 'ffmpeg':
+        return _FFmpegStream(filename,width,height,fps,loop)
+    elif filename.lower().endswith('.gif'):
+        return _GifStream(filename,width,height,fps,loop)
+    else:
+        raise ValueError('Pillow only writes GIF, use ffmpeg for %s!' \
+                         % filename)
+
+def saveAnimation(fig,update,frames,filename,artists,fargs=(),fps=FPS,
+                  dpi=None,step=None,writer='auto',loop=0):
+    """
+    Function renders an animation with blitting and streams the frames to
+    a GIF or MP4 file
+
+    Parameters
+    ----------
+    fig : Figure
+        figure with the static content and the moving artists
+    update : function
+        update(num,*fargs) changes the moving artists for frame num (same
+        as for FuncAnimation)
+    frames : integer
+        number of frames
+    filename : string
+        output file (.gif or .mp4)
+    artists : list
+        artists changed by update, drawn on top of the static background
+    fargs : list
+        extra arguments of update
+    fps : float
+        frames per second
+    dpi : float
+        resolution (default savefig.dpi)
+    step : integer
+        keep every step-th frame, None to use ICEVARFIGS_FRAMESTEP (1)
+    writer : string
+        auto (ffmpeg if installed, otherwise pillow), ffmpeg or pillow
+    loop : integer
+        number of GIF loops, 0 for forever
+
+    Returns
+    -------
+    nframes : integer
+        number of frames written
+
+    Usage
+    -----
+    nframes = saveAnimation(fig,update,frames,filename,artists,fargs,fps,
+                            dpi,step,writer,loop)
+    """
+
+    print('\n>>> Using saveAnimation function!')
+
+    ### Import modules
+    import matplotlib
+    import numpy as np
+    import os
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if step is None:
+        step = int(os.environ.get('ICEVARFIGS_FRAMESTEP',1))
+    numbers = list(range(0,frames,max(step,1)))
+    if numbers[-1] != frames - 1:
+        numbers.append(frames - 1)
+
+    ### Render at the output resolution with the savefig background
+    if dpi is None:
+        dpi = matplotlib.rcParams['savefig.dpi']
+    if dpi == 'figure':
+        dpi = fig.dpi
+    olddpi,oldcolor = fig.dpi,fig.get_facecolor()
+    facecolor = matplotlib.rcParams['savefig.facecolor']
+    fig.set_dpi(dpi)
+    if facecolor != 'auto':
+        fig.set_facecolor(facecolor)
+
+    canvas = FigureCanvasAgg(fig)
+    for artist in artists:
+        artist.set_animated(True)
+
+    stream = None
+    try:
+        ### Static background once
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+        width,height = canvas.get_width_height()
+        stream = _openStream(filename,width,height,fps,loop,writer)
+
+        ### Blit the moving artists for each frame
+        for num in numbers:
+            update(num,*fargs)
+            canvas.restore_region(background)
+            for artist in artists:
+                fig.draw_artist(artist)
+            rgb = np.asarray(canvas.buffer_rgba())[:,:,:3]
+            stream.write(np.ascontiguousarray(rgb))
+    finally:
+        if stream is not None:
+            stream.close()
+        for artist in artists:
+            artist.set_animated(False)
+        fig.set_dpi(olddpi)
+        fig.set_facecolor(oldcolor)
+
+    print('*Completed: Saved %s frames ---> %s' % (len(numbers),filename))
+    return len(numbers)
+
+def saveFrames(images,filename,fps=FPS,hold=0,writer='auto',loop=0):
+    """
+    Function streams a sequence of image files (e.g., per-frame PNGs) into
+    a GIF or MP4 file, reading one image at a time
+
+    Parameters
+    ----------
+    images : list of strings
+        image files in frame order (all the same size)
+    filename : string
+        output file (.gif or .mp4)
+    fps : float
+        frames per second
+    hold : integer
+        extra copies of the last frame (pause at the end)
+    writer : string
+        auto (ffmpeg if installed, otherwise pillow), ffmpeg or pillow
+    loop : integer
+        number of GIF loops, 0 for forever
+
+    Returns
+    -------
+    nframes : integer
+        number of frames written
+
+    Usage
+    -----
+    nframes = saveFrames(images,filename,fps,hold,writer,loop)
+    """
+
+    print('\n>>> Using saveFrames function!')
+
+    ### Import modules
+    import numpy as np
+    from PIL import Image
+
+    images = list(images) + list(images[-1:])*hold
+
+    stream = None
+    try:
+        for image in images:
+            with Image.open(image) as frame:
+                rgb = np.asarray(frame.convert('RGB'))
+            if stream is None:
+                height,width = rgb.shape[:2]
+                stream = _openStream(filename,width,height,fps,loop,writer)
+            stream.write(np.ascontiguousarray(rgb))
+    finally:
+        if stream is not None:
+            stream.close()
+
+    print('*Completed: Saved %s frames ---> %s' % (len(images),filename))
+    return len(images)
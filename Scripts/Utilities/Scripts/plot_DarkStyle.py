@@ -0,0 +1,188 @@
+"""
+Functions apply the IceVarFigs dark theme (black background with white,
+darkgrey or dimgrey axes) and decorate axes. Each color combination is
+built once into an rcParams dictionary and applied with a single update
+(setDarkStyle) or temporarily with an rc_context (darkStyle), so long-lived
+workers do not repeat the individual rc calls for every figure. Nothing is
+imported until a function is used.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    Text rendering (latex or fast) is set by plot_RenderMode.py.
+
+Usage
+-----
+    [1] darkParams(color,edgecolor,labelcolor)
+    [2] setDarkStyle(color,edgecolor,labelcolor,mode)
+    [3] darkStyle(color,edgecolor,labelcolor,mode)
+    [4] adjust_spines(ax,spines,outward)
+    [5] setcolor(x,color)
+"""
+
+### Built rcParams dictionaries, (color,edgecolor,labelcolor) : rcParams
+_params = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def darkParams(color='white',edgecolor=None,labelcolor=None):
+    """
+    Function returns the rcParams of the dark theme
+
+    Parameters
+    ----------
+    color : string
+        color of tick labels, also the default for edges and axis labels
+        (None to only set the black background)
+    edgecolor : string
+        color of the axes frame (default color)
+    labelcolor : string
+        color of the axis labels (default color)
+
+    Returns
+    -------
+    params : dictionary
+        rcParams of the theme (do not modify)
+
+    Usage
+    -----
+    params = darkParams(color,edgecolor,labelcolor)
+    """
+
+    key = (color,edgecolor,labelcolor)
+    if key not in _params:
+        params = {'axes.facecolor' : 'black',
+                  'savefig.facecolor' : 'black'}
+        if color is not None:
+            params.update({'axes.edgecolor' : edgecolor or color,
+                           'axes.labelcolor' : labelcolor or color,
+                           'xtick.color' : color,
+                           'ytick.color' : color})
+        _params[key] = params
+
+    return _params[key]
+
+def setDarkStyle(color='white',edgecolor=None,labelcolor=None,mode=None):
+    """
+    Function applies the dark theme and the text rendering mode to the
+    current process, call once before the first figure
+
+    Parameters
+    ----------
+    color : string
+        color of tick labels, also the default for edges and axis labels
+    edgecolor : string
+        color of the axes frame (default color)
+    labelcolor : string
+        color of the axis labels (default color)
+    mode : string
+        latex or fast, None to use ICEVARFIGS_RENDER
+
+    Usage
+    -----
+    setDarkStyle(color,edgecolor,labelcolor,mode)
+    """
+
+    ### Import modules
+    import matplotlib
+    import plot_RenderMode as RM
+
+    RM.setRenderMode(mode)
+    matplotlib.rcParams.update(darkParams(color,edgecolor,labelcolor))
+
+def darkStyle(color='white',edgecolor=None,labelcolor=None,mode=None):
+    """
+    Function returns an rc_context with the dark theme, the previous
+    rcParams are restored when the block ends
+
+    Parameters
+    ----------
+    color : string
+        color of tick labels, also the default for edges and axis labels
+    edgecolor : string
+        color of the axes frame (default color)
+    labelcolor : string
+        color of the axis labels (default color)
+    mode : string
+        latex or fast, None to use ICEVARFIGS_RENDER
+
+    Returns
+    -------
+    context : context manager
+        use as ``with darkStyle(...):``
+
+    Usage
+    -----
+    with darkStyle(color,edgecolor,labelcolor,mode):
+        fig = plt.figure()
+    """
+
+    ### Import modules
+    import contextlib
+    import matplotlib
+
+    @contextlib.contextmanager
+    def context():
+        with matplotlib.rc_context():
+            setDarkStyle(color,edgecolor,labelcolor,mode)
+            yield
+
+    return context()
+
+def adjust_spines(ax,spines,outward=5):
+    """
+    Function keeps the listed spines (moved outward) and hides the others
+    with their ticks
+
+    Parameters
+    ----------
+    ax : Axes
+        axes to decorate
+    spines : list of strings
+        spines to keep, e.g. ['left','bottom']
+    outward : float
+        distance of the kept spines from the axes (points)
+
+    Usage
+    -----
+    adjust_spines(ax,spines,outward)
+    """
+
+    for loc,spine in ax.spines.items():
+        if loc in spines:
+            spine.set_position(('outward',outward))
+        else:
+            spine.set_color('none')
+    if 'left' in spines:
+        ax.yaxis.set_ticks_position('left')
+    else:
+        ax.yaxis.set_ticks([])
+
+    if 'bottom' in spines:
+        ax.xaxis.set_ticks_position('bottom')
+    else:
+        ax.xaxis.set_ticks([])
+
+def setcolor(x,color):
+    """
+    Function sets the label color of Basemap parallels or meridians
+
+    Parameters
+    ----------
+    x : dictionary
+        output of m.drawparallels or m.drawmeridians
+    color : string
+        color of the labels
+
+    Usage
+    -----
+    setcolor(x,color)
+    """
+
+    for m in x:
+        for t in x[m][1]:
+            t.set_color(color)
@@ -0,0 +1,177 @@
+"""
+Functions render per-frame PNG sequences (e.g., monthly SST maps for a GIF)
+in a process pool. Every worker builds its figure, map projection and
+static artists once and then only updates the data artist of each frame it
+is given. Frame files are named with a zero padding wide enough for the
+whole sequence, and can be assembled into a GIF or MP4 afterwards.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    Data for the frames is passed once per worker through initargs (shared
+    copy-on-write with fork), tasks only carry the frame number. With the
+    spawn start method the figure script needs an if __name__ == '__main__'
+    guard.
+
+Usage
+-----
+    [1] frameName(prefix,frame,nframes,ext)
+    [2] renderFrames(init,draw,nframes,prefix,initargs,nprocs,dpi,movie,
+                     fps,hold)
+"""
+
+### Worker figure and state (one per process)
+_worker = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def frameName(prefix,frame,nframes,ext='png'):
+    """
+    Function returns the file name of a frame, zero-padded to at least three
+    digits and to the number of digits of the last frame
+
+    Parameters
+    ----------
+    prefix : string
+        directory and start of the file name, e.g. './Figures/sstq'
+    frame : integer
+        frame number (from 0)
+    nframes : integer
+        number of frames in the sequence
+    ext : string
+        file extension
+
+    Returns
+    -------
+    filename : string
+        e.g. './Figures/sstq_007.png'
+
+    Usage
+    -----
+    filename = frameName(prefix,frame,nframes,ext)
+    """
+
+    width = max(3,len(str(max(nframes-1,0))))
+    return '%s_%0*d.%s' % (prefix,width,frame,ext)
+
+def _initWorker(init,draw,initargs,prefix,nframes,dpi):
+    """
+    Builds the figure and static artists once per worker
+    """
+
+    ### Import modules
+    import matplotlib
+    matplotlib.use('Agg')
+
+    fig,state = init(*initargs)
+    _worker.clear()
+    _worker.update(fig=fig,state=state,draw=draw,prefix=prefix,
+                   nframes=nframes,dpi=dpi)
+
+def _renderFrame(frame):
+    """
+    Updates the data artist and saves one frame, returns (frame,filename,
+    error)
+    """
+
+    wk = _worker
+    filename = frameName(wk['prefix'],frame,wk['nframes'])
+    try:
+        wk['draw'](wk['state'],frame)
+        wk['fig'].savefig(filename,dpi=wk['dpi'])
+    except Exception as e:
+        return frame,None,repr(e)
+
+    return frame,filename,None
+
+def renderFrames(init,draw,nframes,prefix,initargs=(),nprocs=None,dpi=None,
+                 movie=None,fps=10,hold=0):
+    """
+    Function renders a sequence of frames in parallel
+
+    Parameters
+    ----------
+    init : function
+        fig,state = init(*initargs) builds the figure, projection and static
+        artists (module-level function)
+    draw : function
+        draw(state,frame) replaces the data artist for frame number frame
+        (module-level function)
+    nframes : integer
+        number of frames
+    prefix : string
+        directory and start of the frame file names
+    initargs : tuple
+        data passed to init once per worker
+    nprocs : integer
+        number of worker processes (default: number of cpus), 1 renders in
+        this process
+    dpi : float
+        resolution of the frames (default savefig.dpi)
+    movie : string or None
+        GIF or MP4 file assembled from the frames
+    fps : float
+        frames per second of the movie
+    hold : integer
+        extra copies of the last frame in the movie
+
+    Returns
+    -------
+    results : list of tuples
+        (frame,filename,error) for each frame, error is None on success
+
+    Usage
+    -----
+    results = renderFrames(init,draw,nframes,prefix,initargs,nprocs,dpi,
+                           movie,fps,hold)
+    """
+
+    print('\n>>> Using renderFrames function!')
+
+    ### Import modules
+    from concurrent.futures import ProcessPoolExecutor
+    import os
+
+    if nprocs is None:
+        nprocs = os.cpu_count() or 1
+    nprocs = max(1,min(nprocs,nframes))
+    initial = (init,draw,initargs,prefix,nframes,dpi)
+
+    ### Contiguous chunks keep each worker on its own frames
+    chunksize = max(1,nframes // (4*nprocs))
+
+    results = []
+    if nprocs == 1:
+        _initWorker(*initial)
+        frames = map(_renderFrame,range(nframes))
+    else:
+        pool = ProcessPoolExecutor(max_workers=nprocs,
+                                   initializer=_initWorker,initargs=initial)
+        frames = pool.map(_renderFrame,range(nframes),chunksize=chunksize)
+
+    try:
+        for frame,filename,error in frames:
+            if error is None:
+                print('Completed: Frame plotted ---> %s' % filename)
+            else:
+                print('Could not plot frame %s (%s)' % (frame,error))
+            results.append((frame,filename,error))
+    finally:
+        if nprocs > 1:
+            pool.shutdown()
+
+    print('*Completed: Rendered %s frames!' \
+            % sum(error is None for _,_,error in results))
+
+    ### Assemble movie from the frames in order
+    if movie is not None:
+        import plot_AnimationWriter as AW
+
+        images = [filename for _,filename,error in results if error is None]
+        AW.saveFrames(images,movie,fps,hold)
+
+    return results
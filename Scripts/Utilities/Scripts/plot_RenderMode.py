@@ -0,0 +1,330 @@
+"""
+Functions select how figure text is rendered. The default 'latex' mode keeps
+the original look (usetex with the Avant Garde font) and needs a full TeX
+installation with dvipng. The 'fast' mode skips LaTeX entirely: it forces
+the Agg backend, renders labels with matplotlib's mathtext and the DejaVu
+Sans font bundled with matplotlib (bold, to match the dark style), and
+translates the LaTeX markup used in the labels (e.g. \\textbf{...}, \\&,
+--) on the fly, so figure scripts do not need two versions of every label.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+    The mode is set with the ICEVARFIGS_RENDER environment variable (latex
+    or fast) or with run_FigureBatch.py --render. In fast mode \\underline
+    is dropped and all text is bold.
+
+Usage
+-----
+    [1] renderMode(mode)
+    [2] setRenderMode(mode)
+    [3] toMathtext(text)
+    [4] checkLabels(filenames)
+"""
+
+### Rendering modes
+MODES = ('latex','fast')
+DEFAULTMODE = 'latex'
+
+### Font bundled with matplotlib for the fast mode
+FASTFONT = 'DejaVu Sans'
+
+### LaTeX text commands whose braces are dropped in fast mode
+TEXTCOMMANDS = ('\\textbf{','\\textit{','\\textrm{','\\textsf{',
+                '\\underline{','\\emph{')
+
+### Math font commands, bold math is the default in fast mode
+MATHCOMMANDS = ('\\bf{','\\mathbf{')
+
+### TeX text escapes and ligatures outside math (\$ is kept, matplotlib
+### shows it as a dollar sign)
+TEXTESCAPES = {'\\&' : '&','\\%' : '%','\\_' : '_','\\#' : '#',
+               '\\ ' : ' ','\\{' : '{','\\}' : '}'}
+DASHES = (('---','\u2014'),('--','\u2013'))
+
+### Calls whose string arguments are checked by checkLabels
+TEXTCALLS = ('text','annotate','figtext','title','suptitle','xlabel',
+             'ylabel','set_title','set_xlabel','set_ylabel','set_label',
+             'set_text','set_ticklabels','xticks','yticks','legend')
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def renderMode(mode=None):
+    """
+    Function returns the rendering mode
+
+    Parameters
+    ----------
+    mode : string
+        latex or fast, None to use ICEVARFIGS_RENDER (default latex)
+
+    Returns
+    -------
+    mode : string
+        latex or fast
+
+    Usage
+    -----
+    mode = renderMode(mode)
+    """
+
+    ### Import modules
+    import os
+
+    if mode is None:
+        mode = os.environ.get('ICEVARFIGS_RENDER',DEFAULTMODE)
+    mode = mode.strip().lower()
+    if mode not in MODES:
+        raise ValueError('Wrong render mode - (%s)!' % ', '.join(MODES))
+
+    return mode
+
+def toMathtext(text):
+    """
+    Function translates LaTeX text markup to plain mathtext
+
+    Parameters
+    ----------
+    text : string
+        label written for usetex, e.g. r'\\textbf{[$\\bf{^\\circ}$C]}'
+
+    Returns
+    -------
+    text : string
+        label for mathtext, e.g. r'[${^\\circ}$C]'
+
+    Usage
+    -----
+    text = toMathtext(text)
+    """
+
+    if not isinstance(text,str) or ('\\' not in text and '--' not in text):
+        return text
+
+    out = []
+    braces = []
+    math = False
+    i = 0
+    while i < len(text):
+        char = text[i]
+        command = None
+        if char == '\\':
+            commands = MATHCOMMANDS if math else TEXTCOMMANDS
+            command = next((c for c in commands if text.startswith(c,i)),None)
+
+        if command is not None:
+            ### Drop the command and its closing brace, keep the group
+            braces.append(not math)
+            out.append('' if not math else '{')
+            i += len(command)
+            continue
+        elif char == '\\' and not math and text[i:i+2] in TEXTESCAPES:
+            out.append(TEXTESCAPES[text[i:i+2]])
+            i += 2
+            continue
+        elif char == '-' and not math and text.startswith('--',i):
+            dash,symbol = next(d for d in DASHES if text.startswith(d[0],i))
+            out.append(symbol)
+            i += len(dash)
+            continue
+        elif char == '\\':
+            out.append(text[i:i+2])
+            i += 2
+            continue
+        elif char == '$':
+            math = not math
+        elif char == '{':
+            braces.append(False)
+        elif char == '}' and braces:
+            if braces.pop():
+                i += 1
+                continue
+        out.append(char)
+        i += 1
+
+    return ''.join(out)
+
+def _patchText():
+    """
+    Translates LaTeX markup whenever text is set on a matplotlib Text
+    """
+
+    ### Import modules
+    import matplotlib.text
+
+    settext = matplotlib.text.Text.set_text
+    if getattr(settext,'fastmode',False):
+        return
+
+    def set_text(self,s):
+        return settext(self,toMathtext(s))
+
+    set_text.fastmode = True
+    set_text.__doc__ = settext.__doc__
+    matplotlib.text.Text.set_text = set_text
+
+def setRenderMode(mode=None):
+    """
+    Function sets the text rendering of the current process, call in place
+    of plt.rc('text',usetex=True) and the font rc
+
+    Parameters
+    ----------
+    mode : string
+        latex or fast, None to use ICEVARFIGS_RENDER (default latex)
+
+    Returns
+    -------
+    mode : string
+        rendering mode in use
+
+    Usage
+    -----
+    mode = setRenderMode(mode)
+    """
+
+    ### Import modules
+    import matplotlib
+
+    mode = renderMode(mode)
+
+    if mode == 'latex':
+        matplotlib.rc('text',usetex=True)
+        matplotlib.rc('font',**{'family':'sans-serif',
+                                'sans-serif':['Avant Garde']})
+    else:
+        matplotlib.use('Agg')
+        matplotlib.rc('text',usetex=False)
+        matplotlib.rc('font',**{'family':'sans-serif',
+                                'sans-serif':[FASTFONT],
+                                'weight':'bold'})
+        matplotlib.rc('axes',titleweight='bold',labelweight='bold')
+        matplotlib.rc('mathtext',**{'fontset':'custom',
+                                    'default':'rm',
+                                    'rm':FASTFONT + ':bold',
+                                    'bf':FASTFONT + ':bold',
+                                    'it':FASTFONT + ':italic:bold',
+                                    'sf':FASTFONT + ':bold'})
+        _patchText()
+
+    return mode
+
+def _outsideMath(text):
+    """
+    Returns the parts of a label outside $...$ (escaped \\$ excluded)
+    """
+
+    parts = ['']
+    math = False
+    i = 0
+    while i < len(text):
+        if text.startswith('\\$',i):
+            if not math:
+                parts[-1] += '\\$'
+            i += 2
+            continue
+        if text[i] == '$':
+            math = not math
+            if not math:
+                parts.append('')
+        elif not math:
+            parts[-1] += text[i]
+        i += 1
+
+    return [part for part in parts if part]
+
+def _stringValue(node):
+    """
+    Returns the text of a string literal node (ast.Str on Python 3.7,
+    ast.Constant later), None for other nodes
+    """
+
+    ### Import modules
+    import ast
+
+    if isinstance(node,ast.Constant):
+        value = node.value
+    elif type(node).__name__ == 'Str':
+        value = node.s
+    else:
+        return None
+    return value if isinstance(value,str) else None
+
+def checkLabels(filenames):
+    """
+    Function checks that the LaTeX labels of figure scripts translate to
+    plain text in fast mode (no TeX commands, escapes or -- left outside
+    math)
+
+    Parameters
+    ----------
+    filenames : list of strings
+        paths to figure scripts
+
+    Returns
+    -------
+    problems : list of tuples
+        (filename,line,label,translated label) for each label left with
+        TeX markup
+
+    Usage
+    -----
+    problems = checkLabels(filenames)
+    """
+
+    print('\n>>> Using checkLabels function!')
+
+    ### Import modules
+    import ast
+
+    problems = []
+    nlabels = 0
+    for filename in filenames:
+        with open(filename,'r',encoding='utf-8') as f:
+            try:
+                tree = ast.parse(f.read(),filename)
+            except SyntaxError:
+                continue
+
+        ### String literals in the arguments of text calls
+        strings = []
+        for call in ast.walk(tree):
+            if isinstance(call,ast.Call) and \
+                    getattr(call.func,'attr',None) in TEXTCALLS:
+                for arg in call.args + [k.value for k in call.keywords]:
+                    strings += [(node.lineno,_stringValue(node))
+                                for node in ast.walk(arg)
+                                if _stringValue(node) is not None]
+
+        for lineno,text in strings:
+            if '\\' not in text and '--' not in text:
+                continue
+            nlabels += 1
+            label = toMathtext(text)
+            for part in _outsideMath(label):
+                if '--' in part or '\\' in part.replace('\\$',''):
+                    problems.append((filename,lineno,text,label))
+                    break
+
+    print('*Completed: Checked %s labels, %s with TeX markup left!' \
+          % (nlabels,len(problems)))
+    return problems
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+    import glob
+    import sys
+
+    filenames = sys.argv[1:] or sorted(glob.glob('./Scripts/**/*.py',
+                                                 recursive=True))
+    problems = checkLabels(filenames)
+    for filename,line,label,translated in problems:
+        print('%s:%s: %r ---> %r' % (filename,line,label,translated))
+    sys.exit(1 if problems else 0)
@@ -13,6 +13,7 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 from netCDF4 import Dataset
 import cmocean
+import plot_DarkStyle as DS
 
 ### Directory and time
 directorydata = '/surtsey/zlabe/seaice_obs/PIOMAS/' 
@@ -58,19 +59,7 @@ mean = np.nanmean(sicmo[yearq,:,:],axis=0)*100.
 ###############################################################################
 ###############################################################################
 ### Plot Figure
-plt.rc('text',usetex=True)
-plt.rc('font',**{'family':'sans-serif','sans-serif':['Avant Garde']}) 
-plt.rc('savefig',facecolor='black')
-plt.rc('axes',edgecolor='white')
-plt.rc('xtick',color='white')
-plt.rc('ytick',color='white')
-plt.rc('axes',labelcolor='white')
-plt.rc('axes',facecolor='black')
-
-def setcolor(x, color):
-     for m in x:
-         for t in x[m][1]:
-             t.set_color(color)
+DS.setDarkStyle()
 
 fig = plt.figure()
 ax = fig.add_subplot(111)
@@ -85,7 +74,7 @@ m.drawlsmask(land_color='k',ocean_color='k')
 #                linewidth=0.2,color='w')
 #par=m.drawmeridians(meridians,labels=[True,True,False,False],
 #                    linewidth=0.2,fontsize=6,color='w')
-#setcolor(par,'white')
+#DS.setcolor(par,'white')
 
 cs = m.contourf(lon2,lat2,mean,50,latlon=True)
 cs1 = m.contour(lon2,lat2,lat2,np.arange(80,100,10),latlon=True,colors='r',
@@ -0,0 +1,308 @@
+"""
+Script runs a batch of figure scripts in a process pool. Every distinct
+data set used by the batch is downloaded (or cached) exactly once before
+the figures are rendered, so each script reads from the local cache
+instead of fetching its own copy. Run from the repository root.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+Usage
+-----
+    python Scripts/run_FigureBatch.py [-n NPROCS] [-j JOBFILE]
+                                      [--render {latex,fast}] [SCRIPT ...]
+
+    JOBFILE lists one script per line (# for comments). Scripts are run
+    with the matplotlib Agg backend and the current directory unchanged.
+    --render fast skips LaTeX and renders labels with mathtext (see
+    Utilities/Scripts/plot_RenderMode.py).
+"""
+
+### Import modules
+import os
+import sys
+import time
+
+### Directories of shared reader modules
+directoryscripts = os.path.dirname(os.path.abspath(__file__))
+directorydata = './Data/'
+SCRIPTDIRS = [os.path.join(directoryscripts,'SeaIce'),
+              os.path.join(directoryscripts,'Utilities','Scripts')]
+
+### Remote data sets shared by the figure scripts
+### name : (marker found in script source, url)
+NSIDCURL = 'ftp://sidads.colorado.edu/DATASETS/NOAA/G02135/'
+DATASETS = {
+    'NSIDC_N' : ('N_seaice_extent_daily_v3.0.csv',
+                 NSIDCURL + 'north/daily/data/N_seaice_extent_daily_v3.0.csv'),
+    'NSIDC_S' : ('S_seaice_extent_daily_v3.0.csv',
+                 NSIDCURL + 'south/daily/data/S_seaice_extent_daily_v3.0.csv'),
+    }
+
+### Data sets with parsed binary caches
+### name : (reader functions called by the script, warm-up function)
+def _warmPiomasGrid():
+    import read_PIOMAS as RP
+    RP.readPiomasGrid(directorydata)
+    RP.readPiomasArea(directorydata)
+
+def _warmPiomasDaily():
+    import read_PIOMAS as RP
+    RP.readPiomasDaily(directorydata)
+
+def _warmExtentJAXA():
+    import read_Extent_JAXA as JX
+    JX.readExtentJAXA()
+
+def _warmClimatologyNSIDC():
+    import calc_Climatology_NSIDC as CL
+    for hemisphere in ('N','S'):
+        CL.readClimatologyNSIDC(hemisphere,(1981,2010))
+
+def _warmRegionalExtent():
+    import read_RegionalExtent_NSIDC as RE
+    RE.readRegionalExtent(RE.REGIONS)
+
+LOCALDATASETS = {
+    'JAXA' : (('readExtentJAXA',),_warmExtentJAXA),
+    'NSIDC_CLIMO' : (('readClimatologyNSIDC',),_warmClimatologyNSIDC),
+    'PIOMAS_GRID' : (('readPiomas','readPiomasVar','readPiomasGrid',
+                      'readPiomasArea'),_warmPiomasGrid),
+    'PIOMAS_DAILY' : (('readPiomasDaily',),_warmPiomasDaily),
+    'NSIDC_REGIONAL' : (('readRegionalExtent',),_warmRegionalExtent),
+    }
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def findDatasets(scripts):
+    """
+    Function finds the distinct data sets used by a list of scripts
+
+    Parameters
+    ----------
+    scripts : list of strings
+        paths to figure scripts
+
+    Returns
+    -------
+    names : list of strings
+        keys of DATASETS and LOCALDATASETS used by the scripts
+
+    Usage
+    -----
+    names = findDatasets(scripts)
+    """
+
+    ### Import modules
+    import re
+
+    names = set()
+    for script in scripts:
+        with open(script,'r') as f:
+            source = f.read()
+        for name,(marker,_) in DATASETS.items():
+            if marker in source:
+                names.add(name)
+
+        ### Whole function names only (readPiomas is not readPiomasDaily)
+        calls = set(re.findall(r'\b(\w+)\s*\(',source))
+        for name,(functions,_) in LOCALDATASETS.items():
+            if calls.intersection(functions):
+                names.add(name)
+
+    return sorted(names)
+
+def loadDatasets(names,nthreads=4):
+    """
+    Function downloads (or revalidates) each data set once and builds local
+    binary caches before any figure is rendered
+
+    Parameters
+    ----------
+    names : list of strings
+        keys of DATASETS and LOCALDATASETS
+    nthreads : integer
+        number of concurrent downloads
+
+    Returns
+    -------
+    failed : dictionary
+        data set name : error message
+
+    Usage
+    -----
+    failed = loadDatasets(names,nthreads)
+    """
+
+    print('\n>>> Using loadDatasets function!')
+
+    ### Import modules
+    from concurrent.futures import ThreadPoolExecutor
+    import read_RemoteData as RD
+
+    def load(name):
+        if name in DATASETS:
+            RD.fetchFile(DATASETS[name][1])
+        else:
+            LOCALDATASETS[name][1]()
+
+    failed = {}
+    with ThreadPoolExecutor(max_workers=nthreads) as pool:
+        futures = {name : pool.submit(load,name) for name in names}
+        for name,future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                failed[name] = repr(e)
+                print('Could not load %s (%s)' % (name,e))
+
+    print('*Completed: Loaded %s data sets!' % (len(names) - len(failed)))
+    return failed
+
+def readJobFile(jobfile):
+    """
+    Function reads a job file listing one figure script per line
+
+    Parameters
+    ----------
+    jobfile : string
+        path to the job file (# for comments)
+
+    Returns
+    -------
+    scripts : list of strings
+        paths to figure scripts
+
+    Usage
+    -----
+    scripts = readJobFile(jobfile)
+    """
+
+    with open(jobfile,'r') as f:
+        return [line.split('#')[0].strip() for line in f
+                if line.split('#')[0].strip()]
+
+def _initWorker():
+    """
+    Imports matplotlib once per worker with a non-interactive backend
+    """
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot
+    for directory in SCRIPTDIRS:
+        if directory not in sys.path:
+            sys.path.append(directory)
+
+def _runJob(script):
+    """
+    Runs one figure script, returns (script,error,seconds)
+    """
+
+    ### Import modules
+    import runpy
+    import matplotlib
+    import matplotlib.pyplot as plt
+
+    start = time.time()
+    scriptdir = os.path.dirname(os.path.abspath(script))
+    sys.path.insert(0,scriptdir)
+    error = None
+    try:
+        ### Style set by the script ends with the job
+        with matplotlib.rc_context():
+            runpy.run_path(script,run_name='__main__')
+    except BaseException as e:
+        error = repr(e)
+    finally:
+        plt.close('all')
+        sys.path.remove(scriptdir)
+
+    return script,error,time.time() - start
+
+def runBatch(scripts,nprocs=None):
+    """
+    Function loads all data sets of a batch once and renders the figure
+    scripts in a process pool
+
+    Parameters
+    ----------
+    scripts : list of strings
+        paths to figure scripts
+    nprocs : integer
+        number of worker processes (default: number of cpus)
+
+    Returns
+    -------
+    results : list of tuples
+        (script,error,seconds) for each script, error is None on success
+
+    Usage
+    -----
+    results = runBatch(scripts,nprocs)
+    """
+
+    print('\n>>> Using runBatch function!')
+
+    ### Import modules
+    from concurrent.futures import ProcessPoolExecutor
+
+    for directory in SCRIPTDIRS:
+        if directory not in sys.path:
+            sys.path.append(directory)
+
+    ### Load each distinct data set exactly once
+    names = findDatasets(scripts)
+    print('Data sets in batch ---> %s' % ', '.join(names))
+    loadDatasets(names)
+
+    ### Render figures in parallel
+    results = []
+    with ProcessPoolExecutor(max_workers=nprocs,
+                             initializer=_initWorker) as pool:
+        for script,error,seconds in pool.map(_runJob,scripts):
+            status = 'ok' if error is None else 'FAILED %s' % error
+            print('%6.1f s ---> %s [%s]' % (seconds,script,status))
+            results.append((script,error,seconds))
+
+    print('*Completed: Finished runBatch function!')
+    return results
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Render a batch of '
+                                     'IceVarFigs figure scripts')
+    parser.add_argument('scripts',nargs='*',help='figure scripts')
+    parser.add_argument('-j','--jobs',help='file listing one script per line')
+    parser.add_argument('-n','--nprocs',type=int,default=None,
+                        help='number of worker processes')
+    parser.add_argument('--render',choices=['latex','fast'],default=None,
+                        help='text rendering mode (default: '
+                        'ICEVARFIGS_RENDER or latex)')
+    args = parser.parse_args()
+
+    scripts = list(args.scripts)
+    if args.jobs:
+        scripts += readJobFile(args.jobs)
+    if not scripts:
+        parser.error('no figure scripts given')
+
+    ### Workers inherit the rendering mode
+    if args.render is not None:
+        os.environ['ICEVARFIGS_RENDER'] = args.render
+
+    start = time.time()
+    results = runBatch(scripts,args.nprocs)
+    nfailed = sum(error is not None for _,error,_ in results)
+    print('\nRendered %s/%s figures in %.1f s' \
+            % (len(results) - nfailed,len(results),time.time() - start))
+    sys.exit(1 if nfailed else 0)
@@ -0,0 +1,216 @@
+"""
+Script benchmarks the text rendering modes (latex and fast) of figure
+scripts. Each script is run in a fresh Python process per mode and repeat
+with the Agg backend, so the timings include interpreter and matplotlib
+start-up and, for latex, the LaTeX/dvipng subprocesses. Run from the
+repository root after the data sets are cached (e.g. with
+run_FigureBatch.py), otherwise downloads dominate the first repeat.
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 17 October 2026
+
+Usage
+-----
+    python Scripts/run_RenderBenchmark.py [-r REPEATS] [-j JOBFILE]
+                                          [-o CSVFILE] [SCRIPT ...]
+"""
+
+### Import modules
+import os
+import sys
+import time
+
+### Rendering modes to compare
+MODES = ['latex','fast']
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def timeScript(script,mode,repeats=3):
+    """
+    Function times one figure script in one rendering mode
+
+    Parameters
+    ----------
+    script : string
+        path to figure script
+    mode : string
+        latex or fast
+    repeats : integer
+        number of runs, each in a new process
+
+    Returns
+    -------
+    seconds : list of floats
+        wall time of each run
+    error : string
+        last lines of stderr of a failed run, None on success
+
+    Usage
+    -----
+    seconds,error = timeScript(script,mode,repeats)
+    """
+
+    ### Import modules
+    import subprocess
+
+    env = dict(os.environ,ICEVARFIGS_RENDER=mode,MPLBACKEND='Agg')
+
+    seconds = []
+    for i in range(repeats):
+        start = time.time()
+        run = subprocess.run([sys.executable,script],env=env,
+                             stdout=subprocess.DEVNULL,
+                             stderr=subprocess.PIPE,universal_newlines=True)
+        if run.returncode != 0:
+            return seconds,'\n'.join(run.stderr.strip().split('\n')[-3:])
+        seconds.append(time.time() - start)
+
+    return seconds,None
+
+def benchmarkModes(scripts,repeats=3,modes=MODES):
+    """
+    Function compares the median wall time of each script per rendering mode
+
+    Parameters
+    ----------
+    scripts : list of strings
+        paths to figure scripts
+    repeats : integer
+        number of runs per script and mode
+    modes : list of strings
+        rendering modes to compare
+
+    Returns
+    -------
+    results : list of dictionaries
+        script, median seconds per mode and error per mode
+
+    Usage
+    -----
+    results = benchmarkModes(scripts,repeats,modes)
+    """
+
+    print('\n>>> Using benchmarkModes function!')
+
+    ### Import modules
+    import statistics
+
+    results = []
+    for script in scripts:
+        result = {'script' : script}
+        for mode in modes:
+            seconds,error = timeScript(script,mode,repeats)
+            result[mode] = statistics.median(seconds) if seconds and \
+                           error is None else None
+            result[mode + '_error'] = error
+        results.append(result)
+
+        ### Progress line per script
+        times = ['%s %s' % (mode,'FAILED' if result[mode] is None
+                            else '%.2f s' % result[mode]) for mode in modes]
+        print('%s ---> %s' % (script,', '.join(times)))
+
+    print('*Completed: Finished benchmarkModes function!')
+    return results
+
+def printTable(results,modes=MODES):
+    """
+    Function prints the benchmark results with the speed-up of the last
+    mode versus the first
+
+    Parameters
+    ----------
+    results : list of dictionaries
+        output of benchmarkModes
+    modes : list of strings
+        rendering modes compared
+
+    Usage
+    -----
+    printTable(results,modes)
+    """
+
+    width = max([len(os.path.basename(r['script'])) for r in results] + [6])
+    print('\n%s %s %8s' % ('script'.ljust(width),
+                           ' '.join(['%8s' % mode for mode in modes]),
+                           'speedup'))
+    for result in results:
+        times = [result[mode] for mode in modes]
+        columns = ['%8s' % ('failed' if t is None else '%.2f' % t)
+                   for t in times]
+        if None in (times[0],times[-1]):
+            speedup = '-'
+        else:
+            speedup = '%.1fx' % (times[0]/times[-1])
+        print('%s %s %8s' % (os.path.basename(result['script']).ljust(width),
+                             ' '.join(columns),speedup))
+
+    ### Totals over scripts that ran in every mode
+    complete = [r for r in results if all(r[mode] is not None
+                                          for mode in modes)]
+    if complete:
+        totals = [sum(r[mode] for r in complete) for mode in modes]
+        print('%s %s %8s' % ('total'.ljust(width),
+                             ' '.join(['%8.2f' % t for t in totals]),
+                             '%.1fx' % (totals[0]/totals[-1])))
+
+def writeCSV(results,filename,modes=MODES):
+    """
+    Function writes the benchmark results to a csv file
+
+    Parameters
+    ----------
+    results : list of dictionaries
+        output of benchmarkModes
+    filename : string
+        path of the csv file
+    modes : list of strings
+        rendering modes compared
+
+    Usage
+    -----
+    writeCSV(results,filename,modes)
+    """
+
+    ### Import modules
+    import csv
+
+    with open(filename,'w',newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['script'] + ['%s_seconds' % mode for mode in modes])
+        for result in results:
+            writer.writerow([result['script']] + ['' if result[mode] is None
+                                                  else '%.3f' % result[mode]
+                                                  for mode in modes])
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+if __name__ == '__main__':
+    import argparse
+    from run_FigureBatch import readJobFile
+
+    parser = argparse.ArgumentParser(description='Compare latex and fast '
+                                     'rendering of IceVarFigs figure scripts')
+    parser.add_argument('scripts',nargs='*',help='figure scripts')
+    parser.add_argument('-j','--jobs',help='file listing one script per line')
+    parser.add_argument('-r','--repeats',type=int,default=3,
+                        help='runs per script and mode')
+    parser.add_argument('-o','--csv',help='write results to a csv file')
+    args = parser.parse_args()
+
+    scripts = list(args.scripts)
+    if args.jobs:
+        scripts += readJobFile(args.jobs)
+    if not scripts:
+        parser.error('no figure scripts given')
+
+    results = benchmarkModes(scripts,args.repeats)
+    printTable(results)
+    if args.csv:
+        writeCSV(results,args.csv)
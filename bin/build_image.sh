@@ -2,6 +2,7 @@
 set -e
 
 VERSION="${VERSION:-latest}"
+RENDER="${RENDER:-latex}"
 IMAGE=icevarfigs:$VERSION
 
-docker build -t "$IMAGE" .
+docker build --build-arg RENDER="$RENDER" -t "$IMAGE" .